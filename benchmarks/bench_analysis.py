@@ -0,0 +1,94 @@
+"""pytest-benchmark suite for mergechance.analysis, see README.md."""
+from functools import lru_cache
+
+import pytest
+
+from mergechance.analysis import (
+    CLOSED_TS,
+    CREATED_TS,
+    filter_prs,
+    get_median_outsider_time,
+    get_viable_prs,
+    merge_chance,
+    parse_timestamps,
+    to_batch,
+)
+from mergechance.data_export import prep_tsv
+from mergechance.synthetic import generate_prs
+
+SIZES = [1_000, 10_000, 100_000]
+# fixed so results are comparable between runs
+NOW = 1_600_000_000
+
+
+@lru_cache(maxsize=None)
+def _prs(size):
+    """Filtered synthetic PRs with their timestamps already parsed."""
+    return tuple(parse_timestamps(filter_prs(generate_prs(size, seed=size, now=NOW))))
+
+
+@lru_cache(maxsize=None)
+def _viable(size):
+    return tuple(get_viable_prs(list(_prs(size))))
+
+
+@lru_cache(maxsize=None)
+def _batch(size):
+    return to_batch(list(_prs(size)))
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size // 1000}k")
+def size(request):
+    return request.param
+
+
+def bench_filter_prs(benchmark, size):
+    prs = list(generate_prs(size, seed=size, now=NOW))
+    benchmark(filter_prs, prs)
+
+
+def bench_parse_timestamps(benchmark, size):
+    prs = _prs(size)
+
+    def fresh_copies():
+        # parsed timestamps are cached inside the dicts, start from clean ones
+        return ([{**pr, CREATED_TS: None, CLOSED_TS: None} for pr in prs],), {}
+
+    benchmark.pedantic(parse_timestamps, setup=fresh_copies, rounds=5)
+
+
+def bench_get_viable_prs(benchmark, size):
+    benchmark(get_viable_prs, list(_prs(size)))
+
+
+def bench_merge_chance(benchmark, size):
+    benchmark(merge_chance, list(_viable(size)))
+
+
+def bench_get_median_outsider_time(benchmark, size):
+    benchmark(get_median_outsider_time, list(_viable(size)))
+
+
+def bench_prep_tsv(benchmark, size):
+    benchmark(prep_tsv, list(_viable(size)))
+
+
+def bench_to_batch(benchmark, size):
+    benchmark(to_batch, list(_prs(size)))
+
+
+def bench_batch_filter_prs(benchmark, size):
+    batch = _batch(size)
+    benchmark(filter_prs, batch)
+
+
+def bench_batch_get_viable_prs(benchmark, size):
+    benchmark(get_viable_prs, _batch(size))
+
+
+def bench_batch_merge_chance(benchmark, size):
+    benchmark(merge_chance, get_viable_prs(_batch(size)))
+
+
+def bench_batch_get_median_outsider_time(benchmark, size):
+    benchmark(get_median_outsider_time, get_viable_prs(_batch(size)))
@@ -0,0 +1,54 @@
+"""Storage format benchmarks of mergechance.codec against the plain PR
+dicts cached before it, see README.md.
+
+JSON stands in for the plain format, Firestore stores and bills those
+dicts at roughly their JSON size. Sizes are in each benchmark's extra_info
+(shown with --benchmark-json or --benchmark-verbose).
+"""
+from functools import lru_cache
+import json
+
+import pytest
+
+from mergechance import codec
+from mergechance.analysis import filter_prs, parse_timestamps
+from mergechance.synthetic import generate_prs
+
+SIZES = [1_000, 10_000]
+NOW = 1_600_000_000
+FORMATS = {
+    "plain": (lambda rows: json.dumps(rows).encode(), json.loads),
+    "zlib": (lambda rows: codec.encode(rows, compression=codec.ZLIB), codec.decode),
+}
+if codec.zstandard is not None:
+    FORMATS["zstd"] = (lambda rows: codec.encode(rows, compression=codec.ZSTD), codec.decode)
+
+
+@lru_cache(maxsize=None)
+def _prs(size):
+    """Filtered synthetic PRs with their timestamps parsed, as cached by db.cache."""
+    return parse_timestamps(filter_prs(generate_prs(size, seed=size, now=NOW)))
+
+
+@pytest.fixture(params=SIZES, ids=lambda size: f"{size // 1000}k")
+def size(request):
+    return request.param
+
+
+@pytest.fixture(params=list(FORMATS))
+def fmt(request):
+    return request.param
+
+
+def bench_encode(benchmark, size, fmt):
+    encode, _ = FORMATS[fmt]
+    blob = benchmark(encode, _prs(size))
+    benchmark.extra_info["bytes"] = len(blob)
+    benchmark.extra_info["bytes_per_pr"] = round(len(blob) / len(_prs(size)), 1)
+
+
+def bench_decode(benchmark, size, fmt):
+    encode, decode = FORMATS[fmt]
+    blob = encode(_prs(size))
+    benchmark.extra_info["bytes"] = len(blob)
+    benchmark(decode, blob)
@@ -0,0 +1,65 @@
+"""End-to-end fetch benchmarks against mergechance.fake_gql, see README.md."""
+import random
+
+import pytest
+
+from mergechance import fetch, gh_gql
+from mergechance.analysis import SYNC_FIELDS, filter_prs, get_viable_prs
+from mergechance.fake_gql import FakeGitHub, synthetic_repos
+from mergechance.ratelimit import RateLimitScheduler
+
+# a round trip to api.github.com for a page of 100 PRs
+LATENCY = 0.05
+PAGES = 10
+VIABLE_PR_TARGET = 50  # as in main
+NOW = 1_600_000_000
+# share of PRs opened by members in the "insiders" repository, outsider
+# PRs are rare there and the fetch has to go through many pages
+INSIDER_SHARE = 0.9
+
+
+@pytest.fixture(scope="module")
+def client():
+    repos = synthetic_repos(2, prs=5_000, now=NOW)
+    rnd = random.Random(0)
+    for pr in repos["synthetic/repo1"]:
+        if rnd.random() < INSIDER_SHARE:
+            pr["authorAssociation"] = "MEMBER"
+    with FakeGitHub(repos, latency=LATENCY, budget=10**9) as fake:
+        # no pacing, the benchmarks measure fetching and not the rate limit
+        scheduler = RateLimitScheduler(budget=10**9, burst=10**9)
+        client = gh_gql.GQLClient("token", url=fake.url, scheduler=scheduler)
+        yield client
+        client.close()
+
+
+@pytest.fixture(params=["repo0", "repo1"], ids=["typical", "insiders"])
+def repo(request):
+    return request.param
+
+
+def _enough(prs):
+    return len(get_viable_prs(filter_prs(prs))) >= VIABLE_PR_TARGET
+
+
+def _fetch_sequential(client, repo):
+    """The page by page walk of fetch.fetch_all, without the analysis."""
+    rows, cursor = [], None
+    for _ in range(PAGES):
+        page, cursor = gh_gql.get_pr_fields("synthetic", repo, SYNC_FIELDS, cursor=cursor, client=client)
+        rows.extend(page)
+        if _enough(rows):
+            break
+    return rows
+
+
+def bench_fetch_sequential(benchmark, client, repo):
+    benchmark.pedantic(_fetch_sequential, args=(client, repo), rounds=3)
+
+
+def bench_fetch_all(benchmark, client, repo):
+    benchmark.pedantic(fetch.fetch_all, args=("synthetic", repo), kwargs={"client": client}, rounds=3)
+
+
+def bench_fetch_by_state(benchmark, client, repo):
+    benchmark.pedantic(fetch.fetch_by_state, args=("synthetic", repo), kwargs={"client": client}, rounds=3)
@@ -0,0 +1,68 @@
+"""Scaling of implied insider detection, run from the repo root:
+
+    python -m benchmarks.implied_insiders
+
+Compares the previous list.count() based implementation with InsiderIndex,
+both as a one-off computation and fed page by page (100 PRs per page) the
+way main._get_chance does it.
+"""
+import random
+import time
+
+from mergechance.analysis import INSIDER_PR_THRESHOLD, InsiderIndex, get_implied_insiders
+
+SIZES = [100, 1_000, 10_000, 100_000]
+# the quadratic version takes minutes past this point
+LEGACY_CAP = 10_000
+PAGE = 100
+
+
+def _legacy_implied_insiders(prs):
+    logins = [pr['author']['login'] for pr in prs if pr['state'] == 'MERGED']
+    return {login for login in logins if logins.count(login) > INSIDER_PR_THRESHOLD}
+
+
+def _make_prs(n, seed=0):
+    rnd = random.Random(seed)
+    authors = [f"user{i}" for i in range(max(n // 4, 1))]
+    return [
+        {
+            "state": rnd.choice(["MERGED", "MERGED", "CLOSED", "OPEN"]),
+            "author": {"login": rnd.choice(authors)},
+        }
+        for _ in range(n)
+    ]
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    res = fn(*args)
+    return time.perf_counter() - start, res
+
+
+def _paged(prs):
+    index = InsiderIndex()
+    slowest = 0.0
+    for start in range(0, len(prs), PAGE):
+        took, _ = _timed(index.add, prs[start:start + PAGE])
+        slowest = max(slowest, took)
+    return slowest, index.insiders
+
+
+def main():
+    print(f"{'prs':>8} {'legacy s':>10} {'index s':>10} {'slowest page ms':>16}")
+    for size in SIZES:
+        prs = _make_prs(size)
+        legacy = "-"
+        if size <= LEGACY_CAP:
+            took, expected = _timed(_legacy_implied_insiders, prs)
+            legacy = f"{took:.4f}"
+        took, insiders = _timed(get_implied_insiders, prs)
+        slowest, paged_insiders = _paged(prs)
+        if size <= LEGACY_CAP:
+            assert insiders == expected == paged_insiders
+        print(f"{size:>8} {legacy:>10} {took:>10.4f} {slowest * 1000:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
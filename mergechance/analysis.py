@@ -1,37 +1,73 @@
 """Module for calculating stats from data provided by gh_gql.py"""
 from dateutil import parser
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
 import time
 import statistics
-from mergechance.blacklist import blacklist
+from typing import TYPE_CHECKING
+from mergechance.filters import pr_filter
+from mergechance.prfields import is_batch
+from mergechance.quantiles import TDigest
+
+if TYPE_CHECKING:
+    from mergechance.prbatch import PRBatch
 
 
 STALE_THRESHOLD = 90 * 24 * 60 * 60  # 90 days in seconds
 
 ANALYSIS_FIELDS = ["closedAt", "createdAt", "authorAssociation", "state", "permalink", "title"]
+# fetched on top of ANALYSIS_FIELDS to allow delta refreshes of cached repos
+SYNC_FIELDS = ANALYSIS_FIELDS + ["updatedAt"]
+
+# keys under which parsed createdAt/closedAt are kept in PR dicts
+CREATED_TS = "_createdTs"
+CLOSED_TS = "_closedTs"
 
 # PRs a nominal outsider must merge to become an insider
 INSIDER_PR_THRESHOLD = 5
 
+# reported by duration_percentiles
+PERCENTILES = (25, 50, 75, 90, 99)
+
 def median_time_to_merge(prs: list) -> float:
-    closings = [_to_ts(pr["closedAt"]) - _to_ts(pr["createdAt"]) for pr in prs ]
+    closings = [_duration(pr) for pr in prs]
     median_seconds = statistics.median(closings)
     median_days = median_seconds / 60 / 60 / 24
     median_days = round(median_days, 2)
     return median_days
 
 
+def to_batch(rows: list) -> "PRBatch":
+    """Columnar PRBatch out of gh_gql rows."""
+    # imports NumPy, which the PR dict functions do without
+    from mergechance.prbatch import PRBatch
+
+    parse_timestamps(rows)
+    created = [created_ts(pr) for pr in rows]
+    closed = [closed_ts(pr) for pr in rows]
+    return PRBatch.from_rows(rows, created, closed)
+
+
 def filter_prs(prs):
-    """Rules based pr filtering for spam, bots etc."""
-    prs = [pr for pr in prs if not  _is_trivial(pr)]
-    prs = [pr for pr in prs if not _is_blacklisted(pr)]
-    prs = [pr for pr in prs if not _is_closed_by_author(pr)]
-    return prs
+    """Rules based pr filtering for spam, bots etc. (see filters.py)."""
+    return pr_filter(prs)
+
 
+def get_viable_prs(prs, implied_insiders=None):
+    """return only outsider PRs that MERGED, CLOSED or stale.
 
-def get_viable_prs(prs):
-    """return only outsider PRs that MERGED, CLOSED or stale."""
-    outsiders = get_outsiders(prs)
+    implied_insiders - precomputed set of implied insiders (e.g. from
+    an InsiderIndex), computed from prs when not given.
+    """
     now = time.time()
+    if is_batch(prs):
+        from mergechance.prbatch import State
+
+        viable = _outsider_mask(prs, implied_insiders)
+        viable &= (prs.state != State.OPEN) | prs.stale_mask(now, STALE_THRESHOLD)
+        return prs.take(viable)
+    outsiders = get_outsiders(prs, implied_insiders)
     return [pr for pr in outsiders if _is_handled(pr) or _is_stale(pr, now)]
 
 
@@ -41,32 +77,211 @@ def get_implied_insiders(prs: list):
     Returns a list of author logins that successfully merged to
     the repo many times, they will be assumed to be insiders.
     """
-    logins = [pr['author']['login'] for pr in prs if pr['state'] == 'MERGED']
-    return {login for login in logins if logins.count(login) > INSIDER_PR_THRESHOLD }
+    if is_batch(prs):
+        import numpy as np
+
+        insider_ids = np.flatnonzero(prs.merge_counts() > INSIDER_PR_THRESHOLD)
+        return {prs.logins[i] for i in insider_ids}
+    index = InsiderIndex()
+    index.add(prs)
+    return set(index.insiders)
+
+
+class InsiderIndex:
+    """Running count of merged PRs per author login.
+
+    Feed it PRs page by page with add(), each call only costs time
+    proportional to the added page. Authors crossing
+    INSIDER_PR_THRESHOLD are kept in the insiders set.
+    """
+
+    def __init__(self):
+        self.merge_counts = Counter()
+        self.insiders = set()
+
+    def add(self, prs: list) -> set:
+        """Count merged PRs from prs, return logins promoted to insiders by them."""
+        promoted = set()
+        for pr in prs:
+            if pr['state'] != 'MERGED' or not pr['author']:
+                continue
+            login = pr['author']['login']
+            self.merge_counts[login] += 1
+            if self.merge_counts[login] > INSIDER_PR_THRESHOLD and login not in self.insiders:
+                self.insiders.add(login)
+                promoted.add(login)
+        return promoted
+
+
+class IncrementalAnalysis:
+    """Merge chance stats kept up to date one batch of (filtered) PRs at a time.
+
+    Equivalent to running get_viable_prs, merge_chance and
+    get_median_outsider_time on all PRs added so far, but a new batch
+    only costs time for the batch itself plus the earlier PRs of
+    authors it promotes to implied insiders.
+    """
+
+    def __init__(self, now=None):
+        self.now = now if now is not None else time.time()
+        self.insiders = InsiderIndex()
+        # MERGED, CLOSED, OPEN and STALE counts of outsider PRs
+        self.counts = Counter()
+        self._viable = {}
+        self._outsider_prs = defaultdict(list)
+        self._durations = []
+        self._added = 0
+
+    def add(self, prs: list):
+        parse_timestamps(prs)
+        promoted = self.insiders.add(prs)
+        for login in promoted:
+            for key, pr in self._outsider_prs.pop(login, []):
+                self._uncount(key, pr)
+        for pr in prs:
+            key = self._added
+            self._added += 1
+            if not _is_outsider(pr["authorAssociation"]):
+                continue
+            login = pr['author']['login'] if pr['author'] else None
+            if login in self.insiders.insiders:
+                continue
+            if login is not None:
+                self._outsider_prs[login].append((key, pr))
+            self._count(key, pr)
+
+    @property
+    def viable_count(self) -> int:
+        return len(self._viable)
+
+    def viable_prs(self) -> list:
+        """Same PRs as get_viable_prs would return for everything added."""
+        return list(self._viable.values())
+
+    def merge_chance(self) -> tuple:
+        total = self.viable_count
+        if not total:
+            return None
+        chance = self.counts["MERGED"] / total
+        chance *= 100
+        chance = round(chance, 2)
+        return chance, total
+
+    def median_time_to_merge(self) -> float:
+        """Median closing time of closed outsider PRs, None if there are none."""
+        durations = self._durations
+        if not durations:
+            return None
+        mid = len(durations) // 2
+        if len(durations) % 2:
+            median_seconds = durations[mid]
+        else:
+            median_seconds = (durations[mid - 1] + durations[mid]) / 2
+        median_days = median_seconds / 60 / 60 / 24
+        return round(median_days, 2)
+
+    def _classify(self, pr):
+        if _is_stale(pr, self.now):
+            return "STALE"
+        return pr["state"]
+
+    def _count(self, key, pr):
+        kind = self._classify(pr)
+        self.counts[kind] += 1
+        if kind == "OPEN":
+            return
+        self._viable[key] = pr
+        if _is_handled(pr):
+            insort(self._durations, _duration(pr))
+
+    def _uncount(self, key, pr):
+        kind = self._classify(pr)
+        self.counts[kind] -= 1
+        if kind == "OPEN":
+            return
+        del self._viable[key]
+        if _is_handled(pr):
+            duration = _duration(pr)
+            del self._durations[bisect_left(self._durations, duration)]
+
 
 def get_median_outsider_time(outsiders_prs: list) -> float:
     """Return median closing time for closed PRs.
 
     Will return None if there are no closed prs in the input.
     """
+    if is_batch(outsiders_prs):
+        import numpy as np
+        from mergechance.prbatch import State
+
+        handled = outsiders_prs.state != State.OPEN
+        if not handled.any():
+            return None
+        durations = outsiders_prs.closed[handled] - outsiders_prs.created[handled]
+        median_days = float(np.median(durations)) / 60 / 60 / 24
+        return round(median_days, 2)
     closed = [pr for pr in outsiders_prs if pr['state'] in {'MERGED', 'CLOSED'}]
     if not closed:
         return None
     return median_time_to_merge(closed)
 
 
+def duration_sketches(prs, sketches=None) -> dict:
+    """Time-to-merge and time-to-close (seconds) quantile sketches.
+
+    Pass the sketches from previous pages to update them, or merge
+    per-page sketches with TDigest.merge.
+    """
+    if sketches is None:
+        sketches = {"merge": TDigest(), "close": TDigest()}
+    if is_batch(prs):
+        from mergechance.prbatch import State
+
+        for state, kind in [(State.MERGED, "merge"), (State.CLOSED, "close")]:
+            mask = prs.state == state
+            sketches[kind].update((prs.closed[mask] - prs.created[mask]).tolist())
+        return sketches
+    for pr in prs:
+        if pr["state"] == "MERGED":
+            sketches["merge"].add(_duration(pr))
+        elif pr["state"] == "CLOSED":
+            sketches["close"].add(_duration(pr))
+    return sketches
+
+
+def duration_percentiles(sketch: TDigest) -> dict:
+    """PERCENTILES of a duration sketch in days, e.g. {"p50": 2.5}.
+
+    Empty dict if the sketch is empty.
+    """
+    if not len(sketch):
+        return {}
+    return {
+        f"p{p}": round(sketch.quantile(p / 100) / 60 / 60 / 24, 2)
+        for p in PERCENTILES
+    }
+
+
 def merge_chance(outsiders_prs: list) -> tuple:
     """Return a tuple of proportion of successful PRs and the amount of
     prs that were taken into consideration among those from the input.
     Open and not stale PRs are not valid and are ignored."""
-    merged = get_merged(outsiders_prs)
-    open = get_open(outsiders_prs)
-    stale = get_stale(open)
-    ignored = len(open) - len(stale)
+    if is_batch(outsiders_prs):
+        from mergechance.prbatch import State
+
+        merged = int((outsiders_prs.state == State.MERGED).sum())
+        open = int((outsiders_prs.state == State.OPEN).sum())
+        stale = int(outsiders_prs.stale_mask(time.time(), STALE_THRESHOLD).sum())
+    else:
+        open_prs = get_open(outsiders_prs)
+        merged = len(get_merged(outsiders_prs))
+        open = len(open_prs)
+        stale = len(get_stale(open_prs))
+    ignored = open - stale
     total = len(outsiders_prs) - ignored
     if not total:
         return None
-    chance = len(merged) / total
+    chance = merged / total
     chance *= 100
     chance = round(chance, 2)
     return chance, total
@@ -80,8 +295,9 @@ def get_open(prs: list) -> list:
     return [pr for pr in prs if pr["state"] == "OPEN"]
 
 
-def get_outsiders(prs: list) -> list:
-    implied_insiders = get_implied_insiders(prs)
+def get_outsiders(prs: list, implied_insiders=None) -> list:
+    if implied_insiders is None:
+        implied_insiders = get_implied_insiders(prs)
     def _outsider_pr(pr):
         if pr['author'] is None:
             # author's GH user removed?
@@ -96,6 +312,18 @@ def get_stale(prs: list) -> list:
     return [pr for pr in prs if _is_stale(pr, now)]
 
 
+def _outsider_mask(batch: "PRBatch", implied_insiders=None):
+    import numpy as np
+    from mergechance.prbatch import Association
+
+    if implied_insiders is None:
+        insider_ids = np.flatnonzero(batch.merge_counts() > INSIDER_PR_THRESHOLD)
+    else:
+        insider_ids = batch.login_ids(implied_insiders)
+    insider_association = np.isin(batch.association, [Association.OWNER, Association.MEMBER])
+    return ~insider_association & ~np.isin(batch.author, insider_ids)
+
+
 def _is_outsider(author: str):
     return author not in {"OWNER", "MEMBER"}
 
@@ -103,8 +331,7 @@ def _is_outsider(author: str):
 def _is_stale(pr, now):
     if pr["state"] != "OPEN":
         return False
-    ts = pr["createdAt"]
-    ts = _to_ts(ts)
+    ts = created_ts(pr)
     return (now - ts) > STALE_THRESHOLD
 
 
@@ -113,48 +340,55 @@ def _is_handled(pr):
     return pr['state'] in {'MERGED', 'CLOSED'}
 
 
-def _is_blacklisted(pr):
-    if not pr['author']:
-        return False
-    return pr['author']['login'] in blacklist
+def parse_timestamps(prs: list) -> list:
+    """Parse createdAt/closedAt of a batch once, see created_ts and closed_ts."""
+    for pr in prs:
+        created_ts(pr)
+        closed_ts(pr)
+    return prs
 
 
-banned_keywords = ["readme", "update", "typo"]
+def created_ts(pr) -> float:
+    """Epoch seconds of createdAt, parsed on first use and kept in the PR dict."""
+    ts = pr.get(CREATED_TS)
+    if ts is None:
+        ts = pr[CREATED_TS] = _to_ts(pr["createdAt"])
+    return ts
 
-def _is_trivial(pr):
-    """Poor man's spam detection - based on title only for now."""
-    title = pr.get('title', '')
-    title = title.lower()
-    for banned in banned_keywords:
-        if banned in title:
-            return True
-    if title == 'test':
-        return True
-    return False
 
+def closed_ts(pr) -> float:
+    """Epoch seconds of closedAt (None for open PRs), see created_ts."""
+    ts = pr.get(CLOSED_TS)
+    if ts is None and pr.get("closedAt"):
+        ts = pr[CLOSED_TS] = _to_ts(pr["closedAt"])
+    return ts
 
-def _is_closed_by_author(pr):
-    """If the author closed the PR themselves we ignore it."""
-    if not pr['author']:
-        return False
-    if pr['state'] != 'CLOSED':
-        return False
-    timeline = pr.get('timelineItems')
-    if not timeline:
-        return False
-    open_login = pr['author'].get('login')
-    events = timeline.get('edges', [])
-    for event in events:
-        node = event['node']
-        actor = node.get('actor')
-        if not actor:
-            return False
-        closed_login = actor.get('login')
-        if closed_login == open_login:
-            return True
-    return False
 
+def _duration(pr):
+    return closed_ts(pr) - created_ts(pr)
 
 
 def _to_ts(ts_iso):
+    # fast path for GitHub's own format: 2021-01-31T12:00:00Z
+    if (
+        len(ts_iso) == 20
+        and ts_iso[19] == "Z"
+        and ts_iso[10] == "T"
+        and ts_iso[4] == ts_iso[7] == "-"
+        and ts_iso[13] == ts_iso[16] == ":"
+    ):
+        try:
+            # unlike timegm, datetime rejects out of range fields (2021-02-30)
+            # and leaves them to dateutil below
+            return datetime(
+                int(ts_iso[0:4]),
+                int(ts_iso[5:7]),
+                int(ts_iso[8:10]),
+                int(ts_iso[11:13]),
+                int(ts_iso[14:16]),
+                int(ts_iso[17:19]),
+                tzinfo=timezone.utc,
+            ).timestamp()
+        except ValueError:
+            pass
     return parser.parse(ts_iso).timestamp()
@@ -1,2252 +1,97 @@
-blacklist = [
-    "userQED",
-    "GGupzHH",
-    "nodejs-ma",
-    "linxz-coder",
-    "teach-tian",
-    "kevinlens",
-    "Pabitra-26",
-    "mangalan516",
-    "IjtihadIslamEmon",
-    "marcin-majewski-sonarsource",
-    "LongTengDao",
-    "JoinsG",
-    "safanbd",
-    "aly2",
-    "aka434112"
-    "SMAKSS",
-    "imbereket",
-    "takumu1011",
-    "adityanjr",
-    "Aa115511",
-    "farjanaHuq",
-    "samxcode",
-    "HaiTing-Zhu",
-    "gimnakatugampala",
-    "cmc3cn",
-    "kkkisme",
-    "haidongwang-github",
-    "ValueCoders",
-    "happy-dc",
-    "Tyorden",
-    "SP4R0W",
-    "q970923066",
-    "Shivansh2407",
-    "1o1w1",
-    "soumyadip007",
-    "AceTheCreator",
-    "qianbaiduhai",
-    "changwei0857",
-    "CainKane",
-    "Jajabenit250",
-    "gouri1000",
-    "yvettep321",
-    "naveen8801",
-    "HelloAny",
-    "ShaileshDeveloper",
-    "Jia-De",
-    "JeffCorp",
-    "ht1131589588",
-    "Supsource",
-    "coolwebrahul",
-    "aimidy",
-    "ishaanthakur",
-    # bots
-    "vue-bot",
-    "dependabot",
-    # below is taken from spamtoberfest
-    "SudhanshuAGR",
-    "pinkuchoudhury69",
-    "brijal96",
-    "shahbazalam07",
-    "piyushkothari1999",
-    "imnrb",
-    "saksham05mathur",
-    "Someshkale15",
-    "xinghalok",
-    "manpreet147",
-    "sumitsrivastav180",
-    "1234515",
-    "Rachit-hooda-man",
-    "vishal2305bug",
-    "Ajayraj006",
-    "pathak7838",
-    "Kumarjatin-coder",
-    "Narendra-Git-Hub",
-    "Stud-dabral",
-    "Siddhartha05",
-    "rishi123A",
-    "kartik71792",
-    "kapilpatel-2001",
-    "SapraRam",
-    "PRESIDENT-caris",
-    "smokkie087",
-    "Ravikant-unzippedtechnology",
-    "sawanch",
-    "Saayancoder",
-    "shubham5888",
-    "manasvi141220002",
-    "Asher12428",
-    "mohdalikhan",
-    "Paras4902",
-    "shudhii",
-    "Tesla9625",
-    "web-codegrammer",
-    "imprakashsah",
-    "Bhagirath043",
-    "Ankur-S1",
-    "Deannos",
-    "sapro-eng",
-    "skabhi001",
-    "AyushPathak12",
-    "Hatif786",
-    "adityas2124k2",
-    "Henry-786",
-    "abhi6418",
-    "J-Ankit2002",
-    "9759176595",
-    "rajayush9944",
-    "Kishan-Kumar-Kannaujiya",
-    "ManavBargali",
-    "komalsharma121",
-    "AbhiramiTS",
-    "mdkaif25",
-    "shubhamsingh333",
-    "hellosibun",
-    "ankitbharti1998",
-    "subhakantabhau",
-    "shivamsri142",
-    "sameer13899",
-    "BhavyaTheHacker",
-    "nehashewale",
-    "Shashi-design",
-    "anuppal101",
-    "NitinRavat888",
-    "sakrit",
-    "Kamran-360",
-    "satyam-dot",
-    "Suleman3015",
-    "amanpj15",
-    "abhinavjha98",
-    "Akshat-Git-Sharma",
-    "Anuragtawaniya",
-    "nongshaba1337",
-    "XuHewen",
-    "happyxhw",
-    "ascott",
-    "ThomasGrund",
-    'Abhayrai778',
-    'pyup-bot',
-    'AhemadRazaK3',
-    'doberoi10',
-    'lsmatovu',
-    'Lakshay7014',
-    'nikhilkr1402',
-    'arfakl99',
-    'Tyrrrz',
-    'SwagatamNanda',
-    'V-Soni',
-    'hparadiz',
-    'Ankurmarkam',
-    'shubham-01-star',
-    'Rajputusman',
-    'bharat13soni',
-    'przemeklal',
-    'p4checo',
-    'REDSKULL1412',
-    'GAURAVCHETTRI',
-    'DerDomml',
-    'Sunit25',
-    'divyansh123-max',
-    'hackerharsh007',
-    'Thecreativeone2001',
-    'nishkarshsingh-tech',
-    'Devyadav1994',
-    'Rajeshjha586',
-    'BoboTiG',
-    'nils-braun',
-    'DjDeveloperr',
-    'FreddieRidell',
-    'pratyxx525',
-    'abstergo43',
-    'impossibleshado1',
-    'Gurnoor007',
-    '2303-kanha',
-    'ChaitanyaAg',
-    'justinjpacheco',
-    'shoaib5887khan',
-    'farhanmulla713',
-    'ashrafzeya',
-    'muke64',
-    'aditya08maker',
-    'rajbaba1',
-    'priyanshu-top10',
-    'Maharshi369',
-    'Deep-bhingradiya',
-    'shyam7e',
-    'shubhamsuman37',
-    'jastisriradheshyam',
-    'Harshit-10-pal',
-    'shivphp',
-    'RohanSahana',
-    '404notfound-3',
-    'ritikkatiyar',
-    'ashishmohan0522',
-    'Amanisrar',
-    'VijyantVerma',
-    'Chetanchetankoli',
-    'Hultner',
-    'gongeprashant',
-    'psw89',
-    'harshilaneja',
-    'SLOKPATHAK',
-    'st1891',
-    'nandita853',
-    'ms-prob',
-    'Sk1llful',
-    'HarshKq',
-    'rpy9954',
-    'TheGunnerMan',
-    'AhsanKhokhar1',
-    'RajnishJha12',
-    'Adityapandey-7',
-    'vipulkumbhar0',
-    'nikhilkhetwal',
-    'Adityacoder99',
-    'arjun01-debug',
-    'saagargupta',
-    'UtCurseSingh',
-    'Anubhav07-pixel',
-    'Vinay584',
-    'YA7CR7',
-    'anirbanballav',
-    'mrPK',
-    'VibhakarYashasvi',
-    'ANKITMOHAPATRAPROGRAMS',
-    'parmar-hacky',
-    'zhacker1999',
-    'akshatjindal036',
-    'swarakeshrwani',
-    'ygajju52',
-    'Nick-Kr-Believe',
-    'adityashukl1502',
-    'mayank23raj',
-    'shauryamishra',
-    'swagat11',
-    '007swayam',
-    'gardener-robot-ci-1',
-    'ARUNJAYSACHAN',
-    'MdUmar07',
-    'vermavinay8948',
-    'Rimjhim-Dey',
-    'prathamesh-jadhav-21',
-    'brijal96',
-    'siddhantparadox',
-    'Abhiporwal123',
-    'sparshbhardwaj209',
-    'Amit-Salunke-02',
-    'wwepavansharma',
-    'kirtisahu123',
-    'japsimrans13',
-    'wickedeagle',
-    'AnirbanB999',
-    'jayeshmishra',
-    'shahbazalam07',
-    'Samrath07',
-    'pinkuchoudhury69',
-    'moukhikgupta5',
-    'hih547430',
-    'burhankhan23',
-    'Rakesh0222',
-    'Rahatullah19',
-    'sanskar783',
-    'Eshagupta0106',
-    'Arpit-Tailong',
-    'Adityaaashu',
-    'rahul149',
-    'udit0912',
-    'aru5858',
-    'riya6361',
-    'vanshkhemani',
-    'Aditi0205',
-    'riteshbiswas0',
-    '12Ayush12008039',
-    'Henry-786',
-    'ManviMaheshwari',
-    'SATHIYASEELAN2001',
-    'SuchetaPal',
-    'Sahil24822',
-    'sohamgit',
-    'Bhumi5599',
-    'anil-rathod',
-    'binayuchai',
-    'PujaMawandia123',
-    '78601abhiyadav',
-    'PriiTech',
-    'SahilBhagtani',
-    'dhruv1214',
-    'SAURABHYAGYIK',
-    'farhanmansuri25',
-    'Chronoviser',
-    'airtel945',
-    'Swagnikdhar',
-    'tushar-1308',
-    'sameerbasha123',
-    'anshu15183',
-    'Mohit049',
-    'YUVRAJBHATI',
-    'miras143mom',
-    'ProPrakharSoni',
-    'pratikkhatana',
-    'Alan1857',
-    'AyanKrishna',
-    'kartikey2003jain',
-    'sailinkan',
-    'DEVELOPER06810',
-    'Abhijeet9274',
-    'Kannu12',
-    'Shivam-Amin',
-    'suraj-lpu',
-    'Elizah550',
-    'dipsylocus',
-    'jaydev-coding',
-    'IamLucif3r',
-    'DesignrKnight',
-    'PiyumalK',
-    'nandita853',
-    'mohsin529',
-    'ShravanBhat',
-    'doppelganger-test',
-    'smitgh',
-    'parasgarg123',
-    'Amit-Salunke-02',
-    'Chinmay-KB',
-    'sagarr1',
-    'Praveshrana12',
-    'fortrathon',
-    'miqbalrr',
-    'Ankurmarkam',
-    'saloni691',
-    'Bhuvan804',
-    'pra-b-hat-chauhan',
-    'snakesause',
-    'Shubhani25',
-    'arshad699',
-    'fahad-25082001',
-    'Chaitanya31612',
-    'tiwariraju',
-    'ritik0021',
-    'aakash-dhingra',
-    'Raunak017',
-    'ashrafzeya',
-    'priyanshu-top10',
-    'NikhilKumar-coder',
-    'ygajju52',
-    'shvnsh',
-    'abhishek7457',
-    'sethmcagit',
-    'Apurva122',
-    'Gurpreet-Singh-Bhupal',
-    'ashmit-coder',
-    'Rishi098',
-    'Xurde-glitch',
-    'imrohitoberoi',
-    'Hrushikeshsalunkhe',
-    'ABHI2598',
-    'Abhishek8-web',
-    'arjun01-debug',
-    'Shailesh12-svg',
-    'SachinSingh7050',
-    'VibhakarYashasvi',
-    'rajbaba1',
-    'yuvraj66',
-    'Nick-Kr-Believe',
-    'gongeprashant',
-    'sanskar783',
-    'infoguru19',
-    'Shamik225',
-    'Pro0131',
-    'soni-111',
-    'Rahul-bitu',
-    'meetshrimali',
-    'coolsuva',
-    'yogeshwaran01',
-    'Satyamtripathi1996',
-    'Rahatullah19',
-    'kartikey2003jain',
-    'rajarshi15220',
-    'SahilBhagtani',
-    'janni-03',
-    'Abhijit-06',
-    'dvlp-jrs',
-    'Viki3223',
-    'Azhad56',
-    'Mohit049',
-    'mvpsaurav',
-    'dvcrn',
-    'Deep-bhingradiya',
-    'shreyans2007',
-    'sailinkan',
-    'Abhijeet9274',
-    'riteshbiswas0',
-    'AhemadRazaK3',
-    'rishi123A',
-    'shivpatil',
-    'rikidas99',
-    'sohamgit',
-    'jheero',
-    'itzhv14',
-    'sameerbasha123',
-    'yatendra-dev',
-    'AditiGautam2000',
-    'sid0542',
-    'tushar-1308',
-    'dhruvil05',
-    'sufiyankhanz',
-    'Alan1857',
-    'siriusb79',
-    'PKan06',
-    'yagnikvadaliya',
-    'yogeshkun',
-    'Abhishekjhatech',
-    'jatinsharma11',
-    'THENNARASU-M',
-    'priyanshu987art',
-    'maulik922',
-    'param-de',
-    'nisheksharma',
-    'balbirsingh08',
-    'piyushkothari1999',
-    'zeeshanthedev590',
-    'praney-pareek',
-    'SUBHANGANI22',
-    'kartikeyaGUPTA45',
-    'Educatemeans',
-    '9192939495969798',
-    'Amit1173',
-    'thetoppython',
-    'Saurabhsingh94',
-    'royalbhati',
-    'kardithSingh',
-    'kishankumar05',
-    'Rachit-hooda-man',
-    'alijng',
-    'patel-om',
-    'jahangirguru',
-    'Vchandan348',
-    'amitagarwalaa57',
-    'rockingrohit9639',
-    'Krishnapal-rajput',
-    'aman78954098',
-    'pranshuag1818',
-    'PIYUSH6791',
-    'Lachiemckelvie',
-    'Pragati-Gawande',
-    'mahesh2526',
-    'Aman9234',
-    'xMaNaSx',
-    'shreyanshnpanwar',
-    'Paravindvishwakarma',
-    'chandan-op',
-    'amit007-majhi',
-    'Rahul-TheHacker',
-    'sharmanityam252',
-    'iamnishan',
-    'codewithashu',
-    'mersonfufu',
-    'saksham05mathur',
-    'Krishna10798',
-    'rajashit14',
-    'aetios',
-    'pankajnimiwal',
-    '132ikl',
-    'ghost',
-    'Sabyyy',
-    '9Ankit00',
-    'AfreenKhan777',
-    'akash-bansal-02',
-    'regakakobigman',
-    'aman1750',
-    'irajdip99',
-    'mohdadil2001',
-    'shithinshetty',
-    'nikhilsawalkar',
-    'Brighu-Raina',
-    'kenkirito',
-    'SamueldaCostaAraujoNunes',
-    'codewithsaurav',
-    'Ashutoshvk18',
-    'EthicalRohit',
-    'ihimalaya',
-    'somya-max',
-    'themonkeyhacker',
-    'rammohan12345',
-    'JasmeetSinghWasal',
-    'black73',
-    'Rebelshiv',
-    'DarshanaNemane',
-    'Jitin20',
-    'Prakshal2607',
-    'Sourabhkale1',
-    'shoeb370',
-    'ArijitGoswami100',
-    'anju2408',
-    'ukybhaiii',
-    'anshulbhandari5',
-    'pratham1303',
-    'arpitdevv',
-    'RishabhGhildiyal',
-    'mohammedssab',
-    'deepakshisingh',
-    'Samshopify',
-    'ankitkumar827',
-    'anddytheone',
-    'Tush6571',
-    'pritam98-debug',
-    'Snehapriya9955',
-    'coastaldemigod',
-    'yogesh-1952',
-    'Vivekv11',
-    'Andrewrick1',
-    'DARSHIT006',
-    'pravar18',
-    'devildeep4u',
-    '21appleceo',
-    'bereketsemagn',
-    'vandana-kotnala',
-    'tanya4113',
-    'gorkemkrdmn',
-    'Ashwin0512',
-    'prateekrathore1234',
-    'hash-mesh',
-    'pathak7838',
-    'sakshamdeveloper',
-    'ankan10',
-    'prafgup',
-    'anurag200502',
-    'niklifter',
-    'Shreeja1699',
-    'shivshikharsinha',
-    'SumanPurkait-grb',
-    'chiranjeevprajapat',
-    'TechieBoy',
-    'KhushiMittal',
-    'UtCurseSingh',
-    'lucastrogo',
-    'jarvis0302',
-    'ratan160',
-    'kgaurav123',
-    'dhakad17',
-    'Rishn99',
-    'codeme13',
-    'KINGUMS',
-    'sun-3',
-    'varunsingh251',
-    'thedrivingforc',
-    'aditya08maker',
-    'AkashVerma1515',
-    'gaurangbhavsar',
-    'ApurvaSharma20',
-    'Manmeet1999',
-    'Arhaans',
-    'Jaykitkukadiya',
-    'Rimjhim-Dey',
-    'apurv69',
-    'parth-lth',
-    'PranshuVashishtha',
-    'sidhantsharmaa',
-    'uday0001',
-    'iamrahul-9',
-    'nagpalnipun22',
-    'poonamp-31',
-    'dhananjaypatil',
-    'baibhavvishalpani',
-    'Ashish774-sol',
-    'sachin2490',
-    'Sudhanshu777871',
-    'mayur1234-shiwal',
-    'RohanWakhare',
-    'rishi4004',
-    'Amankumar019',
-    'Vaibhav162002',
-    'pratyushsrivastava500',
-    'AmarPaul-GiT',
-    'arjit-gupta',
-    'nitinchopade',
-    'imakg',
-    'meharshchakraborty',
-    'tumsabGandu',
-    'anurag360',
-    '2000sanu',
-    'PoorviAgrawal56',
-    'omdhurat',
-    'Pawansinghla',
-    'thehacker-oss',
-    'mritu-mritu',
-    'AJAY07111998',
-    'rai12091997',
-    'OmShrivastava19',
-    'Divyanshu2109',
-    'adityaherowa',
-    'Abhishekt07',
-    'code-diggers-369',
-    'Jamesj001',
-    'coding-geek1711',
-    'govindrajpagul',
-    'CDP14',
-    'Kartik989-max',
-    'MaheshDoiphode',
-    'Pranayade777',
-    'er-royalprince',
-    'ricardoseriani',
-    'nowitsbalibhadra',
-    'navyaswarup',
-    'devendrathakare44',
-    'awaisulabdeen',
-    'SoumyaShree80',
-    'abahad7921',
-    'vishal0410',
-    'gajerachintan9',
-    'EBO9877',
-    'rohit-rksaini',
-    'momin786786',
-    'Shaurya-567',
-    'himanshu1079',
-    'AlecsFerra',
-    'rajvpatil5',
-    'Hacker-Boss',
-    'Rakesh0222',
-    'ASHMITA-DE',
-    'BilalSabugar',
-    'Anjan50',
-    'Vedant336',
-    'github2aman',
-    'satyamgta',
-    'kumar-vineet',
-    'uttamagrawal',
-    'AjaySinghPanwar',
-    'saieshdevidas',
-    'ohamshakya',
-    'JrZemdegs712',
-    'Anil404',
-    'Anamika1818',
-    'ssisodiya28',
-    'Vedurumudi-Priyanka',
-    'python1neo',
-    'sanketprajapati',
-    'InfinitelLoop',
-    'DarkMatter188',
-    'TanishqAhluwalia',
-    'J-yesh4939',
-    'sameer8991',
-    'ANSH-CODER-create',
-    'DeadShot-111',
-    'joydeepraina',
-    'Dhrupal19',
-    'Nikhil5511',
-    'lavyaKoli',
-    'jitu0956',
-    'parthika',
-    'digitalarunava',
-    'Shivamagg97',
-    '23031999',
-    'Ashu-Modanwal',
-    'Singhichchha',
-    'pareekaabhi33',
-    'yashpatel008',
-    'yashwantkaushal',
-    'prem-smvdu',
-    'jains1234567890',
-    'Ritesh-004',
-    'shraddha8218',
-    'misbah9105',
-    'Tanishqpy',
-    'Iamtripathisatyam',
-    'mdnazam',
-    'akashkalal',
-    'Abhishekkumar10',
-    'chaitalimazumder',
-    'shubham1176',
-    '866767676767',
-    'Priyanshu0131',
-    'Rajani12345678910',
-    'agrima84',
-    'DODOG98T',
-    'Abhishekaddu',
-    'ipriyanshuthakur',
-    'yogesh9555',
-    'shubham1234-os',
-    'abby486',
-    'YOGESH86400',
-    'jaggi-pixel',
-    'Utkarshdubey44',
-    'Mustafiz900',
-    'ashusaurav',
-    'Deepak27004',
-    'theHackPot',
-    'itsaaloksah',
-    'MakdiManush',
-    'Divyanshu09',
-    'codewithabhishek786',
-    'sumitkumar727254',
-    'faiz-9',
-    'soumyadipdaripa100',
-    'Prerna-eng',
-    'yourcodinsmas',
-    'akashnai',
-    'aryancoder4279',
-    'Anish-kumar7641',
-    'shivamkumar1999',
-    'Kushal34563',
-    'YashSinghyash',
-    'Alok070899',
-    'gautamdewasi',
-    '5HAD0W-P1R4T3',
-    'rajkhatana',
-    'Himanshu-Sharma-java',
-    'yethish',
-    'Vikaskhurja',
-    'boomboom2003',
-    'mansigurnani',
-    'ansh8540',
-    'beingkS23',
-    'raksharaj1122',
-    'harshoswal',
-    'mitali-datascientist',
-    'daadestroyer',
-    'panudet-24mb',
-    'divy-koushik',
-    'Tanuj1234567',
-    'pattnaikp',
-    'Gauravsaha-97',
-    '0x6D70',
-    'aptinstaller',
-    'SahilKhera14',
-    'Archie-Sharma',
-    'Chandan-program',
-    'shadowfighter2403',
-    'ivinodpatil2000',
-    'Souvik-py',
-    'NomanBaigA',
-    'UdhavKumar',
-    'rishabh-var123',
-    'NK-codeman0001',
-    'ritikkatiyar',
-    'ananey2004',
-    'tirth7677',
-    'Stud-dabral',
-    'dhruvsalve',
-    'treyssatvincent',
-    'AYUSHRAJ-WXYZ',
-    'JenisVaghasiya',
-    'KPRAPHULL',
-    'Apex-code',
-    'cypherrexx',
-    'AkilaDee',
-    'ankit-ec',
-    'darshan-10',
-    'Srijans01',
-    'Ankit00008',
-    'bijantitan',
-    'Jitendrayadav-eng',
-    'Tamonash-glitch',
-    'Ans-pro',
-    'yogesh8087',
-    'Sakshi2000-hash',
-    'shrbis2810',
-    'swagatopain6',
-    'mayankaryaman10',
-    'rajlomror',
-    'GauravNub',
-    'puru2407',
-    'KhushalPShah',
-    'aman7heaven',
-    'hazelvercetti',
-    'nil901',
-    'Ankitsingh6299',
-    'yashprasad8',
-    'Zapgithubexe',
-    'shiiivam',
-    'ShubhamGuptaa',
-    'viraj3315',
-    'Pratyush2005',
-    'jackSaluza',
-    '03shivamkushwah',
-    'shahvraj20',
-    'manaskirad',
-    'Harsh08112001',
-    'R667180',
-    'PRATIKBANSDOE',
-    'MabtoorUlShafiq',
-    'dkyadav8282',
-    'prtk2001',
-    'MrDpk818',
-    'ParmGill00',
-    'kavya0116',
-    'gauravrai26',
-    'sachi9692',
-    'nj1902',
-    'akshatjindal036',
-    'shravanvis',
-    'ranjith660',
-    'sahemur',
-    'MDARBAAJ',
-    'Tylerdurdenn',
-    'hemantagrawal1808',
-    'luck804',
-    'vivekpatel09',
-    'ArushiGupta21',
-    'ray5541',
-    'arpitlathiya',
-    'Koshal67',
-    'harshul03',
-    'avinchudasama',
-    'PUJACHAUDHARY092',
-    'shaifali-555',
-    'coderidder',
-    'ravianandfbg',
-    'rohitnaththakur',
-    'KhanRohila',
-    'nikhilkr1402',
-    'abhijitk123',
-    'Jitendra2027',
-    'Roshan13046',
-    'satyam1316',
-    'shhivam005',
-    'V-Soni',
-    'iamayanofficial',
-    'kunaljainSgit',
-    'shriramsalunke-45',
-    'Laltu079',
-    'premkushwaha1',
-    'aryansingho7',
-    'rohitkalse',
-    'Royalsolanki',
-    'MAYANK25402',
-    'prakharlegend15',
-    'Ansh2831',
-    'aps-glitch',
-    'PJ-123-Prime',
-    'iamprathamchhabra',
-    'Bhargavi09',
-    'Shubham2443',
-    'YashAgarwalDev',
-    'ChandanDroid',
-    'SaurabhDev338',
-    'developerlives',
-    'Abhishek-hash',
-    'harshal1996',
-    'ritik9428',
-    'shadab19it',
-    'sarthakd999',
-    'Pruthviraj001',
-    'royalkingsava',
-    'manofelfin',
-    'vedantbirla',
-    'nishantkrgupta14',
-    'harsh1471',
-    'krabhi977',
-    'Pradipta0065',
-    'Ajeet2007',
-    'aman97703',
-    'Killersaint007',
-    'sachin8859',
-    'shubhamsuman37',
-    'rutuja2807',
-    'rishabh2204',
-    'Basal05',
-    'vipulkumbhar0',
-    'DSMalaviya',
-    'Mohit5700',
-    'pranaykrpiyush',
-    'Deepesh11-Code',
-    'yogikhandal',
-    'jigneshoo7',
-    'vishal-1264',
-    'RohanKap00r',
-    'Lokik18',
-    'harisharma12',
-    'PRESIDENT-caris',
-    'sandy56github',
-    'shreeya0505',
-    'Azumaxoid',
-    'Hagemaru69',
-    'sanju69',
-    'Roopeshrawat',
-    'hackersadd',
-    'coder0880',
-    'bajajtushar094',
-    'amitkumar8514',
-    'avichalsri',
-    'Satya-cod',
-    'andaugust',
-    'emtushar',
-    'snehalbiju12',
-    'lakshya05',
-    'Shaika07',
-    'John339',
-    'chetan-v',
-    'KrishnaAgarwal3458',
-    'rohit-1225',
-    'vaibhavjain2099',
-    'Pratheekb1',
-    'devu2000',
-    'Akhil88328832',
-    'anupam123148',
-    'pramod12345-design',
-    'Kartik192192',
-    'Kartik-Aggarwal',
-    'Ekansh5702',
-    'basitali97',
-    'TanishqKhetan',
-    'deecode15800',
-    'Vibhore-7190',
-    'Harsh-pj',
-    'vishalvishw10',
-    'runaljain255',
-    'RitikmishraRitik',
-    'akashtyagi0008',
-    'albert1800',
-    'Harsh1388-p',
-    'Omkar0104',
-    'Lakshitasaini8',
-    'vaibhav-87',
-    'AshimKr',
-    'joshi2727',
-    'vihariswamy',
-    'Sudhanshu-Srivastava',
-    'sameersahoo',
-    'YOGENDER-sharma',
-    'shashank06-sudo',
-    'irramshaiikh',
-    'Magnate2213',
-    'srishti0801',
-    'darshanchau',
-    'tanishka1745',
-    'Coder00sharma',
-    'gariya95',
-    'vedanttttt',
-    'codecpacka',
-    'vijay0960',
-    'tanya-98',
-    'Tarkeshwar999',
-    'RiderX24',
-    'BUNNY2210',
-    'yuvrajbagale',
-    'Pranchalkushwaha',
-    'Varun11940',
-    'khushhal213',
-    'Raulkumar',
-    'bekapish',
-    'shubhkr1023',
-    'mishrasanskriti802',
-    'vaibhavimekhe',
-    'HardikShreays',
-    'ab-rahman92',
-    'waytoheaven001',
-    'ambrajyaldandi',
-    '100009224730519',
-    'Bikramdas04',
-    'mokshkant7',
-    'Harshcoder10',
-    'hvshete',
-    'sanmatipol',
-    'polankita',
-    'Vinit-Code04',
-    'Sheetal0601',
-    'harsh123-para',
-    'RitikSharma06',
-    'pankajmandal1996',
-    'AkshayNaphade',
-    'KaushalDevrari',
-    'ag3n7',
-    'SudershanSharma',
-    'naturese',
-    'Shubham-217',
-    'ateef-khan',
-    'sharad5987',
-    'anmolsahu901',
-    'sarkarbibrata',
-    'Chandramohan01',
-    'RAVI-SHEKHAR-SINGH',
-    'vinayak15-cyber',
-    'TheWriterSahb',
-    'way2dmark',
-    'Spramod23',
-    'Saurabgami977',
-    'doberoi10',
-    'Lakshya9425',
-    'megha1527',
-    'beasttiwari',
-    'gtg94',
-    'kshingala1',
-    'Dshivamkumar',
-    'smokkie087',
-    'RiserShaikh',
-    'explorerAndroid',
-    'Grace-Rasaily780',
-    'Harshacharya2020',
-    'SatvikVirmani',
-    'RishabhIshtwal',
-    'gargtanuj05',
-    'skilleddevil',
-    'XAFFI',
-    'BALAJIRAO676',
-    'neer007-cpu',
-    'JiimmyValentine',
-    'Dhruv8228',
-    'Devendranath-Maddula',
-    'abhishekaman3015',
-    'sudhir-12',
-    'Shashi-design',
-    'simplilearns',
-    'ThakurTulsi',
-    'rahulshastryd',
-    'Ankit9915',
-    'afridi1706',
-    'JaySingh23',
-    'DevCode-shreyas',
-    'Shivansh-K',
-    'kikisslass',
-    'swarup4544',
-    'shivam22chaudhary',
-    'smrn54',
-    '521ramborahul',
-    'pretechscience',
-    'rudrakj',
-    'janidivy',
-    'SuvarneshKM',
-    'manishsuthar414',
-    'raghavbansal-sys',
-    'GoGi2712',
-    'therikesh',
-    'Anonymouslaj',
-    'devs7122',
-    'icmulnk77',
-    'ankit4-com',
-    'ansh4223',
-    'shudhanshubisht08',
-    'RN-01',
-    'iamsandeepprasad',
-    'neerajd007',
-    'rrishu',
-    'sameer0606',
-    'kunaldhar',
-    'sajal243',
-    'Arsalankhan111',
-    'RavindraPal2000',
-    'shubham5630994',
-    'ankit526',
-    'codewithaniket',
-    'meetpanchal017',
-    'Pranjal1362',
-    'ni30kp',
-    'kushalsoni123',
-    'Nishantcoedtu',
-    'vijaygupta18',
-    'Bishalsharma733',
-    'AnkitaMalviya',
-    'anianiket',
-    'hritik6774',
-    'krongreap',
-    'FlyingwithCaptainSoumya',
-    'himpat202',
-    'mahin651',
-    'mohit-jadhav-mj',
-    'kaushiknyay18',
-    'testinguser883',
-    'MdUmar07',
-    'Saumiya-Ranjan',
-    'cycric',
-    'mandliya456',
-    'kavipss',
-    'Sumit1777',
-    'ankitgusain',
-    'SKamal1998',
-    'Pritam-hrxcoder13',
-    'shruti-coder',
-    'Harshit-techno',
-    'Sanketpatil45',
-    'poojan-26',
-    'Nayan-Sinha',
-    'confievil',
-    'mrkishanda',
-    'abhishek777777777777',
-    'ankitnith99',
-    'Pushkar0',
-    'Sahil-Sinha',
-    'Anantvasu-cyber',
-    'priyanujbd23',
-    'divyanshmalik22',
-    'shreybhan',
-    'nirupam090',
-    'sohail000shaikh',
-    'dhruvvats-011',
-    'ATRI2107',
-    'Harjot9812',
-    'sougata18p',
-    'Amogh6315',
-    'NishanBanga',
-    'SaifVeesar',
-    'edipretoro',
-    'Amit10538',
-    'thewires2',
-    'jaswalsaurabh',
-    'siddh358',
-    'raj074',
-    'Sameer-create',
-    'goderos19',
-    'akash6194',
-    'Ketan19479',
-    'shubham-01-star',
-    'avijitmondal',
-    'khand420',
-    'kasarpratik31',
-    'jayommaniya',
-    'WildCard13',
-    'RishabhAgarwal345',
-    'mukultwr',
-    'Gauravrathi1122',
-    'abhinav-bit',
-    'ShivamBaishkhiyar',
-    'sudip682',
-    'neelshah6892',
-    'archit00007',
-    'Kara3',
-    'Akash5523',
-    'Pranshumehta',
-    'karan97144',
-    'parasraghav288',
-    'codingmastr',
-    'farzi56787',
-    'SAURABHYAGYIK',
-    'faizan7800',
-    'TheBinitGhimire',
-    'anandrathod143',
-    'Jeetrughani',
-    'aaditya2357',
-    'ADDY-666',
-    'kumarsammi3',
-    'prembhatt1916',
-    'Gourav5857',
-    'pradnyaghuge',
-    'Vishal-Aggarwal0305',
-    'prashant-45',
-    'abhishek18002',
-    'Deadlynector',
-    'ashishjangir02082001',
-    'RohitSingh04',
-    'Satyamtechy',
-    'shreyukashid',
-    'M-ux349',
-    'Riya123cloud',
-    'coder-beast-78',
-    'mrmaxx010204',
-    'npdoshi5',
-    'gobar07',
-    'rushi1313',
-    'Akashsah312',
-    'pksinghal585',
-    'rockyfarhan',
-    'JayeshDehankar',
-    'sarap224',
-    'yash752004',
-    'rohan241119',
-    'Nick-h4ck3r',
-    'abhishekA07',
-    'cjjain76',
-    'CodeWithYashraj',
-    'dkp888',
-    'rahil003',
-    'sachin694',
-    'Anjali0369',
-    'sumeet004',
-    'aryan1256',
-    'PNSuchismita',
-    'shash2407',
-    'Tanishk007',
-    'Yugalbuddy',
-    'Saurabh392',
-    'Saurabh299',
-    'DevanshGupta15',
-    'DeltaxHamster',
-    'darpan45',
-    'P-cpu',
-    'singhneha94',
-    'Nitish-McQueen',
-    'GRACEMARYMATHEW',
-    'ios-shah',
-    'Divanshu2402',
-    'asubodh',
-    'CypherAk007',
-    'nethracookie',
-    'guptaji609',
-    'thishantj',
-    'shivamsaini89',
-    'AntLab04',
-    'bit2u',
-    'AbhishekTiwari72',
-    'shreyashkharde',
-    'PrabhatP2000',
-    'amansahani60',
-    'shubham5888',
-    'Ashutoshkrs',
-    'scratcher007lakshya',
-    'SumitRodrigues',
-    'Harishit1466',
-    'Gouravbhardwaj1',
-    'shraiyya',
-    'SpooderManEXE',
-    'thelinuxboy',
-    'jamnesh',
-    'Nilesh425',
-    'machinegun20000',
-    'Brianodroid',
-    'sunnyjohari',
-    'TusharThakkar13',
-    'juned06',
-    'bindu-07',
-    'gautamsharma17',
-    'sonamvlog',
-    'iRajMishra',
-    'ayushgupta1915',
-    'Joker9050',
-    'Aakash1720',
-    'sakshiii-bit',
-    'mpsapps',
-    'deadshot9987',
-    'RobinKumar5986',
-    'thiszsachin',
-    'karanjoshi1206',
-    'sumitsisodiya',
-    'akashnavale18',
-    'spmhot',
-    'ashutoshhack',
-    'shivamupasanigg',
-    'rajaramrom',
-    'vksvikash85072',
-    'mohitkedia-github',
-    'vanshdeepcoder',
-    'rkgupta95',
-    'sushilmangnlae',
-    'Prakashmishra25',
-    'YashPatelH',
-    'prakash-jayaswal-au6',
-    'AnayAshishBhagat',
-    'Indian-hacker',
-    'ishaanbhardwaj',
-    'nish235',
-    'shubhampatil9125',
-    'Ankush-prog',
-    'Arpus87',
-    'kuldeepborkarjr',
-    'rajibbera',
-    'kt96914',
-    'nithubcode',
-    'ishangoyal8055',
-    'Samirbhajipale',
-    'AnshKumar200',
-    'salmansalim145',
-    'SAWANTHMARINGANTI',
-    'ankitts12',
-    'ketul2912',
-    'kdj309',
-    'nsundriyal62',
-    'manishsingh003',
-    'Deepak-max800',
-    'magicmasti428',
-    'sidharthpunathil',
-    'shyamal2411',
-    'auravgv',
-    'MrIconic27',
-    'anku-11-11',
-    'Suyashendra',
-    'WarriorSdg',
-    'pythoniseasy-hub',
-    'Nikk-code',
-    'Kutubkhan2005',
-    'kunal4421',
-    'apoorva1823000',
-    'singharsh0',
-    'sushobhitk',
-    'NavidMansuri5155',
-    'tanav8570',
-    'Durveshpal',
-    'dkishere2021',
-    'shubhamraj01',
-    'manthan14448',
-    'sahilmandoliya',
-    'Dewakarsonusingh',
-    'kalpya123',
-    '9075yash',
-    'Aditya7851-AdiStarCoders',
-    'MrChau',
-    'ooyeayush',
-    'Vipinkumar12it',
-    'ayushyadav2001',
-    'akshay20105',
-    'prothehero',
-    'sam007143',
-    'subhojit75',
-    'Dhvanil25',
-    'ANKUSHSINGH-PAT',
-    'Apoorva-Shukla',
-    'GizmoGamingIn',
-    'Mahaveer173',
-    'Abhayrai778',
-    'adityarawat007',
-    'HarshKumar2001',
-    'mohitboricha',
-    'deepakpate07',
-    'Aish-18',
-    'Sakshi-2100',
-    'adarshdwivedi123',
-    'shubhamprakhar',
-    'Basir56',
-    'zerohub23',
-    'Shrish072003',
-    'yash3497',
-    'Alfax14910',
-    'khushboo-lab',
-    'Devam-Vyas',
-    'PPS-H',
-    'nimitshrestha',
-    'sunnythepatel',
-    'Tusharkumarofficial',
-    'Nikhilmadduri',
-    'hiddenGeeks',
-    'dearyash',
-    'shahvihan',
-    'BlackThor555',
-    'preetamsatpute555',
-    'RanniePavillon',
-    'dgbkn',
-    'Karan-Agarwal1',
-    'praanjaal-guptaa',
-    'Cha7410',
-    'ar2626715',
-    'suhaibshaik',
-    'gurkaranhub',
-    'Guptaji29',
-    'seekNdestory',
-    'gorujr',
-    'lokeshbramhe',
-    'Rakesh-roy',
-    'NKGupta07',
-    'hacky503boy',
-    'Harshit-Taneja',
-    'vishal3308',
-    'vibhor828',
-    'rabi477',
-    'ArinTyagi',
-    'RaviMahile',
-    'Ayushgreeshu',
-    'Deepak674',
-    'VikashAbhay',
-    'paddu-sonu',
-    'swapnil-morakhia',
-    'anshu7919',
-    'vickyshaw29',
-    'pawan941394',
-    'mayankrai123',
-    'riodelord',
-    'iamsmr',
-    'ramkrit',
-    'vijayjha15',
-    'Anurag346',
-    'vineetstar10',
-    'Amarjeetsingh6120000',
-    'ayush9000',
-    'staticman-net',
-    'piyush4github',
-    'Neal-01',
-    'sky00099',
-    'cjheath',
-    'pranavstar-1203',
-    'sjwarner',
-    'Sandeepana',
-    'ritikrkx21',
-    'alinasahoo',
-    'tech-vin',
-    'Atul-steamcoder',
-    'ranchodhamala11',
-    'pradnyahaval',
-    'Nishant2911',
-    'altaf71mansoori',
-    'codex111',
-    'anirbandey303',
-    'kishan-kushwaha',
-    'ashwinthomas28',
-    'adityasunny1189',
-    'sourav1122',
-    'Hozefa976',
-    'PratapSaren',
-    'vikram-3118',
-    'Deep22T',
-    'sidd4999',
-    'agrawalvinay699',
-    'anujsingh1913',
-    'SoniHariom555',
-    'AyushJoshi2001',
-    'barinder7',
-    'shishir-m98',
-    'abhishekkrdev',
-    'pmanaktala',
-    'Snehil101',
-    'Himanshsingh0753',
-    'sambhav2898',
-    'niteshsharma9',
-    'x-thompson3',
-    'Vipul-hash',
-    'MrityunjayR',
-    'Abhinav7272',
-    'prashant-pbh',
-    'Saswat-Gewali',
-    'Redcloud2020-coder',
-    'priyanka-prasad1',
-    'harshwardhan111',
-    'Rajendra-banna',
-    'Rajan24032000',
-    'Mariede',
-    'sakshi-jain24',
-    'arron-hacker',
-    'Aniket-ind',
-    'Devloper-Adil',
-    'Shubh2674',
-    'saloninahar',
-    'DipNkr',
-    'princekumar6',
-    'harshsingh121098',
-    'Rajneesh486Git',
-    'jitendragangwar',
-    'Jayesh-Kumar-Yadav',
-    'shudhii',
-    'Bishal-bit',
-    'sulemangit',
-    'Kushagra767',
-    'JSM2512',
-    'ovs1176',
-    'arfakl99',
-    'Premkr1110',
-    'YASH162',
-    'rp-singh1994',
-    'Deepu10172j',
-    'raghavk911',
-    'HardikN19',
-    'Gari1309',
-    'eklare19',
-    'rohitmore1012',
-    'Aabhash007',
-    'mohitsaha123',
-    'Bhagirath043',
-    'surajphulara',
-    'shaurya127',
-    'shubzzz98',
-    'mkarimi-coder',
-    'sakshi0309-champ',
-    'shivam623623',
-    'cheekudeveloper',
-    'Ashutosh-98765',
-    'Vaibhavipadamwar',
-    'shwetashrei',
-    'Banashree19',
-    'atharvashinde01',
-    'PrashantMehta-coder',
-    'kajolkumari150',
-    'Aqdashashmii',
-    'joyskmathew',
-    'pkkushagra',
-    'Rishrao09',
-    'Ashutoshrastogi02',
-    'JatulCodes',
-    'agarwals368',
-    'praveenbhardwaj',
-    'hardik302001',
-    'jagannathbehera444',
-    'jubyer00',
-    'SouravSarkar7',
-    'neerajsins',
-    'Rasam22',
-    'pk-bits',
-    'asawaronit60',
-    'anupama-nicky',
-    'Kishan-Kumar-Kannaujiya',
-    'carrycooldude',
-    'parasjain99',
-    'vishwatejharer',
-    'sayon-islam-23',
-    'sidhu56',
-    'Diwakarprasadlp',
-    'hashim361',
-    'Anantjoshie',
-    'bankateshkr',
-    'Mayank2001kh',
-    'RoyNancy',
-    'ayushsagar10',
-    'jaymishra2002',
-    'Anushka004',
-    'naitik-23',
-    'meraj97',
-    'gagangupta07',
-    'stark829',
-    'Muskan761',
-    'MrDeepakY',
-    'NayanPrakash11',
-    'shawnfrost69',
-    'thor174',
-    'Sumeet2442',
-    'ummekulsum123',
-    'akarsh2312',
-    'hemantmakkar',
-    'bardrock01',
-    'MrunalHole',
-    'chetanrakhra',
-    'pratik821',
-    'rahulkz',
-    'Akhilesh-ingle',
-    'pruthvi3007',
-    'Vanshi1999',
-    'sagarkb',
-    'CoderRushil',
-    'Shivansh2200',
-    'Ronak14999',
-    'srishtiaggarwal',
-    'adityakumar48',
-    'piyushchandana',
-    'Piyussshh',
-    'priyank-di',
-    'Vishwajeetbamane',
-    'moto-pixel',
-    'madmaxakshay',
-    'James-HACK',
-    'vikaschamyal',
-    'Arkadipta14',
-    'Abhishekk2000',
-    'Sushant012',
-    'Quint-Anir',
-    'navaloli',
-    'ronitsingh1405',
-    'vanshu25',
-    'samueldenzil',
-    'akashrajput25',
-    'sidhi100',
-    'ShivtechSolutions',
-    'vimal365',
-    'master77229',
-    'Shubham-Khetan-2005',
-    'vaishnavi-1',
-    'AbhijithSogal',
-    'Sid133',
-    'white-devil123',
-    'bawa2510',
-    'anjanikshree12',
-    'mansigupta1999',
-    'hritik229',
-    'engineersonal',
-    'adityaadg1997',
-    'mansishah20',
-    '2shuux',
-    'Nishthajosh',
-    'ParthaDe94',
-    'abhi-io',
-    'Neha-119',
-    'Dungeonmaster07',
-    'Prathu121',
-    'anishloop7',
-    'cwmohit',
-    'shivamsri142',
-    'Sahil9511',
-    'NIKHILAVISHEK',
-    'amitpaswan9',
-    'devsharmaarihant',
-    'bilal509',
-    'BrahmajitMohapatra',
-    'rebelpower',
-    'Biswajitpradhan',
-    'sudhirhacker999',
-    'pydevtanya',
-    'Ashutosh147',
-    'jayeshmishra',
-    'rahul97407',
-    'athar10y2k',
-    'mrvasani48',
-    'raiatharva',
-    'Arj09',
-    'manish-109',
-    'aishwarya540',
-    'mohitjoshi81',
-    'PrathamAditya',
-    'K-Adrenaline',
-    'mrvlsaf',
-    'shivam9599',
-    'souravnitkkr',
-    'Anugya-Gogoi',
-    'AdityaTiwari64',
-    'yash623623',
-    'anjanik807',
-    'ujjwal193',
-    'TusharKapoor24',
-    'Ayushman278',
-    'osama072',
-    'aksahoo-1097',
-    'kishan-31802',
-    'Roshanpaswan',
-    'Himanshu-Prajapati',
-    'satyamraj48',
-    'NEFARI0US',
-    'kavitsheth',
-    'kushagra-18',
-    'khalane1221',
-    'ravleenkaur8368',
-    'Himanshu9430',
-    'uttam509',
-    'CmeherGit',
-    'sid5566',
-    'devaryan12123',
-    'ishanchoudhry',
-    'himanshu70043',
-    'skabhi001',
-    'tekkenpro',
-    'sandip1911',
-    'HarshvardhnMishra',
-    'krunalrocky',
-    'rohitkr-07',
-    'anshulgarg1234',
-    'hacky502boy',
-    'vivek-nagre',
-    'Hsm7085',
-    'amazingmj',
-    'Rbsingh9111',
-    'ronupanchal',
-    'mohitcodeshere',
-    '1741Rishabh',
-    'Cypher2122',
-    'SahilDiwakar',
-    'abhigyan1000',
-    'HimanshuSharma5280',
-    'ProgrammerHarsh',
-    'Amitamit789',
-    'swapnilmutthalkar',
-    'enggRahul8git',
-    'BhuvnendraPratapSingh',
-    'Ronak1958',
-    'Knight-coder',
-    'Faizu123',
-    'shivansh987',
-    'mrsampage',
-    'AbhishikaAgarwal',
-    'Souvagya-Nayak',
-    'harsh287',
-    'Staryking',
-    'rmuliterno',
-    'kunjshah0703',
-    'KansaraPratham',
-    'GargoyleKing2112',
-    'Tanu-creater',
-    'satvikmittal638',
-    'gauravshinde-7',
-    'saabkapoor36',
-    'devangpawar',
-    'RiddhiCoder',
-    'Bilalrizwaan',
-    'sayyamjain78',
-    '2606199',
-    'mayuresh4700',
-    'umang171',
-    'kramit9',
-    'surendraverma1999',
-    'raviu773986',
-    'Codewithzaid',
-    'Souvik-Bose-199',
-    'BeManas',
-    'JKHAS786',
-    'MrK232',
-    'aaryannipane',
-    'bronzegamer',
-    'hardikkushwaha',
-    'Anurag931999',
-    'dhruvalgupta2003',
-    'kaushal7806',
-    'JayGupta6866',
-    'mayank161001',
-    'ShashankPawsekar',
-    '387daksh',
-    'Susanta-Nayak',
-    'Pratik-11',
-    'Anas-S-Shaikh',
-    'marginkantilal',
-    'Brijbihari24',
-    'Deepanshu761',
-    'Aakashlifehacker',
-    'SaketKaswa',
-    'dhritiduttroy',
-    'astitvagupta31',
-    'Prakhyat-Srivastava',
-    'Puneet405',
-    'harsh2630',
-    'sds9639',
-    'Prajwal38',
-    'simransharmarajni',
-    'Naman195',
-    'patience0721',
-    'Aman6651',
-    'tyagi1558',
-    'kmannnish',
-    'victorwpbastos',
-    'sagnik403',
-    'rahuly5544',
-    'PrinceKumarMaurya591',
-    'nakulwastaken',
-    'janmejayamet',
-    'HimanshuGupta11110000',
-    'Akshatcodes21',
-    'IRFANSARI',
-    'shreya991',
-    'pavan109',
-    'Parth00010',
-    'itzUG',
-    'Mayank-choudhary-SF',
-    'shubhamborse',
-    'Courage04',
-    'techsonu160',
-    'shivamkonkar',
-    'ErMapsh',
-    'roshan-githubb',
-    'Gourav502',
-    'SauravMiah',
-    'nikhil609',
-    'BenzylFernandes',
-    'BarnakGhosh',
-    'Aanchalgarg343',
-    'Madhav12345678',
-    'Tirth11',
-    'bhavesh1456',
-    'ajeet323327',
-    'AmitNayak9',
-    'lalitchauhan2712',
-    'raviroshan224',
-    'hellmodexxx',
-    'Dhruv1501',
-    'Himanshu6003',
-    'mystery2828',
-    'waris89',
-    '2303-kanha',
-    'Anshuk-Mishra',
-    'amandeeptiwari22',
-    'Shashikant9198',
-    'Adityacoder99',
-    'Pradeepsharma7447',
-    'varunreddy57',
-    'uddeshaya',
-    'Priyanka0310-byte',
-    'adharsidhantgupta',
-    'Bhupander7',
-    'NomanSubhani',
-    'umeshkv2',
-    'Debosmit-Neogi',
-    'bhaktiagrawal088',
-    'Aashishsharma99',
-    'G25091998',
-    'mdkaif25',
-    'raj-jetani',
-    'chetanpujari5105',
-    'Agrawal-Rajat',
-    'Parthkrishnan',
-    'sameer-15',
-    'HD-Harsh-Doshi',
-    'Anvesha',
-    'karanmankoliya',
-    'armandatt',
-    'DakshSinghalIMS',
-    'Bhavyyadav25',
-    'surya123-ctrl',
-    'shubhambhawsar-5782',
-    'PAWANOP',
-    'mohit-singh-coder',
-    'Mradul-Hub',
-    'babai1999',
-    'Ritesh4726',
-    'Anuj-Solanki',
-    'abhi04neel',
-    'yashshahah',
-    'yogendraN27',
-    'Rishabh23-thakur',
-    'Indhralochan',
-    'harshvaghani',
-    'dapokiya',
-    'pg00019',
-    'AMITPKR',
-    'pawarrahul1002',
-    'mrgentlemanus',
-    'anurag-sonkar',
-    'aalsicoder07',
-    'harsh2699',
-    'Rahilkaxi',
-    'Jyotindra-21',
-    'dhruvilmehta',
-    'jacktherock',
-    'helpinubcomgr8',
-    'spcrze',
-    'aman707f',
-    'Nikkhil-J',
-    'Poonam798',
-    'devyansh2006',
-    'amanpj15',
-    'rudrcodes',
-    'STREIN-max',
-    'Adarsh-kushwaha',
-    'adxsh',
-    'Mohnish7869',
-    'Mrpalash',
-    'umangpincha',
-    'aniket1399',
-    'Sudip843',
-    'Amartya-Srivastav',
-    'Ananda1113',
-    'nobbitaa',
-    'shahmeet79',
-    'AmitM56',
-    'jiechencn',
-    'devim-stuffs',
-    'bkobl',
-    'kavindyasinthasilva',
-    'MochamadAhya29',
-    'misbagas',
-    'ksmarty',
-    'vedikaag99',
-    'nongshaba1337',
-    'daiyi',
-    'Saturia',
-    'llfj',
-    '312494845',
-    'DeadPackets',
-    'Pandorax41',
-    'Kritip123',
-    'poburi',
-    'hffkb',
-    'cybrnook',
-    'lichaonetuser',
-    'l-k-a-m-a-z-a',
-    'zhaoshengweifeng',
-    'staticman-peoplesoftmods',
-    'ikghx',
-    'uguruyar',
-    '513439077',
-    'f4nff',
-    'samspei0l',
-    'Seminlee94',
-    'inflabz',
-    'jack1988520',
-    'lanfenglin',
-    'sujalgoel',
-    'foldax',
-    'corejava',
-    'DarkReitor',
-    'amirpourastarabadi',
-    'Raess-rk1',
-    'ankit0183',
-    'jurandy007',
-    'davidbarratt',
-    'bertonjulian',
-    'TMFRook',
-    'qhmdi',
-    'QairexStudio',
-    'XuHewen',
-    'happyxhw',
-    'Mokaz24',
-    'andyteq',
-    'Grommish',
-    'fork-bombed',
-    'AZiMiao1122',
-    '61569864',
-    'jeemgreen234',
-    'IgorKowalczykBot',
-    'sirpdboy',
-    'fjsnogueira',
-    '9000000',
-    'ascott',
-    'aparcar',
-    'void9main',
-    'gerzees',
-    'javadnew5',
-    'belatedluck',
-    'calmsacibis995',
-    'maciejSamerdak',
-    'ghostsniper2018',
-    'rockertinsein',
-    'divarjahan',
-    'skywalkerEx',
-    'ehack-italy',
-    'Cloufish',
-    'aasoares',
-    'mustyildiz',
-    'Ras7',
-    'philly12399',
-    'cuucondiep',
-    'Nomake',
-    'z306334796',
-    'ball144love',
-    'armfc6161',
-    'Alex-coffen',
-    'rodrigodesouza07',
-    'lss182650',
-    'iphotomoto',
-    'overlordsaten',
-    'miaoshengwang',
-    'ManiakMCPE',
-    'Yazid0540570463',
-    'unnamegeek',
-    'brennvika',
-    'ardi66',
-    'Cheniour10',
-    'lxc1121',
-    'rfm-bot',
-    'cornspig',
-    'jedai47',
-    'ignotus09',
-    'kamal7641',
-    'Dabe11',
-    'dgder0',
-    'Nerom',
-    'luixiuno',
-    'zh610902551',
-    'wifimedia',
-    'mjoelmendes',
-    'pc2019',
-    'hellodong',
-    'lkfete',
-    'a7raj',
-    'willquirk',
-    'xyudikxeon1717171717',
-    '420hackS',
-    'mohithpokala',
-    'tranglc',
-    'ilyankou',
-    'hhmaomao',
-    'hongjuzzang',
-    'Mophee-ds',
-    'wetorek',
-    'apktesl',
-    'jaylac2000',
-    'BishengSJTU',
-    'elfring',
-    'ThomasGrund',
-    'coltonios',
-    'kouhe3',
-    'balaji-29',
-    'demo003',
-    'gfsupport',
-    'AlonzoLax',
-    'tazmanian-hub',
-    'qwerttvv',
-    'kotucocuk',
-    'ajnair100',
-    'jirayutza1',
-    'karolsw3',
-    'shenzt68',
-    'xpalm',
-    'adamwebrog',
-    'jackmahoney',
-    'chenwangnec',
-    'hanlihanshaobo',
-    'jannik-mohemian',
-    'Pablosky12',
-    '95dewadew',
-    'dcharbonnier',
-    'chapmanvoris',
-    'nishantingle999',
-    'gulabraoingle',
-    'kalyaniingle',
-    'BoulavardDepo',
-    'amingoli78',
-    'daya2940',
-    'roaddogg2k2',
-    'AmbroseRen',
-    'jayadevvasudevan',
-    'pambec',
-    'orditeck',
-    'muhammetcan34',
-    'Aman199825',
-    'hyl946',
-    'CyberSecurityUP',
-    'kokum007',
-    'shivamjaiswal64',
-    'Skub123',
-    'KerimG',
-    'thehexmor',
-    'jakaya123',
-    'Ashish24788',
-    'qhuy1501',
-    'TranVanDinh235',
-    'Thuong1998',
-    'TranTheTuan',
-    'anhtuyenuet',
-    'tranhuongk',
-    'danhquyen0109',
-    'hunghv-0939',
-    'dat-lq-234',
-    'nguyenducviet1999',
-    'Rxzzma',
-    'MrRobotjs',
-    'jonschlinkert',
-    'awsumbill',
-    'lastle',
-    'gaga227',
-    'maiquangminh',
-    'andhie-wijaya',
-    'penn5',
-    'FormosaZh',
-    'itz63c',
-    'AvinashReddy3108',
-    'ferchlam',
-    'noobvishal',
-    'ammarraisafti',
-    'authenticatorbot',
-    'SekiBetu',
-    'markkap',
-    'wyd6295578sk',
-    'lorpus',
-    'Camelsvest',
-    'ben-august',
-    'jackytang',
-    'dominguezcelada',
-    'tony1016',
-    'afuerhoff420',
-    'darkoverlordofdata',
-    'yihanwu1024',
-    'bromiao',
-    'MaxEis',
-    'kyf15596619',
-    'Reysefyn',
-    'THEROCK2512',
-    'Krystool',
-    'Adomix',
-    'splexpe',
-    'hugetiny',
-    'mikeLongChen',
-    'KlansyMsniv',
-    'Anony1234mo',
-    'Mygod',
-    'chenzesam',
-    'vatayes',
-    'fisher134',
-    'bmaurizio',
-    'fire-bot',
-    'kjbot-github',
-    'Dcollins66',
-    'dislash',
-    'noraj',
-    'theLSA',
-    'chadyj',
-    'AlbertLiu-Breeze',
-    'jspspike',
-    'kill5Witchd',
-    'repushko',
-    'ankushshekhawat',
-    'karan1dhir',
-    'venkatvani',
-    'tracyxiong1',
-    'PythxnBite',
-    'vamshi0997',
-    'himanshu345',
-    'prabhat2001',
-    'aakar345',
-    'rangers9708',
-    'anuragiiitm',
-    'AlfieBurns12345678910',
-    'marpernas',
-    'jrcole2884',
-    'deshanjali',
-    'alekh42',
-    'deepakgangore',
-    'SuperBeagleDog',
-    'vasiliykovalev',
-    'lyin888',
-    'tchainzzz',
-    'Theoask',
-    'jnikita356',
-    'ajay1706',
-    'gane5hvarma',
-    'pbhavesh2807',
-    'daniloeler',
-    'gabrielrab',
-    'djdamian210',
-    '1samuel411',
-    'Apoorv1',
-    'AnimatedAnand',
-    '7coil',
-    'trentschnee',
-    'himanshu435',
-    'dialv',
-    'DHRUV536',
-    'pratyushraj01',
-    'vedantv',
-    'yusronrizki',
-    'joaoguazzelli',
-    'pradnyesh45',
-    'aneeshaanjali',
-    'iREDMe',
-    'ashish010598',
-    'abhi1998das',
-    'keshriraj7870',
-    'vishad2',
-    'Navzter',
-    'jagadyudha',
-    'hrom405',
-    'seferov',
-    'umeshdhauni',
-    'sakshamkhurana97',
-    'ThatNerdyPikachu',
-    'dishantsethi',
-    'tharindumalshan1',
-    'ruderbytes',
-    'pr-jli',
-    '21RachitShukla',
-    'fellipegs',
-    'foolbirds',
-    'hariprasetia',
-    'tanyaagrawal1006',
-    'Gaurav1309Goel',
-    'vidurathegeek',
-    'wolfsoldier47',
-    'bhaskar24',
-    'thedutchruben',
-    'Qoyyuum',
-    'msdeibel',
-    'Nann',
-    'bksahu',
-    'sathyamoorthyrr',
-    'sbenstewart',
-    'supriyanta',
-    'MasterKN48',
-    'prkhrv',
-    'Blatantz',
-    'rahulgoyal911',
-    'ranyejun',
-    'decpr',
-    'apollojoe',
-    'SuperAdam47',
-    'RootUp',
-    'llronaldoll',
-    'jayadeepgilroy',
-    'Arunthomas1105',
-    'zhanwenzhuo-github',
-    'dennisslol006',
-    'xFreshie',
-    'servantthought',
-    'Geilivable',
-    'xushet',
-    'order4adwriter',
-    'dubrovka',
-    'Nmeyers75',
-    'p3p5170',
-    'yangkun6666',
-    'knight6414',
-    'nailanawshaba',
-    'tuhafadam',
-    'stainbank',
-    '52fhy',
-    'jiyanmizah',
-    'iotsys',
-    'zhangxiao921207',
-    'empsmoke',
-    'asugarr',
-    'Amonhuz',
-    'VinayaSathyanarayana',
-    'html5lover',
-    'peterambrozic',
-    'maomaodegushi',
-    'ShelbsLynn',
-    'AmmarAlzoubi',
-    'AlessioPellegrini',
-    'tetroider',
-    '404-geek',
-    'mohammed078',
-    'sugus25',
-    'mxdi9i7',
-    'sahilmalhotra24',
-    'furqanhaidersyed',
-    'ChurchCRMBugReport',
-    'shivamkapoor3198',
-    'wulongji2016',
-    'jjelschen',
-    'bj2015',
-    'tangxuelong',
-    'gunther-bachmann',
-    'marcos-tomaz',
-    'anette68',
-    'techiadarsh',
-    'nishantmadu',
-    'Nikhil2508',
-    'anoojlal',
-    'krischoi07',
-    'utkarshyadavin',
-    'amanPanth',
-    'chinurox',
-    'syedbilal5000',
-    'NidPlays',
-    'jirawat050',
-    'RealAnishSharma',
-    'bwegener',
-    'whyisjacob',
-    'naveenpucha8',
-    'ronaksakhuja',
-    'ju3tin',
-    'DT9',
-    'dorex22',
-    'hiendinhngoc',
-    'mlkorra',
-    'Christensenea',
-    'Mouse31',
-    'VeloxDevelopment',
-    'parasnarang1234',
-    'beilo',
-    'armagadon159753',
-    'andrewducker',
-    'NotMainScientist',
-    'alterem',
-    'MilkAndCookiz',
-    'Justinshakes',
-    'TheColdVoid',
-    'falconxunit',
-    '974648183',
-    'minenlink',
-    'thapapinak',
-    'lianghuacheng',
-    'ben3726',
-    'BjarniRunar',
-    'Taki21',
-    'zsytssk',
-    'Apple240Bloom',
-    'shubham436',
-    'LoOnyBiker',
-    'uasi',
-    'wailoamrani',
-    'AnimeOverlord7',
-    'zzyzy',
-    'ignitete',
-    'vikstrous',
-    's5s5',
-    'tianxingvpn',
-    'talib1410',
-    'vinymv',
-    'yerikyy',
-    'Honsec',
-    'chesterwang',
-    'perryzou',
-    'Meprels',
-    'mfat',
-    'mo-han',
-    'roganoalien',
-    'amoxicillin',
-    'AbelLai',
-    'whatisgravity',
-    'darshankaarki',
-    'Tshifhiwa84',
-    'CurtainTears',
-    'gaotong2055',
-    'appleatiger',
-    'hdstar2009',
-    'TommyJerryMairo',
-    'GoogleCodeExporter',
-]
+"""GitHub logins whose PRs are ignored, loaded from blacklist.txt.
+
+The file is re-read in the background whenever it changes, so the list
+can be updated without a redeploy. BLACKLIST_PATH overrides its location.
+"""
+import logging
+import os
+import re
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+BLACKLIST_PATH = os.getenv(
+    "BLACKLIST_PATH", os.path.join(os.path.dirname(__file__), "blacklist.txt")
+)
+RELOAD_INTERVAL = 60  # seconds between checks for a changed blacklist file
+
+# GitHub logins: alphanumerics and single inner hyphens, up to 39 characters,
+# GitHub Apps additionally end with [bot]
+LOGIN_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9]|-(?=[A-Za-z0-9])){0,38}(?:\[bot\])?$")
+
+
+class BlacklistStore:
+    """Membership index over a blacklist file, swapped atomically on reload."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._logins = frozenset()
+        self._mtime = None
+        self._lock = threading.Lock()
+        self._reloader = None
+        self.reload()
+
+    def __contains__(self, login):
+        return login in self._logins
+
+    def __len__(self):
+        return len(self._logins)
+
+    def __iter__(self):
+        return iter(self._logins)
+
+    def reload(self, force=False) -> bool:
+        """Re-read the file if it changed since the last load.
+
+        Returns whether a new list was loaded. A file that cannot be read
+        keeps the previously loaded list in place.
+        """
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+                if not force and mtime == self._mtime:
+                    return False
+                with open(self.path) as f:
+                    logins = parse_blacklist(f)
+            except OSError as e:
+                log.critical(f"Could not load blacklist from {self.path}: {e}")
+                return False
+            self._logins = logins
+            self._mtime = mtime
+        log.info(f"Loaded {len(logins)} blacklisted logins from {self.path}")
+        return True
+
+    def start_auto_reload(self, interval=RELOAD_INTERVAL):
+        """Check the file for changes every interval seconds in a daemon thread."""
+        if self._reloader:
+            return
+        self._reloader = threading.Thread(
+            target=self._reload_loop, args=(interval,), name="blacklist-reload", daemon=True
+        )
+        self._reloader.start()
+
+    def _reload_loop(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.reload()
+            except Exception as e:
+                log.critical(f"Blacklist reload failed: {e}")
+
+
+def parse_blacklist(lines) -> frozenset:
+    """Valid logins from blacklist lines, skipping comments and blank lines."""
+    logins = set()
+    for lineno, line in enumerate(lines, 1):
+        login = line.strip()
+        if not login or login.startswith("#"):
+            continue
+        if not LOGIN_RE.match(login):
+            log.warning(f"Ignoring invalid blacklist entry on line {lineno}: {login!r}")
+            continue
+        logins.add(login)
+    return frozenset(logins)
+
+
+blacklist = BlacklistStore(BLACKLIST_PATH)
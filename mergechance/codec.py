@@ -0,0 +1,286 @@
+"""Compact storage format for cached PR rows.
+
+encode turns gh_gql rows into a compressed, columnar blob: one list per
+field, author and closer logins interned, timestamps as epoch seconds,
+states and associations as codes and permalinks as PR numbers. A column
+whose values do not fit its compact form (e.g. a timestamp in another
+format) is stored as is, so decode always returns the rows that went in.
+
+Blobs start with a format version and a compression byte. Compression is
+zlib, which every deployment can read. zstd is there for comparison in
+benchmarks and needs zstandard (pip install zstandard), to write and read.
+"""
+from datetime import datetime, timezone
+from itertools import chain
+import json
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # optional, see module docstring
+    zstandard = None
+
+from mergechance.analysis import CLOSED_TS, CREATED_TS
+
+VERSION = 1
+ZLIB = 0
+ZSTD = 1
+# zlib past level 1 takes several times longer for ~10% fewer bytes
+LEVELS = {ZLIB: 1, ZSTD: 6}
+
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+TIMESTAMP_FIELDS = ("createdAt", "closedAt", "updatedAt")
+STATES = ("OPEN", "CLOSED", "MERGED")
+ASSOCIATIONS = ("NONE", "OWNER", "MEMBER", "COLLABORATOR", "CONTRIBUTOR",
+                "FIRST_TIME_CONTRIBUTOR", "FIRST_TIMER", "MANNEQUIN")
+ENUM_FIELDS = {"state": STATES, "authorAssociation": ASSOCIATIONS}
+# parsed timestamps analysis keeps in the rows, restored from the epoch columns
+PARSED = {"createdAt": CREATED_TS, "closedAt": CLOSED_TS}
+
+NO_LOGIN = -1  # removed GitHub user
+NO_CLOSER = -2  # no closed event
+DAY = 24 * 60 * 60
+_MISSING = object()
+# "HH:MM" and "SS" of every time of day, timestamps are taken apart and
+# put together with these instead of being parsed and formatted
+_MINUTES = [f"{hour:02}:{minute:02}" for hour in range(24) for minute in range(60)]
+_SECONDS = [f"{second:02}" for second in range(60)]
+_MINUTE_OF = {minute: i * 60 for i, minute in enumerate(_MINUTES)}
+_SECOND_OF = {second: i for i, second in enumerate(_SECONDS)}
+
+
+class CodecError(ValueError):
+    """Blob of an unknown version or compression."""
+
+
+class _Raw(Exception):
+    """The column does not fit its compact form."""
+
+
+def encode(rows, compression=ZLIB, level=None) -> bytes:
+    """Compressed blob of rows, see decode.
+
+    compression - ZLIB or ZSTD, only ZLIB blobs can be read where
+        zstandard is not installed, as in production
+    level - compression level, defaults to LEVELS[compression]
+    """
+    if level is None:
+        level = LEVELS[compression]
+    payload = json.dumps(_columns(rows), separators=(",", ":")).encode()
+    if compression == ZSTD:
+        body = zstandard.ZstdCompressor(level=level).compress(payload)
+    else:
+        body = zlib.compress(payload, level)
+    return bytes((VERSION, compression)) + body
+
+
+def decode(blob) -> list:
+    """Rows encoded in blob, with their parsed timestamps filled in."""
+    version, compression = blob[0], blob[1]
+    if version != VERSION:
+        raise CodecError(f"Unknown format version {version}")
+    if compression == ZSTD:
+        if zstandard is None:
+            raise CodecError("Blob is zstd compressed, install zstandard to read it")
+        payload = zstandard.ZstdDecompressor().decompress(blob[2:])
+    elif compression == ZLIB:
+        payload = zlib.decompress(blob[2:])
+    else:
+        raise CodecError(f"Unknown compression {compression}")
+    return _rows(json.loads(payload))
+
+
+def _columns(rows):
+    logins = _Logins()
+    days = {}
+    # keys in order of appearance, from one pass over all rows
+    keys = [key for key in dict.fromkeys(chain.from_iterable(rows)) if key not in PARSED.values()]
+    columns = {}
+    raw = {}
+    missing = []
+    for key in keys:
+        values = [row.get(key, _MISSING) for row in rows]
+        if _MISSING in values:
+            missing.extend([i, key] for i, value in enumerate(values) if value is _MISSING)
+            values = [None if value is _MISSING else value for value in values]
+        try:
+            columns[key] = _encode_column(key, values, logins, days)
+        except _Raw:
+            raw[key] = values
+    return {
+        "n": len(rows),
+        "logins": logins.logins,
+        "columns": columns,
+        "raw": raw,
+        # [row, key] of keys missing from some of the rows
+        "missing": missing,
+    }
+
+
+def _rows(document):
+    logins = document["logins"]
+    days = {}
+    keys = []
+    columns = []
+    for key, values in document["columns"].items():
+        for name, decoded in _decode_column(key, values, logins, days):
+            keys.append(name)
+            columns.append(decoded)
+    for key, values in document["raw"].items():
+        keys.append(key)
+        columns.append(values)
+    # a dict per row straight from the decoded columns
+    rows = [dict(zip(keys, values)) for values in zip(*columns)] if columns else [{} for _ in range(document["n"])]
+    for key in PARSED.values():
+        if key in keys:
+            # open PRs have no closed timestamp to parse
+            for row in rows:
+                if row[key] is None:
+                    del row[key]
+    for i, key in document["missing"]:
+        del rows[i][key]
+    return rows
+
+
+def _encode_column(key, values, logins, days):
+    if key in TIMESTAMP_FIELDS:
+        return [_epoch(value, days) for value in values]
+    if key in ENUM_FIELDS:
+        codes = {name: i for i, name in enumerate(ENUM_FIELDS[key])}
+        if not all(value in codes for value in values):
+            raise _Raw
+        return [codes[value] for value in values]
+    if key == "author":
+        return [logins.author(value) for value in values]
+    if key == "timelineItems":
+        return [logins.closer(value) for value in values]
+    if key == "permalink":
+        return _numbers(values)
+    raise _Raw
+
+
+def _decode_column(key, values, logins, days):
+    """[(key, values)] of the decoded column, timestamps come with their
+    parsed form under the PARSED key."""
+    if key in TIMESTAMP_FIELDS:
+        decoded = [None if ts is None else _iso(ts, days) for ts in values]
+        derived = PARSED.get(key)
+        return [(key, decoded), (derived, values)] if derived else [(key, decoded)]
+    if key in ENUM_FIELDS:
+        names = ENUM_FIELDS[key]
+        return [(key, [names[code] for code in values])]
+    if key == "author":
+        return [(key, [None if login == NO_LOGIN else {"login": logins[login]} for login in values])]
+    if key == "timelineItems":
+        return [(key, [_timeline(login, logins) for login in values])]
+    if key == "permalink":
+        prefix, numbers = values
+        return [(key, [f"{prefix}{number}" for number in numbers])]
+    raise CodecError(f"Unknown column {key}")
+
+
+def _timeline(login, logins):
+    if login == NO_CLOSER:
+        return {"edges": []}
+    actor = None if login == NO_LOGIN else {"login": logins[login]}
+    return {"edges": [{"node": {"actor": actor}}]}
+
+
+def _epoch(value, days):
+    """Epoch seconds of a timestamp in ISO_FORMAT, e.g. 2021-01-31T12:00:00Z.
+
+    days - {date: epoch seconds} of the dates seen so far, only a new
+    date needs a datetime to be validated, times are looked up
+    """
+    if value is None:
+        return None
+    if not isinstance(value, str) or len(value) != 20 or value[10] != "T" or value[16] != ":" or value[19] != "Z":
+        raise _Raw
+    day = days.get(value[:10])
+    if day is None:
+        day = days[value[:10]] = _day(value[:10])
+    minute = _MINUTE_OF.get(value[11:16])
+    second = _SECOND_OF.get(value[17:19])
+    if minute is None or second is None:
+        raise _Raw
+    return day + minute + second
+
+
+def _day(date):
+    """Epoch seconds of a YYYY-MM-DD date."""
+    if not (date.isascii() and date[:4].isdigit() and date[4] == "-" and date[5:7].isdigit()
+            and date[7] == "-" and date[8:].isdigit()):
+        raise _Raw
+    try:
+        # unlike timegm, datetime rejects out of range fields
+        parsed = datetime.fromisoformat(date)
+    except ValueError:
+        raise _Raw
+    return int(parsed.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _iso(ts, days):
+    """ts in ISO_FORMAT, days caches the date part of each day seen."""
+    day, seconds = divmod(ts, DAY)
+    date = days.get(day)
+    if date is None:
+        parsed = datetime.fromtimestamp(day * DAY, timezone.utc)
+        date = days[day] = f"{parsed.year:04}-{parsed.month:02}-{parsed.day:02}T"
+    minute, second = divmod(seconds, 60)
+    return date + _MINUTES[minute] + ":" + _SECONDS[second] + "Z"
+
+
+def _numbers(permalinks):
+    """[prefix, PR numbers] of permalinks sharing the same prefix."""
+    if not permalinks or not isinstance(permalinks[0], str):
+        raise _Raw
+    prefix = permalinks[0].rsplit("/", 1)[0] + "/"
+    numbers = []
+    for permalink in permalinks:
+        if not isinstance(permalink, str) or not permalink.startswith(prefix):
+            raise _Raw
+        number = permalink[len(prefix):]
+        if not number.isdigit() or str(int(number)) != number:
+            raise _Raw
+        numbers.append(int(number))
+    return [prefix, numbers]
+
+
+class _Logins:
+    def __init__(self):
+        self.logins = []
+        self._ids = {}
+
+    def intern(self, login):
+        if not isinstance(login, str):
+            raise _Raw
+        if login not in self._ids:
+            self._ids[login] = len(self.logins)
+            self.logins.append(login)
+        return self._ids[login]
+
+    def author(self, author):
+        if author is None:
+            return NO_LOGIN
+        if not isinstance(author, dict) or list(author) != ["login"]:
+            raise _Raw
+        return self.intern(author["login"])
+
+    def closer(self, timeline):
+        """Closer id of a timelineItems value as _pr_edges fetches it."""
+        if not isinstance(timeline, dict) or list(timeline) != ["edges"]:
+            raise _Raw
+        edges = timeline["edges"]
+        if not edges:
+            return NO_CLOSER
+        if len(edges) != 1 or edges[0] is None or list(edges[0]) != ["node"]:
+            raise _Raw
+        node = edges[0]["node"]
+        if not isinstance(node, dict) or list(node) != ["actor"]:
+            raise _Raw
+        actor = node["actor"]
+        if actor is None:
+            return NO_LOGIN
+        if not isinstance(actor, dict) or list(actor) != ["login"]:
+            raise _Raw
+        return self.intern(actor["login"])
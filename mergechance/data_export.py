@@ -3,10 +3,13 @@
 from typing import List
 from typing import List
 from mergechance.analysis import ANALYSIS_FIELDS
+from mergechance.prfields import is_batch
 
 
 def prep_tsv(prs:List) -> str:
-    """Create a tsv content with pr data."""
+    """Create a tsv content with pr data (list of PR dicts or a PRBatch)."""
+    if is_batch(prs):
+        prs = prs.to_rows()
     rows = [
         ['author'] + ANALYSIS_FIELDS,
         ]
@@ -2,17 +2,30 @@ import time
 from firebase_admin import credentials, firestore, initialize_app
 import logging
 
+from mergechance import payload
+from mergechance.lru import TTLCache
+
 
 TTL = 24 * 60 * 60  # A day in seconds
+# expired entries are still served for this long while they are refreshed
+# in the background, older ones are recomputed before responding
+GRACE = 6 * TTL
+MAX_STALENESS = TTL + GRACE
 
 # Initialize Firestore DB
 cred = credentials.Certificate("key.json")
 default_app = initialize_app(cred)
 db = firestore.client()
 cache_ref = db.collection("cache")
+# one document per repo being computed, see acquire_lease
+lease_ref = db.collection("leases")
 
 log = logging.getLogger(__name__)
 
+# hot entries (e.g. repos with a badge in a popular README) are served
+# without a Firestore read, as (entry, ts) until they are too stale to serve
+local_cache = TTLCache()
+
 
 def autocomplete_list() -> list:
     """return list of last used repos."""
@@ -29,7 +42,21 @@ def escape_fb_key(repo_target):
 
 
 def get_from_cache(repo):
+    """Return (chance, median, total, sketches) cached for repo within TTL."""
+    cached = get_cached(repo, TTL)
+    if cached:
+        return cached[0]
+    return None
+
+
+def get_cached(repo, max_age=MAX_STALENESS):
+    """Return ((chance, median, total, sketches), age in seconds) cached
+    for repo, None if there is no entry at most max_age old."""
     repo = escape_fb_key(repo)
+    local = local_cache.get(repo)
+    if local is not None and time.time() - local[1] <= max_age:
+        entry, ts = local
+        return entry, time.time() - ts
     try:
         cached = cache_ref.document(repo).get().to_dict()
         if not cached:
@@ -37,20 +64,170 @@ def get_from_cache(repo):
         median = cached.get("median")
         if not median:
             return None
-        age = time.time() - cached["ts"]
-        if age < TTL:
-            return cached.get("chance"), median, cached.get("total"), cached.get("prs", [])
+        ts = cached["ts"]
+        entry = cached.get("chance"), median, cached.get("total"), cached.get("sketches") or {}
+        local_cache.put(repo, (entry, ts), ts + MAX_STALENESS)
+        age = time.time() - ts
+        if age <= max_age:
+            return entry, age
         return None
     except Exception as e:
         log.critical(f"An error occured ruing retrieving cache: {e}")
 
 
-def cache(repo, chance, median, total, prs):
+def get_prs(repo):
+    """Return the viable PRs cached for repo, regardless of TTL."""
+    ref = cache_ref.document(escape_fb_key(repo))
+    try:
+        cached = ref.get().to_dict()
+        if not cached:
+            return None
+        _, prs = _load_payload(ref, cached)
+        return prs
+    except Exception as e:
+        log.critical(f"An error occured during retrieving PRs: {e}")
+
+
+def get_refresh_state(repo):
+    """Return (dataset, synced_at, cursor, complete) stored for repo,
+    regardless of TTL, see cache and mergechance.fetch.Window.
+
+    None if there is nothing to refresh from (e.g. entries cached before
+    delta refreshes existed, or with a filtered dataset).
+    """
+    ref = cache_ref.document(escape_fb_key(repo))
+    try:
+        cached = ref.get().to_dict()
+        if not cached or not cached.get("synced_at") or "complete" not in cached:
+            return None
+        dataset, _ = _load_payload(ref, cached)
+        return dataset, cached["synced_at"], cached.get("cursor"), cached["complete"]
+    except Exception as e:
+        log.critical(f"An error occured during retrieving refresh state: {e}")
+
+
+def _load_payload(ref, cached):
+    """(dataset, viable PRs) of the summary document cached under ref."""
+    if payload.is_legacy(cached):
+        return payload.from_legacy(cached)
+    return payload.join(_read_chunks(ref, cached))
+
+
+def _read_chunks(ref, cached):
+    # chunks past the count are leftovers of a failed cleanup
+    return [
+        chunk.to_dict() for chunk in ref.collection("payload").stream()
+        if int(chunk.id) < cached.get("chunks", 0)
+    ]
+
+
+def cache(
+    repo, chance, median, total, prs, sketches=None, dataset=None, synced_at=None, cursor=None, complete=False
+):
+    """Cache stats of a repo.
+
+    The summary goes to the repo's document, the PRs to its payload
+    subcollection (see mergechance.payload), written together in one batch.
+
+    sketches - serialized duration sketches (see analysis.duration_sketches)
+    dataset - all PRs fetched, unfiltered and newest first, prs must be
+        a subset of it, defaults to prs
+    synced_at - newest updatedAt in the dataset, for delta refreshes
+    cursor, complete - where the fetch can be resumed from and whether
+        the dataset goes back to the first PR (see mergechance.fetch.Window)
+    """
     escaped_repo = escape_fb_key(repo)
     try:
         ts = time.time()
-        cache_ref.document(escaped_repo).set(
-            {"chance": chance, "ts": ts, "name": repo, "total": total, "median": median, "prs": prs}
-        )
+        chunks = payload.split(prs if dataset is None else dataset, prs)
+        entry = {
+            "chance": chance,
+            "ts": ts,
+            "name": repo,
+            "total": total,
+            "median": median,
+            "sketches": sketches or {},
+            "synced_at": synced_at,
+            "cursor": cursor,
+            "complete": complete,
+            "chunks": len(chunks),
+        }
+        ref = cache_ref.document(escaped_repo)
+        batch = db.batch()
+        batch.set(ref, entry)
+        _write_chunks(batch, ref, chunks)
+        batch.commit()
+        local_cache.put(escaped_repo, ((chance, median, total, entry["sketches"]), ts), ts + MAX_STALENESS)
     except Exception as e:
         log.critical(f"An error occured during caching: {e}")
+
+
+def _write_chunks(batch, ref, chunks):
+    payload_ref = ref.collection("payload")
+    for i, chunk in enumerate(chunks):
+        batch.set(payload_ref.document(f"{i:04d}"), chunk)
+    for leftover in payload_ref.list_documents():
+        if int(leftover.id) >= len(chunks):
+            batch.delete(leftover)
+
+
+def migrate_cache() -> int:
+    """Bring entries cached in older layouts up to date: PRs kept in the
+    summary document move to payload chunks, chunks of plain PR dicts are
+    re-encoded with mergechance.codec. Safe to run repeatedly, returns
+    how many entries were migrated."""
+    migrated = 0
+    for doc in cache_ref.stream():
+        cached = doc.to_dict()
+        batch = db.batch()
+        if payload.is_legacy(cached):
+            dataset, prs = payload.from_legacy(cached)
+            update = {field: firestore.DELETE_FIELD for field in payload.LEGACY_FIELDS if field in cached}
+        else:
+            chunks = _read_chunks(doc.reference, cached)
+            if all("data" in chunk for chunk in chunks):
+                continue
+            dataset, prs = payload.join(chunks)
+            update = {}
+        chunks = payload.split(dataset, prs)
+        _write_chunks(batch, doc.reference, chunks)
+        update["chunks"] = len(chunks)
+        batch.update(doc.reference, update)
+        batch.commit()
+        migrated += 1
+        log.info(f"Migrated {cached.get('name', doc.id)}, {len(dataset)} PRs in {len(chunks)} chunks")
+    return migrated
+
+
+def acquire_lease(repo, holder, ttl) -> bool:
+    """Try to become the instance computing repo for the next ttl seconds.
+
+    False while another holder's lease is still valid. When Firestore
+    fails the lease is granted, computing twice beats not computing.
+    """
+    ref = lease_ref.document(escape_fb_key(repo))
+    try:
+        return _take_lease(db.transaction(), ref, holder, time.time(), ttl)
+    except Exception as e:
+        log.critical(f"An error occured during acquiring lease: {e}")
+        return True
+
+
+@firestore.transactional
+def _take_lease(transaction, ref, holder, now, ttl):
+    snapshot = ref.get(transaction=transaction)
+    lease = snapshot.to_dict() if snapshot.exists else None
+    if lease and lease["holder"] != holder and lease["expires"] > now:
+        return False
+    transaction.set(ref, {"holder": holder, "expires": now + ttl})
+    return True
+
+
+def release_lease(repo, holder):
+    ref = lease_ref.document(escape_fb_key(repo))
+    try:
+        lease = ref.get().to_dict()
+        if lease and lease["holder"] == holder:
+            ref.delete()
+    except Exception as e:
+        log.critical(f"An error occured during releasing lease: {e}")
@@ -0,0 +1,334 @@
+"""Local stand-in for GitHub's GraphQL API, for offline load tests and benchmarks.
+
+Serves the queries gh_gql and scripts/get_pr_gql.py send (PR pages, by
+state, updated since, batched and search) from synthetic repositories,
+or replays responses recorded from the real API. Latency, server errors
+and the rate limit budget are configurable. Run it with
+
+    python -m mergechance.fake_gql --port 8765 --latency 0.1
+
+and point the app at it with GH_GQL_URL=http://127.0.0.1:8765/graphql.
+With --record DIR it proxies to api.github.com (with the caller's token)
+and saves every response to DIR, --replay DIR serves those again.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+
+from mergechance.ratelimit import HOURLY_BUDGET, WINDOW
+from mergechance.synthetic import generate_prs
+
+GITHUB_URL = "https://api.github.com/graphql"
+DEFAULT_PRS = 2_000  # per synthetic repository
+
+
+def synthetic_repos(count=1, prs=DEFAULT_PRS, seed=0, now=None) -> dict:
+    """{"owner/name": PR nodes oldest first} of count synthetic repositories,
+    named synthetic/repo0, synthetic/repo1..."""
+    repos = {}
+    for i in range(count):
+        name = f"synthetic/repo{i}"
+        nodes = generate_prs(prs, seed=seed + i, now=now)
+        for number, node in enumerate(nodes, 1):
+            node["permalink"] = f"https://github.com/{name}/pull/{number}"
+            node["number"] = number
+        repos[name] = nodes
+    return repos
+
+
+class FakeGitHub:
+    """The fake API, start() it to serve on a local port.
+
+    repos - {"owner/name": PR nodes oldest first}, see synthetic_repos,
+        nodes are returned whole whatever fields a query asks for
+    latency, jitter - seconds added to every response, jitter at random
+    error_rate - share of requests answered with a 502
+    budget - rate limit points per token and hour
+    fixtures - directory to replay recorded responses from, or to record
+        them to when upstream is set
+    upstream - URL of the real API to proxy to while recording
+    """
+
+    def __init__(
+        self,
+        repos=None,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        budget=HOURLY_BUDGET,
+        fixtures=None,
+        upstream=None,
+        seed=0,
+    ):
+        self.repos = {name.lower(): prs for name, prs in (repos if repos is not None else synthetic_repos()).items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.budget = budget
+        self.fixtures = fixtures
+        self.upstream = upstream
+        self.requests = 0
+        self.url = None
+        self._budgets = {}
+        self._recorded = _load_fixtures(fixtures) if fixtures and not upstream else {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self, host="127.0.0.1", port=0) -> str:
+        """Serve in a background thread, returns the GraphQL endpoint URL."""
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        self.url = f"http://{host}:{self._server.server_port}/graphql"
+        return self.url
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def handle(self, request: dict, token: str) -> tuple:
+        """(status, body, headers) answering a GraphQL request."""
+        with self._lock:
+            self.requests += 1
+            failed = self._random.random() < self.error_rate
+            delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+        if failed:
+            return 502, {"message": "Server Error"}, {}
+        if self.upstream:
+            return self._record(request, token)
+        if self.fixtures:
+            return self._replay(request)
+        variables = request.get("variables") or {}
+        cost = sum(1 for key in variables if key.startswith("owner") and key != "owner") or 1
+        rate_limit, headers = self._spend(token, cost)
+        if rate_limit is None:
+            error = {"type": "RATE_LIMITED", "message": "API rate limit exceeded"}
+            return 200, {"data": None, "errors": [error]}, headers
+        data, errors = self._answer(request["query"], variables)
+        if "rateLimit" in request["query"] and data is not None:
+            data = {"rateLimit": rate_limit, **data}
+        body = {"data": data}
+        if errors:
+            body["errors"] = errors
+        return 200, body, headers
+
+    def _spend(self, token, cost):
+        now = time.time()
+        with self._lock:
+            remaining, reset_at = self._budgets.get(token, (self.budget, now + WINDOW))
+            if now >= reset_at:
+                remaining, reset_at = self.budget, now + WINDOW
+            ok = remaining >= cost
+            if ok:
+                remaining -= cost
+            self._budgets[token] = remaining, reset_at
+        headers = {
+            "X-RateLimit-Limit": str(self.budget),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(reset_at)),
+        }
+        rate_limit = {"cost": cost, "remaining": remaining, "resetAt": _iso(reset_at)}
+        return (rate_limit if ok else None), headers
+
+    def _answer(self, query, variables):
+        if "search" in variables:
+            return self._search(variables), None
+        if "owner0" in variables:
+            data, errors = {}, []
+            for i in range(sum(1 for key in variables if key.startswith("name"))):
+                alias = f"r{i}"
+                prs = self._repo(variables[f"owner{i}"], variables[f"name{i}"])
+                if prs is None:
+                    data[alias] = None
+                    errors.append(_not_found(variables[f"owner{i}"], variables[f"name{i}"], alias))
+                    continue
+                data[alias] = _backwards_page(prs, None, variables["pageSize"])
+            return data, errors
+        prs = self._repo(variables["owner"], variables["name"])
+        if prs is None:
+            return {"repository": None}, [_not_found(variables["owner"], variables["name"], "repository")]
+        if "pullRequests" not in query:
+            return {"repository": {"createdAt": prs[0]["createdAt"] if prs else _iso(time.time())}}, None
+        if "UPDATED_AT" in query:
+            return {"repository": _updated_page(prs, variables.get("cursor"), variables["pageSize"])}, None
+        if "after:" in query:
+            # scripts/get_pr_gql.py walks forwards
+            page = _forward_page(prs, variables.get("cursor"), variables["pageSize"])
+            return {"repository": page}, None
+        states = variables.get("states")
+        if states:
+            prs = [pr for pr in prs if pr["state"] in states]
+        return {"repository": _backwards_page(prs, variables.get("cursor"), variables["pageSize"])}, None
+
+    def _search(self, variables):
+        search = variables["search"]
+        repo = re.search(r"repo:(\S+)", search).group(1)
+        prs = self._repo(*repo.split("/")) or []
+        created = re.search(r"created:(\S+)\.\.(\S+)", search)
+        if created:
+            first, last = created.groups()
+            prs = [pr for pr in prs if first <= pr["createdAt"] <= last]
+        offset = int(variables.get("cursor") or 0)
+        page = prs[offset:offset + variables["pageSize"]]
+        end = offset + len(page)
+        return {
+            "search": {
+                "issueCount": len(prs),
+                "pageInfo": {"hasNextPage": end < len(prs), "endCursor": str(end)},
+                "nodes": page,
+            }
+        }
+
+    def _repo(self, owner, name):
+        return self.repos.get(f"{owner}/{name}".lower())
+
+    def _record(self, request, token):
+        import requests as rq
+
+        res = rq.post(self.upstream, json=request, headers={"Authorization": token}, timeout=60)
+        try:
+            body = res.json()
+        except ValueError:
+            body = {"message": res.text}
+        headers = {k: v for k, v in res.headers.items() if k.lower().startswith("x-ratelimit") or k == "Retry-After"}
+        entry = {"request": request, "status": res.status_code, "body": body, "headers": headers}
+        os.makedirs(self.fixtures, exist_ok=True)
+        with open(os.path.join(self.fixtures, f"{_fixture_key(request)}.json"), "w") as fixture:
+            json.dump(entry, fixture, indent=1)
+        return res.status_code, body, headers
+
+    def _replay(self, request):
+        entry = self._recorded.get(_fixture_key(request))
+        if entry is None:
+            return 404, {"message": "No recorded response for this request"}, {}
+        return entry["status"], entry["body"], entry["headers"]
+
+
+def _handler(fake):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # headers and body go out in separate writes, without this delayed
+        # ACKs add ~40ms to every response and swamp the configured latency
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            status, body, headers = fake.handle(request, self.headers.get("Authorization", ""))
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _backwards_page(prs, cursor, size):
+    """Page of the size PRs before cursor (an index into prs), like last/before."""
+    end = int(cursor) if cursor else len(prs)
+    start = max(end - size, 0)
+    return _page(prs, start, end, start > 0, "hasPreviousPage", "startCursor", str(start))
+
+
+def _forward_page(prs, cursor, size):
+    start = int(cursor) if cursor else 0
+    end = min(start + size, len(prs))
+    return _page(prs, start, end, end < len(prs), "hasNextPage", "endCursor", str(end))
+
+
+def _updated_page(prs, cursor, size):
+    by_update = sorted(prs, key=lambda pr: pr["updatedAt"], reverse=True)
+    return _forward_page(by_update, cursor, size)
+
+
+def _page(prs, start, end, has_more, has_key, cursor_key, cursor):
+    """prs[start:end] as a pullRequests connection, edge cursors are indexes into prs."""
+    return {
+        "pullRequests": {
+            "totalCount": len(prs),
+            "pageInfo": {has_key: has_more, cursor_key: cursor},
+            "edges": [{"cursor": str(i + 1), "node": prs[i]} for i in range(start, end)],
+        }
+    }
+
+
+def _not_found(owner, name, alias):
+    return {
+        "type": "NOT_FOUND",
+        "path": [alias],
+        "message": f"Could not resolve to a Repository with the name '{owner}/{name}'.",
+    }
+
+
+def _fixture_key(request):
+    text = json.dumps({"query": request.get("query"), "variables": request.get("variables")}, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _load_fixtures(directory):
+    recorded = {}
+    for name in os.listdir(directory):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name)) as fixture:
+                entry = json.load(fixture)
+            recorded[_fixture_key(entry["request"])] = entry
+    return recorded
+
+
+def _iso(ts):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--repos", type=int, default=1, help="synthetic repositories, synthetic/repo0...")
+    parser.add_argument("--prs", type=int, default=DEFAULT_PRS, help="PRs per synthetic repository")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to each response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many seconds more at random")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests failing with 502")
+    parser.add_argument("--budget", type=int, default=HOURLY_BUDGET, help="rate limit points per token and hour")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", metavar="DIR", help=f"proxy to {GITHUB_URL}, save responses to DIR")
+    group.add_argument("--replay", metavar="DIR", help="serve responses recorded to DIR")
+    args = parser.parse_args()
+    fake = FakeGitHub(
+        repos=synthetic_repos(args.repos, args.prs) if not (args.record or args.replay) else {},
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        budget=args.budget,
+        fixtures=args.record or args.replay,
+        upstream=GITHUB_URL if args.record else None,
+    )
+    url = fake.start(port=args.port)
+    print(f"Fake GitHub GraphQL API at {url}, point the app at it with GH_GQL_URL={url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
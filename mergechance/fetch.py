@@ -0,0 +1,164 @@
+"""Fetching the PRs behind a repo's merge chance.
+
+Every fetch walks PRs backwards from the newest in pages of STEP_SIZE
+until enough outsider PRs are found, and returns an IncrementalAnalysis
+of them along with the Window it read, to be cached by main. fetch_delta
+replays a cached Window updated with what changed since, which gives the
+same numbers as a full fetch.
+"""
+from mergechance.analysis import SYNC_FIELDS, IncrementalAnalysis, created_ts, filter_prs
+from mergechance.gh_gql import STEP_SIZE, get_pr_fields, get_updated_prs, iter_pr_fields_by_state
+from mergechance.ratelimit import INTERACTIVE
+
+VIABLE_PR_TARGET = 50  # stop fetching once this many outsider PRs are found
+MAX_PAGES = 10
+# PRs of a Window kept for delta refreshes, new PRs push the oldest out
+WINDOW_SIZE = 2 * MAX_PAGES * STEP_SIZE
+
+
+class Window:
+    """The newest PRs of a repo, as read by a fetch.
+
+    rows - unfiltered PRs newest first, every PR of the repo down to the
+        oldest of them
+    synced_at - newest updatedAt of the rows, for fetch_delta
+    cursor - get_pr_fields cursor to the PRs right before the oldest row,
+        None when not known (walks by state, trimmed windows)
+    complete - whether the rows go back to the first PR of the repo
+    """
+
+    def __init__(self, rows=None, synced_at="", cursor=None, complete=False):
+        self.rows = rows if rows is not None else []
+        self.synced_at = synced_at
+        self.cursor = cursor
+        self.complete = complete
+
+    def sync(self):
+        self.synced_at = max([self.synced_at] + [pr["updatedAt"] for pr in self.rows])
+        if len(self.rows) > WINDOW_SIZE:
+            del self.rows[WINDOW_SIZE:]
+            self.cursor = None
+            self.complete = False
+        return self
+
+
+def fetch_all(owner, repo, client=None, priority=INTERACTIVE):
+    """Walk PRs backwards from the newest until enough outsider PRs are found.
+
+    priority - ratelimit.INTERACTIVE or ratelimit.BACKGROUND, for every
+        request of the fetch (same for the other fetches)
+    Returns the IncrementalAnalysis and the Window read.
+    """
+    window = Window()
+    analysis, _ = replay(window.rows, more=_walk_back(owner, repo, window, client, priority))
+    return analysis, window.sync()
+
+
+def fetch_by_state(owner, repo, client=None, priority=INTERACTIVE):
+    """Same as fetch_all, with MERGED, CLOSED and OPEN PRs fetched concurrently.
+
+    The walks' rows are replayed in pages of STEP_SIZE PRs as they arrive,
+    exactly the pages fetch_all would get, and the walks stop once those
+    hold enough viable PRs.
+
+    The walks share fetch_all's budget of MAX_PAGES requests. Each walk
+    runs somewhat past the PRs replay consumes, so where outsider PRs are
+    rare the budget can run out a few pages of PRs before fetch_all's
+    would, and the numbers come from fewer PRs.
+    """
+    window = Window()
+    walks = iter_pr_fields_by_state(
+        owner, repo, SYNC_FIELDS, page_cap=MAX_PAGES, client=client, priority=priority
+    )
+
+    def more():
+        if window.complete:
+            return []
+        try:
+            return next(walks)
+        except StopIteration as stop:
+            window.complete = bool(stop.value)
+            return []
+
+    try:
+        analysis, _ = replay(window.rows, more=more)
+    finally:
+        walks.close()
+    return analysis, window.sync()
+
+
+def fetch_delta(owner, repo, window, client=None, priority=INTERACTIVE):
+    """Update a Window cached by an earlier fetch with PRs updated since.
+
+    Updated PRs older than the window are left out, as a full fetch would
+    not get to them, and the walk resumes from window.cursor when the
+    updated window holds too few outsider PRs.
+
+    Returns the same as fetch_all, or None when a full fetch is needed:
+    too many PRs changed, or the walk can not be resumed.
+    """
+    updated, complete = get_updated_prs(
+        owner, repo, SYNC_FIELDS, since=window.synced_at, page_cap=MAX_PAGES, client=client, priority=priority
+    )
+    if not complete:
+        return None
+    oldest = min((created_ts(pr) for pr in window.rows), default=None)
+    by_link = {pr["permalink"]: pr for pr in window.rows}
+    for pr in updated:
+        if window.complete or (oldest is not None and created_ts(pr) >= oldest):
+            by_link[pr["permalink"]] = pr
+    window.rows = sorted(by_link.values(), key=created_ts, reverse=True)
+    window.synced_at = max([window.synced_at] + [pr["updatedAt"] for pr in updated])
+    resumable = window.complete or window.cursor is not None
+    more = _walk_back(owner, repo, window, client, priority) if resumable else None
+    analysis, consumed = replay(window.rows, more=more)
+    if not resumable and consumed == len(window.rows) and _wants_more(analysis, consumed):
+        return None
+    return analysis, window.sync()
+
+
+def replay(rows, more=None):
+    """Filter and add PRs (newest first) page by page, the way fetch_all
+    fetches them, until enough viable PRs are found.
+
+    rows - unfiltered PRs, extended in place with what more returns
+    more - called for older PRs once rows run out, returns a list of
+        them, an empty one when there are none
+    Returns the IncrementalAnalysis and how many of the rows it was given.
+    """
+    analysis = IncrementalAnalysis()
+    start = 0
+    while _wants_more(analysis, start):
+        while more is not None and len(rows) < start + STEP_SIZE:
+            older = more()
+            if not older:
+                break
+            rows.extend(older)
+        batch = rows[start:start + STEP_SIZE]
+        if not batch:
+            break
+        start += len(batch)
+        analysis.add(filter_prs(batch))
+    return analysis, start
+
+
+def _wants_more(analysis, consumed):
+    return analysis.viable_count < VIABLE_PR_TARGET and consumed < MAX_PAGES * STEP_SIZE
+
+
+def _walk_back(owner, repo, window, client, priority):
+    """more for replay, fetching the page before window.cursor (the newest
+    page without one) and keeping window.cursor and window.complete up to date."""
+
+    def more():
+        if window.complete:
+            return []
+        rows, window.cursor = get_pr_fields(
+            owner, repo, SYNC_FIELDS, page_cap=1, cursor=window.cursor, client=client, priority=priority
+        )
+        # GitHub pages are full as long as there are older PRs
+        window.complete = len(rows) < STEP_SIZE
+        # pages come oldest first, replay may split them once new PRs come in
+        return sorted(rows, key=created_ts, reverse=True)
+
+    return more
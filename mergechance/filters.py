@@ -0,0 +1,114 @@
+"""Rules based PR filtering for spam, bots etc.
+
+All rules are compiled once at import into a PRFilter, which runs them in
+a single pass and counts how many PRs each rule dropped.
+"""
+from collections import Counter
+import re
+import threading
+from typing import TYPE_CHECKING
+
+from mergechance.blacklist import blacklist
+from mergechance.prfields import closer_login, is_batch
+
+if TYPE_CHECKING:
+    import numpy as np
+    from mergechance.prbatch import PRBatch
+
+# PR titles containing any of these are considered trivial
+BANNED_KEYWORDS = ["readme", "update", "typo"]
+# PR titles equal to any of these are considered trivial
+BANNED_TITLES = ["test"]
+
+TRIVIAL = "trivial"
+BLACKLISTED = "blacklisted"
+CLOSED_BY_AUTHOR = "closed_by_author"
+KEPT = "kept"
+
+
+class PRFilter:
+    """Drops trivial PRs, PRs of blacklisted authors and PRs closed by their author.
+
+    Rules are checked in that order, hits are attributed to the first
+    matching rule.
+    """
+
+    def __init__(self, banned_keywords, banned_titles, blacklist):
+        # (?!) never matches, an empty alternation would match every title
+        keywords = "|".join(re.escape(k.lower()) for k in banned_keywords) or "(?!)"
+        self._keywords = re.compile(keywords)
+        self._titles = frozenset(t.lower() for t in banned_titles)
+        # a BlacklistStore is kept as is, so reloads reach the filter
+        self._blacklist = frozenset(blacklist) if isinstance(blacklist, (list, tuple, set)) else blacklist
+        self._hits = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, prs):
+        """Return the PRs no rule matched, prs is a list of PR dicts or a PRBatch."""
+        if is_batch(prs):
+            return prs.take(~self.mask(prs))
+        hits = Counter()
+        kept = []
+        for pr in prs:
+            rule = self.rule(pr)
+            hits[rule or KEPT] += 1
+            if not rule:
+                kept.append(pr)
+        self._record(hits)
+        return kept
+
+    def rule(self, pr):
+        """Name of the first rule matching the PR dict, None if it passes."""
+        if self.is_trivial(pr.get("title") or ""):
+            return TRIVIAL
+        author = pr["author"]
+        if not author:
+            return None
+        login = author["login"]
+        if login in self._blacklist:
+            return BLACKLISTED
+        if pr["state"] == "CLOSED" and closer_login(pr) == login:
+            return CLOSED_BY_AUTHOR
+        return None
+
+    def mask(self, batch: "PRBatch") -> "np.ndarray":
+        """Vectorized rules for a PRBatch, True for dropped PRs."""
+        import numpy as np
+        from mergechance.prbatch import State, NO_AUTHOR
+
+        trivial = np.fromiter((self.is_trivial(t) for t in batch.title), dtype=bool, count=len(batch))
+        # each login is checked once, no matter how many PRs it authored
+        blacklisted_ids = [i for i, login in enumerate(batch.logins) if login in self._blacklist]
+        blacklisted = np.isin(batch.author, blacklisted_ids) & ~trivial
+        closed_by_author = (
+            (batch.state == State.CLOSED)
+            & (batch.author != NO_AUTHOR)
+            & (batch.closer == batch.author)
+            & ~trivial
+            & ~blacklisted
+        )
+        dropped = trivial | blacklisted | closed_by_author
+        self._record({
+            TRIVIAL: int(trivial.sum()),
+            BLACKLISTED: int(blacklisted.sum()),
+            CLOSED_BY_AUTHOR: int(closed_by_author.sum()),
+            KEPT: int(len(batch) - dropped.sum()),
+        })
+        return dropped
+
+    def is_trivial(self, title: str) -> bool:
+        """Poor man's spam detection - based on title only for now."""
+        title = title.lower()
+        return title in self._titles or self._keywords.search(title) is not None
+
+    def hits(self) -> dict:
+        """How many PRs each rule dropped (and how many were kept) so far."""
+        with self._lock:
+            return {rule: self._hits[rule] for rule in (TRIVIAL, BLACKLISTED, CLOSED_BY_AUTHOR, KEPT)}
+
+    def _record(self, hits):
+        with self._lock:
+            self._hits.update(hits)
+
+
+pr_filter = PRFilter(BANNED_KEYWORDS, BANNED_TITLES, blacklist)
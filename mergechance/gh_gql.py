@@ -1,17 +1,284 @@
 """Module for handling GitHub's GraphQL API."""
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List
-import os
+import asyncio
 import logging
+import os
+import threading
+import time
 import requests as rq
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError
+from mergechance import tokens
+from mergechance.ratelimit import INTERACTIVE, BACKGROUND, RATE_LIMIT_FIELDS, RateLimitError
+from mergechance.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from mergechance.streaming import iter_items
+from mergechance.tokens import NoTokenError, Token, TokenPool
 
 log = logging.getLogger(__name__)
 
-TOKEN = os.getenv("GH_TOKEN")
 STEP_SIZE = 100  # 100 is Max
-GH_GQL_URL = "https://api.github.com/graphql"
+# point at a stand-in such as mergechance.fake_gql for offline testing
+GH_GQL_URL = os.getenv("GH_GQL_URL", "https://api.github.com/graphql")
+POOL_SIZE = 8  # matches gunicorn's thread count
+CONNECT_TIMEOUT = 5  # seconds
+READ_TIMEOUT = 30  # seconds
+DEADLINE = 60  # seconds for a request including its retries
+
+RETRY_STATUSES = {500, 502, 503, 504}
+# GitHub answers 200 with these when a query timed out on its side
+SERVER_ERROR_MESSAGES = ("Something went wrong while executing your query", "timedout")
+
+# query shapes, the rate limit scheduler learns the cost of each
+PR_PAGE = "pr_page"
+UPDATED_PAGE = "updated_page"
+BATCH_PAGE = "batch_page"  # suffixed with the number of repositories
+
+PR_STATES = ("MERGED", "CLOSED", "OPEN")
+NOT_REACHED = "~"  # sorts after every timestamp
+# pages a state walk may fetch beyond what the slowest unfinished walk reached
+LEAD_PAGES = 2
+PR_EDGES = "data.repository.pullRequests.edges"  # where PR pages keep their PRs
+
+# a PR page is STEP_SIZE PRs plus one closing event each, GitHub allows
+# 500,000 nodes per query but long batches get slow and costly
+BATCH_SIZE = 20
+QUERY_CACHE_SIZE = 32  # query documents, one per field set and kind of query
+
+
+class GQLClient:
+    """GitHub GraphQL client with a pooled keep-alive session.
+
+    Connections to the API are reused between requests, one client can be
+    shared by all threads. At most pool_size connections are open at a
+    time, further requests wait for a free one.
+
+    Each request is sent with a token from a TokenPool (the process wide
+    one from GH_TOKENS/GH_TOKEN by default) and paced by that token's
+    RateLimitScheduler. Passing a single token (and optionally its
+    scheduler) creates a pool of just that token.
+
+    Failed requests are retried according to retry (a RetryPolicy) and
+    while GitHub keeps failing, breaker (a CircuitBreaker) rejects requests
+    without sending them.
+    """
+
+    def __init__(
+        self,
+        token=None,
+        url=GH_GQL_URL,
+        pool_size=POOL_SIZE,
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=READ_TIMEOUT,
+        scheduler=None,
+        token_pool=None,
+        deadline=DEADLINE,
+        retry=None,
+        breaker=None,
+    ):
+        self.url = url
+        if token_pool is None:
+            token_pool = TokenPool([Token(token, scheduler)]) if token else tokens.pool
+        self.token_pool = token_pool
+        self.timeout = (connect_timeout, read_timeout)
+        self.deadline = deadline
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.counters = Counter()
+        self._lock = threading.Lock()
+        self.session = rq.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+
+    def request(self, data: dict, shape=None, priority=INTERACTIVE, deadline=None, partial=False) -> dict:
+        """Send a query once the rate limit scheduler allows it.
+
+        shape - label of the kind of query, for the cost estimate,
+            defaults to the query text
+        priority - ratelimit.INTERACTIVE or ratelimit.BACKGROUND
+        deadline - seconds the request may take including retries,
+            defaults to the client's deadline
+        partial - return results which carry errors next to their data
+            (e.g. one missing repository of a batched query) instead of
+            raising GQLError
+
+        Timeouts, connection errors, 5xx responses and secondary rate limits
+        are retried with backoff, GQLError is raised once retries or the
+        deadline run out, or right away while the circuit breaker is open.
+        """
+        result, _, _ = self._send(data, shape, priority, deadline, partial=partial)
+        return result
+
+    def stream(self, data: dict, prefix: str, shape=None, priority=INTERACTIVE, deadline=None):
+        """Send a query like request does, but parse the response as it arrives.
+
+        prefix - dotted path of the array to stream, e.g.
+            "data.repository.pullRequests.edges"
+
+        Returns a NodeStream. Failures before the response body arrives are
+        retried as for request, GraphQL errors in the body raise GQLError
+        while iterating.
+        """
+        res, token, shape = self._send(data, shape, priority, deadline, stream=True)
+        return NodeStream(res, prefix, token.scheduler, shape)
+
+    def _send(self, data, shape, priority, deadline, partial=False, stream=False) -> tuple:
+        """The request loop, returns the parsed result (the response when
+        streaming), the token it was sent with and the query shape."""
+        shape = shape or data["query"]
+        deadline = time.monotonic() + (deadline or self.deadline)
+        attempt = 0
+        while True:
+            try:
+                self.breaker.before_request()
+                token = self.token_pool.acquire(shape, priority)
+            except CircuitOpenError as e:
+                self._count("rejected")
+                raise GQLError(str(e)) from e
+            except (RateLimitError, NoTokenError) as e:
+                self.breaker.cancel()
+                log.critical(f"Not sending GQL query: {e}")
+                raise GQLError(str(e)) from e
+            self._count("requests")
+            headers = {"Authorization": f"bearer {token.value}"}
+            try:
+                res = self.session.post(
+                    self.url, json=data, headers=headers, timeout=self._timeout(deadline), stream=stream
+                )
+            except rq.RequestException as e:
+                # connection errors, timeouts and bodies cut short (ChunkedEncodingError)
+                reason, retry_after, server_fault = type(e).__name__, None, True
+            else:
+                if res.status_code == 401:
+                    res.close()
+                    self.breaker.success()
+                    self.token_pool.revoke(token)
+                    continue
+                if stream and res.status_code == 200:
+                    self.breaker.success()
+                    return res, token, shape
+                try:
+                    result, reason, retry_after, server_fault = _classify(res)
+                except rq.RequestException as e:
+                    # a streamed body broke off while _classify read it
+                    result, reason, retry_after, server_fault = None, type(e).__name__, None, True
+                finally:
+                    # a streamed response holds its pooled connection until closed
+                    res.close()
+                if reason is None:
+                    self.breaker.success()
+                    token.scheduler.record(shape, (result.get("data") or {}).get("rateLimit"))
+                    if "errors" not in result:
+                        return result, token, shape
+                    errs = result["errors"]
+                    if any(err.get("type") == "RATE_LIMITED" for err in errs):
+                        reset = res.headers.get("X-RateLimit-Reset")
+                        token.scheduler.exhausted(int(reset) if reset else None)
+                        continue
+                    if partial and result.get("data"):
+                        return result, token, shape
+                    self._count("failures")
+                    log.critical(f"Failed GQL query with {errs}")
+                    raise GQLError()
+            if server_fault:
+                self.breaker.failure()
+            else:
+                self.breaker.success()
+            attempt += 1
+            delay = None
+            if retry_after is not None or server_fault:
+                delay = self.retry.delay(attempt, retry_after)
+            if delay is None or attempt >= self.retry.max_attempts or time.monotonic() + delay > deadline:
+                self._count("failures")
+                log.critical(f"Failed GQL query after {attempt} attempts: {reason}")
+                raise GQLError(reason)
+            self._count("retries")
+            self._count(f"retry:{reason}")
+            log.warning(f"Retrying GQL query in {delay:.1f}s: {reason}")
+            time.sleep(delay)
+
+    def stats(self) -> dict:
+        """Request, retry and failure counters and the circuit breaker state."""
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "requests": counters.pop("requests", 0),
+            "retries": counters.pop("retries", 0),
+            "failures": counters.pop("failures", 0),
+            "rejected": counters.pop("rejected", 0),
+            "retry_reasons": {key.split(":", 1)[1]: value for key, value in counters.items()},
+            "circuit": self.breaker.state,
+        }
+
+    def _count(self, key):
+        with self._lock:
+            self.counters[key] += 1
+
+    def _timeout(self, deadline):
+        """Connect and read timeout, cut short so the request ends by the deadline."""
+        left = max(deadline - time.monotonic(), 0.1)
+        return min(self.timeout[0], left), min(self.timeout[1], left)
+
+    def close(self):
+        self.session.close()
+
+
+class NodeStream:
+    """Items of one array of a GraphQL response, parsed while they arrive.
+
+    Iterate it once, afterwards rest holds the remainder of the response
+    (pageInfo, rateLimit etc.) with the streamed array left empty.
+    """
+
+    def __init__(self, res, prefix, scheduler, shape):
+        self.rest = {}
+        self._res = res
+        self._prefix = prefix
+        self._scheduler = scheduler
+        self._shape = shape
+
+    def __iter__(self):
+        self._res.raw.decode_content = True
+        try:
+            yield from iter_items(self._res.raw, self._prefix, self.rest)
+        except ValueError as e:
+            raise GQLError(f"Invalid response: {e}") from e
+        except (HTTPError, rq.RequestException) as e:
+            # the connection broke off mid body, there is no retrying
+            # once items were handed out
+            raise GQLError(f"Response cut short: {type(e).__name__}") from e
+        finally:
+            self._res.close()
+        self._scheduler.record(self._shape, (self.rest.get("data") or {}).get("rateLimit"))
+        if "errors" in self.rest:
+            errs = self.rest["errors"]
+            if any(err.get("type") == "RATE_LIMITED" for err in errs):
+                reset = self._res.headers.get("X-RateLimit-Reset")
+                self._scheduler.exhausted(int(reset) if reset else None)
+            log.critical(f"Failed GQL query with {errs}")
+            raise GQLError()
 
 
-def get_pr_fields(org: str, repo: str, fields: List[str], page_cap=1, cursor=None) -> tuple:
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> GQLClient:
+    """The process wide client, created on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GQLClient()
+        return _client
+
+
+def get_pr_fields(
+    org: str, repo: str, fields: List[str], page_cap=1, cursor=None, client=None, priority=INTERACTIVE
+) -> tuple:
     """Get specified GitHub PR fields.
 
     org - GitHub organization/users
@@ -19,12 +286,14 @@ def get_pr_fields(org: str, repo: str, fields: List[str], page_cap=1, cursor=Non
     fields - list of PR edge fields (See GitHub GraphQL docs)
     page_cap - how many pages (each 100 records) to fetch
     start_at - graphQl cursor to resume previous query
+    client - GQLClient to use instead of the process wide one
+    priority - ratelimit.INTERACTIVE or ratelimit.BACKGROUND
     """
     pages = 0
     has_next = True
     rows = []
     while has_next and pages < page_cap:
-        result = _paginated_query(org, repo, cursor, fields)
+        result = _paginated_query(org, repo, cursor, fields, client, priority)
         rows.extend(_to_rows(result))
         page_info = result["data"]["repository"]["pullRequests"]["pageInfo"]
         has_next = page_info["hasPreviousPage"]
@@ -33,26 +302,360 @@ def get_pr_fields(org: str, repo: str, fields: List[str], page_cap=1, cursor=Non
     return rows, cursor
 
 
-def _to_rows(result: dict):
+def iter_pr_fields(
+    org: str, repo: str, fields: List[str], page_cap=1, cursor=None, client=None, priority=INTERACTIVE
+):
+    """Same PRs as get_pr_fields, yielded one at a time as the responses are parsed.
+
+    For bulk downloads, only one PR of each page needs to be in memory at
+    a time (with ijson installed, see streaming.py). Returns the cursor
+    to resume from as the generator's return value.
+    """
+    client = client or get_client()
+    for _ in range(page_cap):
+        nodes = client.stream(_pr_page_query(org, repo, cursor, fields), PR_EDGES, PR_PAGE, priority)
+        for edge in nodes:
+            yield edge["node"]
+        page_info = nodes.rest["data"]["repository"]["pullRequests"]["pageInfo"]
+        cursor = page_info["startCursor"]
+        if not page_info["hasPreviousPage"]:
+            break
+    return cursor
+
+
+def get_updated_prs(
+    org: str, repo: str, fields: List[str], since: str, page_cap=10, client=None, priority=INTERACTIVE
+) -> tuple:
+    """Get PRs updated since a point in time, most recently updated first.
+
+    since - ISO timestamp as GitHub returns it (e.g. the newest updatedAt
+    seen so far), fields must include updatedAt. PRs updated within the
+    same second are included, they may have changed after it was seen.
+    page_cap - how many pages (each 100 records) to fetch at most
+    client - GQLClient to use instead of the process wide one
+    priority - ratelimit.INTERACTIVE or ratelimit.BACKGROUND
+
+    Returns the rows and whether all of the updates were fetched, False
+    means page_cap was reached first.
+    """
+    pages = 0
+    cursor = None
+    rows = []
+    while pages < page_cap:
+        result = _updated_query(org, repo, cursor, fields, client, priority)
+        for row in _to_rows(result):
+            # GitHub timestamps share one fixed format, so they compare as strings
+            if row["updatedAt"] < since:
+                return rows, True
+            rows.append(row)
+        page_info = result["data"]["repository"]["pullRequests"]["pageInfo"]
+        if not page_info["hasNextPage"]:
+            return rows, True
+        cursor = page_info["endCursor"]
+        pages += 1
+    return rows, False
+
+
+def iter_pr_fields_by_state(
+    org: str, repo: str, fields: List[str], page_cap=len(PR_STATES), client=None, priority=INTERACTIVE
+):
+    """Get PR fields newest first with one concurrent backwards walk per PR state.
+
+    page_cap - how many pages (each 100 records) to fetch at most, shared
+        by the walks, at least one per state
+    fields must include createdAt.
+
+    Yields lists of rows of all states, newest first by createdAt, as soon
+    as every walk that may still find them has gone further back, so the
+    rows yielded so far are all PRs down to some point in time, without
+    gaps. Walks run concurrently, but at most LEAD_PAGES pages further back
+    than the slowest unfinished walk. Closing the generator stops them,
+    once the pages they are fetching arrive.
+    Returns whether every walk reached the first PR of its state as the
+    generator's return value.
+    """
+    walks = {state: _StateWalk() for state in PR_STATES}
+    cond = threading.Condition()
+    shared = {"pages": max(page_cap, len(PR_STATES)), "stop": False, "error": None}
+
+    def walk(state):
+        this = walks[state]
+        others = [other for other in walks.values() if other is not this]
+        cursor = None
+        try:
+            while True:
+                with cond:
+                    while not shared["stop"] and shared["pages"] and this.ahead(_cutoff(others)) >= LEAD_PAGES:
+                        cond.wait()
+                    if shared["stop"] or not shared["pages"]:
+                        return
+                    shared["pages"] -= 1
+                result = _paginated_query(org, repo, cursor, fields, client, priority, states=[state])
+                page_info = result["data"]["repository"]["pullRequests"]["pageInfo"]
+                cursor = page_info["startCursor"]
+                with cond:
+                    this.add(_to_rows(result), done=not page_info["hasPreviousPage"])
+                    cond.notify_all()
+                    if this.done:
+                        return
+        except Exception as e:
+            with cond:
+                shared["error"] = shared["error"] or e
+                shared["stop"] = True
+        finally:
+            with cond:
+                this.running = False
+                cond.notify_all()
+
+    executor = ThreadPoolExecutor(max_workers=len(PR_STATES), thread_name_prefix="gql-state")
+    for state in PR_STATES:
+        executor.submit(walk, state)
+    released = NOT_REACHED
+    try:
+        while True:
+            with cond:
+                while True:
+                    cutoff = _cutoff(walks.values())
+                    running = any(walk.running for walk in walks.values())
+                    if cutoff < released or not running:
+                        break
+                    cond.wait()
+                # rows at the cutoff itself may still have peers in older pages
+                rows = [row for walk in walks.values() for row in walk.rows if cutoff < row["createdAt"] <= released]
+                if shared["error"] is not None:
+                    raise shared["error"]
+            released = cutoff
+            if rows:
+                rows.sort(key=lambda row: row["createdAt"], reverse=True)
+                yield rows
+            if not running:
+                return all(walk.done for walk in walks.values())
+    finally:
+        with cond:
+            shared["stop"] = True
+            cond.notify_all()
+        # no walk may outlive the generator, e.g. to retry a page nobody reads
+        executor.shutdown(wait=True)
+
+
+class _StateWalk:
+    def __init__(self):
+        self.rows = []
+        self.oldest = None
+        self.done = False  # reached the first PR of this state
+        self.running = True
+        self._page_oldest = []
+
+    def add(self, rows, done):
+        self.rows.extend(rows)
+        self.done = done
+        if rows:
+            # GitHub timestamps share one fixed format, so they compare as strings
+            page_oldest = min(row["createdAt"] for row in rows)
+            self._page_oldest.append(page_oldest)
+            self.oldest = min(self.oldest or page_oldest, page_oldest)
+
+    def ahead(self, cutoff) -> int:
+        """Pages of this walk reaching further back than cutoff."""
+        return sum(1 for oldest in self._page_oldest if oldest < cutoff)
+
+
+def _cutoff(walks):
+    """Oldest createdAt all walks which may still have older PRs have reached."""
+    if any(walk.oldest is None and not walk.done for walk in walks):
+        # a walk without its first page yet, none of the rows are known to be complete
+        return NOT_REACHED
+    return max((walk.oldest for walk in walks if not walk.done), default="")
+
+
+def get_first_pages(
+    repos: list, fields: List[str], batch_size=BATCH_SIZE, client=None, priority=INTERACTIVE
+) -> dict:
+    """Get the newest page of PRs of many (org, repo) pairs, batch_size
+    repositories per request.
+
+    Returns a dict from (org, repo) to the (rows, cursor) get_pr_fields
+    would return for page_cap=1, or to a GQLError for repositories which
+    could not be fetched (e.g. they do not exist). Pass the cursor to
+    get_pr_fields to continue with older pages.
+    """
+    client = client or get_client()
+    results = {}
+    for start in range(0, len(repos), batch_size):
+        batch = repos[start:start + batch_size]
+        result = client.request(_batch_page_query(batch, fields), f"{BATCH_PAGE}_{len(batch)}", priority, partial=True)
+        errors = {}
+        for err in result.get("errors", []):
+            errors.setdefault((err.get("path") or [None])[0], err.get("message"))
+        for i, key in enumerate(batch):
+            alias = f"r{i}"
+            if not result["data"].get(alias):
+                log.critical(f"Failed to fetch {key[0]}/{key[1]}: {errors.get(alias)}")
+                results[key] = GQLError(errors.get(alias))
+                continue
+            cursor = result["data"][alias]["pullRequests"]["pageInfo"]["startCursor"]
+            results[key] = _to_rows(result, alias), cursor
+    return results
+
+
+class AsyncGQLClient:
+    """asyncio interface to GitHub's GraphQL API for fetching many repositories at once.
+
+    Requests go through a pooled GQLClient on a thread pool, at most
+    concurrency of them are in flight at a time. Meant for batch work, so
+    requests are BACKGROUND priority unless told otherwise.
+    """
+
+    def __init__(self, client=None, concurrency=POOL_SIZE, priority=BACKGROUND):
+        self.client = client or GQLClient(pool_size=concurrency)
+        self.priority = priority
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gql")
+
+    async def request(self, data: dict, shape=None) -> dict:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.client.request, data, shape, self.priority)
+
+    async def get_pr_fields(self, org: str, repo: str, fields: List[str], page_cap=1, cursor=None) -> tuple:
+        """Same as gh_gql.get_pr_fields."""
+        pages = 0
+        has_next = True
+        rows = []
+        while has_next and pages < page_cap:
+            result = await self.request(_pr_page_query(org, repo, cursor, fields), PR_PAGE)
+            rows.extend(_to_rows(result))
+            page_info = result["data"]["repository"]["pullRequests"]["pageInfo"]
+            has_next = page_info["hasPreviousPage"]
+            cursor = page_info["startCursor"]
+            pages += 1
+        return rows, cursor
+
+    async def get_many_pr_fields(self, repos: list, fields: List[str], page_cap=1) -> dict:
+        """Fetch PR fields of many (org, repo) pairs concurrently.
+
+        Returns a dict from (org, repo) to the get_pr_fields result, or to
+        the exception raised while fetching that repository.
+        """
+        results = await asyncio.gather(
+            *(self.get_pr_fields(org, repo, fields, page_cap) for org, repo in repos),
+            return_exceptions=True,
+        )
+        return dict(zip(repos, results))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+
+def get_many_pr_fields(repos: list, fields: List[str], page_cap=1, concurrency=POOL_SIZE) -> dict:
+    """Blocking wrapper of AsyncGQLClient.get_many_pr_fields, e.g. for batch refreshes."""
+    client = AsyncGQLClient(concurrency=concurrency)
+    try:
+        return asyncio.run(client.get_many_pr_fields(repos, fields, page_cap))
+    finally:
+        client.close()
+
+
+def _to_rows(result: dict, alias="repository"):
     rows = []
-    for edge in result["data"]["repository"]["pullRequests"]["edges"]:
+    for edge in result["data"][alias]["pullRequests"]["edges"]:
         rows.append(edge["node"])
     return rows
 
 
-def _paginated_query(owner, repo, cursor, fields):
-    fields = "\n".join(fields)
-    cursor_part = f', before: "{cursor}"' if cursor else ""
+def _paginated_query(owner, repo, cursor, fields, client=None, priority=INTERACTIVE, states=None):
+    return _gql_request(_pr_page_query(owner, repo, cursor, fields, states), client, PR_PAGE, priority)
+
+
+def _pr_page_query(owner, repo, cursor, fields, states=None) -> dict:
+    """Query for the page of PRs created right before cursor (the newest without one),
+    only PRs in one of states when given."""
+    variables = {"owner": owner, "name": repo, "cursor": cursor, "pageSize": STEP_SIZE, "states": states}
+    return {"query": _pr_page_document(tuple(fields)), "variables": variables}
+
+
+def _batch_page_query(repos, fields) -> dict:
+    """Query for the newest page of PRs of each (owner, repo), aliased r0, r1..."""
+    variables = {"pageSize": STEP_SIZE}
+    for i, (owner, repo) in enumerate(repos):
+        variables[f"owner{i}"] = owner
+        variables[f"name{i}"] = repo
+    return {"query": _batch_page_document(tuple(fields), len(repos)), "variables": variables}
+
+
+def _updated_query(owner, repo, cursor, fields, client=None, priority=INTERACTIVE):
     data = {
-        "query": """
-  query {
-    repository(owner:"%s", name:"%s") {
-      pullRequests(last: %s %s) {
+        "query": _updated_document(tuple(fields)),
+        "variables": {"owner": owner, "name": repo, "cursor": cursor, "pageSize": STEP_SIZE},
+    }
+    return _gql_request(data, client, UPDATED_PAGE, priority)
+
+
+# Query documents are built once per field set and reused, only the
+# variables change between requests.
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _pr_page_document(fields: tuple) -> str:
+    return """
+  query($owner: String!, $name: String!, $cursor: String, $pageSize: Int!, $states: [PullRequestState!]) {
+    %s
+    repository(owner: $owner, name: $name) {
+      pullRequests(last: $pageSize, before: $cursor, states: $states) {
         pageInfo {
           hasPreviousPage
           startCursor
         }
-        edges {
+        %s
+      }
+    }
+  }
+  """ % (RATE_LIMIT_FIELDS, _pr_edges(fields))
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _batch_page_document(fields: tuple, count: int) -> str:
+    params = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(count))
+    selections = "\n".join(
+        """
+    r%d: repository(owner: $owner%d, name: $name%d) {
+      pullRequests(last: $pageSize) {
+        pageInfo {
+          hasPreviousPage
+          startCursor
+        }
+        %s
+      }
+    }""" % (i, i, i, _pr_edges(fields))
+        for i in range(count)
+    )
+    return """
+  query(%s, $pageSize: Int!) {
+    %s
+    %s
+  }
+  """ % (params, RATE_LIMIT_FIELDS, selections)
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _updated_document(fields: tuple) -> str:
+    return """
+  query($owner: String!, $name: String!, $cursor: String, $pageSize: Int!) {
+    %s
+    repository(owner: $owner, name: $name) {
+      pullRequests(first: $pageSize, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC}) {
+        pageInfo {
+          hasNextPage
+          endCursor
+        }
+        %s
+      }
+    }
+  }
+  """ % (RATE_LIMIT_FIELDS, _pr_edges(fields))
+
+
+def _pr_edges(fields: tuple) -> str:
+    return """edges {
           cursor
           node {
             timelineItems(last: 1 , itemTypes: CLOSED_EVENT) {
@@ -71,25 +674,54 @@ def _paginated_query(owner, repo, cursor, fields):
             }
             %s
           }
-        }
-      }
-    }
-  }
-  """
-        % (owner, repo, STEP_SIZE, cursor_part, fields)
-    }
-    return _gql_request(data)
-
-
-def _gql_request(data):
-    headers = {"Authorization": f"bearer {TOKEN}"}
-    res = rq.post(GH_GQL_URL, headers=headers, json=data)
-    data = res.json()
-    if "errors" in data:
-        errs = data["errors"]
-        log.critical(f"Failed GQL query with {errs}")
-        raise GQLError()
-    return data
+        }""" % "\n            ".join(fields)
+
+
+def _classify(res) -> tuple:
+    """Sort a response into (result, reason, retry_after, server_fault).
+
+    reason is None for a usable result (which may still carry GraphQL
+    errors), otherwise it names the failure. retry_after is the number of
+    seconds GitHub asked to wait, server_fault tells whether the failure
+    counts against the circuit breaker. Failures with neither are not
+    worth retrying.
+    """
+    status = res.status_code
+    if status in (403, 429):
+        retry_after = _retry_after(res)
+        secondary = retry_after is not None or "secondary rate limit" in res.text.lower()
+        if secondary:
+            return None, "secondary_rate_limit", retry_after, False
+        return None, f"http_{status}", None, False
+    if status in RETRY_STATUSES:
+        return None, f"http_{status}", _retry_after(res), True
+    if status != 200:
+        return None, f"http_{status}", None, False
+    try:
+        result = res.json()
+    except ValueError:
+        return None, "invalid_json", None, True
+    if not result.get("data") and any(
+        msg in err.get("message", "") for err in result.get("errors", []) for msg in SERVER_ERROR_MESSAGES
+    ):
+        return None, "server_timeout", None, True
+    return result, None, None, False
+
+
+def _retry_after(res):
+    """Seconds to wait according to Retry-After or an exhausted X-RateLimit-Reset, None without either."""
+    retry_after = res.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    reset = res.headers.get("X-RateLimit-Reset")
+    if res.headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+        return max(int(reset) - time.time(), 0)
+    return None
+
+
+def _gql_request(data, client=None, shape=None, priority=INTERACTIVE):
+    client = client or get_client()
+    return client.request(data, shape, priority)
 
 
 class GQLError(Exception):
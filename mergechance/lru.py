@@ -0,0 +1,93 @@
+"""Bounded in-process cache with per-entry expiry, for hot Firestore entries."""
+from collections import Counter, OrderedDict
+import sys
+import threading
+import time
+
+MAX_ENTRIES = 1024
+MAX_BYTES = 64 * 1024 * 1024
+
+
+class TTLCache:
+    """LRU cache bounded by entry count and approximate memory size.
+
+    Each entry expires at its own point in time, expired entries count as
+    misses and are dropped when looked up. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES, sizeof=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or approx_size
+        self.bytes = 0
+        self.counters = Counter()
+        self._entries = OrderedDict()  # key -> (value, expires_at, size), least recently used first
+        self._lock = threading.Lock()
+
+    def get(self, key, now=None):
+        """The value stored for key, None if there is none or it expired."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+            value, expires_at, _ = entry
+            if now >= expires_at:
+                self._remove(key)
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return value
+
+    def put(self, key, value, expires_at):
+        """Store value until expires_at (epoch seconds), evicting the least
+        recently used entries to stay within the bounds."""
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                # would evict everything else and still not fit
+                return
+            self._entries[key] = value, expires_at, size
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.counters["evictions"] += 1
+
+    def pop(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "hits": self.counters["hits"],
+                "misses": self.counters["misses"],
+                "expired": self.counters["expired"],
+                "evictions": self.counters["evictions"],
+            }
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self.bytes -= size
+
+
+def approx_size(obj) -> int:
+    """Rough memory footprint of obj in bytes, following containers."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approx_size(k) + approx_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approx_size(item) for item in obj)
+    return size
@@ -1,15 +1,57 @@
 from flask import Flask, request, render_template, jsonify, send_file
+import hmac
 import logging
 import os
+import socket
+import time
 from tempfile import TemporaryDirectory
 
-from mergechance.db import autocomplete_list, get_from_cache, cache
-from mergechance.gh_gql import get_pr_fields, GQLError
-from mergechance.analysis import ANALYSIS_FIELDS, get_viable_prs, merge_chance, get_median_outsider_time, filter_prs
+from mergechance.db import (
+    acquire_lease,
+    autocomplete_list,
+    TTL,
+    cache,
+    get_cached,
+    get_from_cache,
+    get_prs,
+    get_refresh_state,
+    local_cache,
+    release_lease,
+)
+from mergechance.gh_gql import DEADLINE, get_client, GQLError
+from mergechance.analysis import duration_percentiles, duration_sketches
+from mergechance.fetch import MAX_PAGES, Window, fetch_all, fetch_by_state, fetch_delta
 from mergechance.data_export import prep_tsv
+from mergechance.ratelimit import BACKGROUND, INTERACTIVE
+from mergechance.filters import pr_filter
+from mergechance.blacklist import blacklist
+from mergechance.quantiles import TDigest
+from mergechance.refresh import RefreshPool
+from mergechance.singleflight import CoalesceTimeout, SingleFlight
+from mergechance.tokens import pool as token_pool
 
 app = Flask(__name__)
 log = logging.getLogger(__name__)
+blacklist.start_auto_reload()
+
+# /stats is served only to requests with "Authorization: Bearer STATS_TOKEN",
+# and not at all without one, it shows token suffixes and cache internals
+STATS_TOKEN = os.getenv("STATS_TOKEN", "")
+# fetch MERGED, CLOSED and OPEN PRs concurrently, faster where outsider PRs
+# are rare but with more requests to GitHub for the same numbers
+FETCH_BY_STATE = os.getenv("FETCH_BY_STATE", "0") == "1"
+# concurrent misses for the same repo wait for one computation, in this
+# process through in_flight and across instances through a lease in Firestore
+LEASE_WAIT = 30  # seconds to wait for another instance before fetching anyway
+# seconds, a lease wait and the requests of a fetch running to their deadline
+COALESCE_TIMEOUT = LEASE_WAIT + MAX_PAGES * DEADLINE
+LEASE_TTL = 120  # seconds, longer than a computation takes
+LEASE_POLL = 1  # seconds between cache checks while another instance computes
+INSTANCE_ID = f"{socket.gethostname()}-{os.getpid()}"
+in_flight = SingleFlight()
+# entries past TTL but within db.MAX_STALENESS are served right away and
+# refreshed here, so responses do not wait on GitHub
+refresher = RefreshPool()
 
 
 def sanitize_repo(target: str):
@@ -39,38 +81,106 @@ def _strip_url(target):
 
 
 def _get_chance(target):
-    cached_chance = get_from_cache(target)
-    if cached_chance:
-        chance, median, total, _ = cached_chance
-        log.info(f"Retrieved {target} from cache")
-    else:
-        log.info(f"Retrieving {target} from GH API")
-        # after sanitize_repo it is guaranteed to contain exactly one '/'
-        owner, repo = target.split("/")
-        try:
-            prs = []
-            all_prs = []
-            cursor = None
-            reqs = 0
-            while len(prs) < 50 and reqs < 10:
-                batch, cursor = get_pr_fields(owner, repo, ANALYSIS_FIELDS, page_cap=1, cursor=cursor)
-                batch = filter_prs(batch)
-                all_prs.extend(batch)
-                # because of implied insider calculation it is important to recalculate
-                # on the entire dataset, as it might uncover more information about implied insiders
-                prs = get_viable_prs(all_prs)
-                reqs += 1
-        except GQLError:
-            return None
-        chance = merge_chance(prs)
-        if not chance:
-            return None
-        chance, total = chance
-        median = get_median_outsider_time(prs)
-        if not median:
+    """Return (chance, median, total, sketches, age), age being how many
+    seconds ago the numbers were computed.
+
+    Raises CoalesceTimeout when target is still being computed for another
+    request after COALESCE_TIMEOUT, see still_computing.
+    """
+    cached = get_cached(target)
+    if cached:
+        (chance, median, total, sketches), age = cached
+        if age >= TTL:
+            log.info(f"Serving stale {target}, {age:.0f}s old")
+            refresher.submit(target, lambda: _refresh_chance(target))
+        else:
+            log.info(f"Retrieved {target} from cache")
+        return chance, median, total, sketches, age
+    chance = in_flight.do(target, lambda: _compute_chance(target), timeout=COALESCE_TIMEOUT)
+    return chance and (*chance, 0)
+
+
+def _refresh_chance(target):
+    if get_from_cache(target):
+        # already refreshed, e.g. by another instance
+        return
+    # behind interactive requests for the GitHub rate limit, the entry is served meanwhile
+    in_flight.do(target, lambda: _compute_chance(target, BACKGROUND))
+
+
+def _compute_chance(target, priority=INTERACTIVE):
+    """Fetch and analyse target, once across instances where possible.
+
+    priority - ratelimit.INTERACTIVE or ratelimit.BACKGROUND, for the
+    requests to GitHub
+    """
+    if not acquire_lease(target, INSTANCE_ID, LEASE_TTL):
+        cached_chance = _wait_for_lease(target)
+        if cached_chance:
+            return cached_chance
+    try:
+        return _fetch_chance(target, priority)
+    finally:
+        release_lease(target, INSTANCE_ID)
+
+
+def _wait_for_lease(target):
+    """Wait for the instance holding target's lease to cache it.
+
+    Returns the cached entry, or None when the lease was taken over
+    (it expired or was released without a result) or the wait timed out.
+    """
+    deadline = time.monotonic() + LEASE_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(LEASE_POLL)
+        cached_chance = get_from_cache(target)
+        if cached_chance:
+            log.info(f"Retrieved {target} computed by another instance")
+            return cached_chance
+        if acquire_lease(target, INSTANCE_ID, LEASE_TTL):
             return None
-        cache(target, chance, median, total, prs)
-    return chance, median, total
+    return None
+
+
+def _fetch_chance(target, priority=INTERACTIVE):
+    # after sanitize_repo it is guaranteed to contain exactly one '/'
+    owner, repo = target.split("/")
+    try:
+        fetched = None
+        refresh_state = get_refresh_state(target)
+        if refresh_state:
+            log.info(f"Refreshing {target} with PRs updated since last fetch")
+            fetched = fetch_delta(owner, repo, Window(*refresh_state), priority=priority)
+        if not fetched:
+            log.info(f"Retrieving {target} from GH API")
+            fetch = fetch_by_state if FETCH_BY_STATE else fetch_all
+            fetched = fetch(owner, repo, priority=priority)
+    except GQLError:
+        return None
+    analysis, window = fetched
+    chance = analysis.merge_chance()
+    if not chance:
+        return None
+    chance, total = chance
+    median = analysis.median_time_to_merge()
+    prs = analysis.viable_prs()
+    if not median:
+        return None
+    sketches = {kind: sketch.to_dict() for kind, sketch in duration_sketches(prs).items()}
+    cache(target, chance, median, total, prs, sketches, window.rows, window.synced_at, window.cursor, window.complete)
+    return chance, median, total, sketches
+
+
+def _percentiles(sketches):
+    """{"merge": {"p25": days, ...}, "close": {...}} of serialized duration sketches."""
+    return {kind: duration_percentiles(TDigest.from_dict(sketch)) for kind, sketch in sketches.items()}
+
+
+@app.errorhandler(CoalesceTimeout)
+def still_computing(e):
+    """The repo exists as far as we know, it just is not computed yet."""
+    log.critical(f"Timed out waiting for a computation: {e}")
+    return ("Merge chance for this repo is still being computed, reload in a minute.", 503, {"Retry-After": "60"})
 
 
 @app.route("/autocomplete", methods=["GET"])
@@ -79,6 +189,30 @@ def auto_complete():
     return jsonify(autocomplete_list())
 
 
+@app.route("/stats", methods=["GET"])
+def stats():
+    """Internal counters, e.g. how many PRs each filter rule dropped."""
+    if not _is_internal(request):
+        return ("Not found", 404)
+    return jsonify({
+        "filter_hits": pr_filter.hits(),
+        "blacklist_size": len(blacklist),
+        "tokens": token_pool.stats(),
+        "requests": get_client().stats(),
+        "local_cache": local_cache.stats(),
+        "in_flight": in_flight.stats(),
+        "refresh": refresher.stats(),
+    })
+
+
+def _is_internal(req) -> bool:
+    """Whether req carries STATS_TOKEN, always False when it is not set."""
+    if not STATS_TOKEN:
+        return False
+    expected = f"Bearer {STATS_TOKEN}"
+    return hmac.compare_digest(req.headers.get("Authorization", "").encode(), expected.encode())
+
+
 @app.route("/", methods=["GET"])
 def index():
     return render_template("index.html")
@@ -97,8 +231,19 @@ def target():
             f"Could not calculate merge chance for this repo. It might not exist on GitHub or have zero PRs.",
             404,
         )
-    chance, median, total = chance
-    return render_template("chance.html", chance=chance, repo=target, total=total, median=median)
+    chance, median, total, sketches, age = chance
+    stale_hours = int(age // 3600) if age >= TTL else None
+    response = app.make_response(render_template(
+        "chance.html",
+        chance=chance,
+        repo=target,
+        total=total,
+        median=median,
+        percentiles=_percentiles(sketches),
+        stale_hours=stale_hours,
+    ))
+    response.headers["Age"] = str(int(age))
+    return response
 
 
 @app.route("/badge", methods=["GET"])
@@ -114,10 +259,12 @@ def badge():
             f"Could not calculate merge chance for this repo. It might not exist on GitHub or have zero PRs.",
             404,
         )
-    chance, median, _ = chance
-    return jsonify(
+    chance, median, _, _, age = chance
+    response = jsonify(
         {"schemaVersion": 1, "label": "Merge Chance", "message": f"{chance}% after {median} days"}
     )
+    response.headers["Age"] = str(int(age))
+    return response
 
 
 @app.route("/data", methods=["GET"])
@@ -127,10 +274,9 @@ def download_data():
         target = sanitize_repo(target)
     except ValueError:
         return ("Invalid repo name. Must be in format 'owner/name'.", 400)
-    data = get_from_cache(target)
-    if not data:
+    prs = get_prs(target)
+    if prs is None:
         return ("Repo not found", 404)
-    _, _, _, prs = data
     if not prs:
         return ("No data for this repo", 404)
     content = prep_tsv(prs)
@@ -0,0 +1,12 @@
+"""Bring cache entries written in older layouts up to date, see
+db.migrate_cache. Run once after deploying:
+
+    python -m mergechance.migrate
+"""
+import logging
+
+from mergechance.db import migrate_cache
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"Migrated {migrate_cache()} cache entries")
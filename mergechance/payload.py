@@ -0,0 +1,57 @@
+"""Layout of the PR payload cached next to a repo's summary.
+
+The summary document (chance, median, total, ...) is what /badge and
+/target read, the PRs behind it are stored apart, split into chunks of
+CHUNK_SIZE PRs that each fit well within Firestore's 1 MiB document limit.
+Chunks hold their PRs encoded with mergechance.codec.
+"""
+from mergechance import codec
+
+# a PR takes ~25 bytes encoded, titles (at most 256 characters) dominate
+CHUNK_SIZE = 1000
+# fields entries cached before the split kept the PRs in
+LEGACY_FIELDS = ("prs", "dataset", "viable")
+
+
+def split(dataset, prs, chunk_size=CHUNK_SIZE) -> list:
+    """Split dataset into chunk documents.
+
+    prs - the viable PRs, a subset of dataset, recorded per chunk as
+        indexes into the chunk
+    """
+    viable = {id(pr) for pr in prs}
+    chunks = []
+    for start in range(0, len(dataset), chunk_size):
+        rows = dataset[start:start + chunk_size]
+        chunks.append({
+            "data": codec.encode(rows),
+            "viable": [i for i, pr in enumerate(rows) if id(pr) in viable],
+        })
+    return chunks
+
+
+def join(chunks) -> tuple:
+    """Return (dataset, viable PRs) from chunk documents, in order."""
+    dataset = []
+    prs = []
+    for chunk in chunks:
+        # chunks written before the codec keep their PRs as plain dicts
+        rows = codec.decode(chunk["data"]) if "data" in chunk else chunk.get("dataset", [])
+        dataset.extend(rows)
+        prs.extend(rows[i] for i in chunk.get("viable", []))
+    return dataset, prs
+
+
+def from_legacy(entry) -> tuple:
+    """Return (dataset, viable PRs) kept inline in an entry cached before
+    the split. Entries older than delta refreshes have no dataset, only
+    the viable PRs."""
+    if "viable" in entry:
+        dataset = entry.get("dataset", [])
+        return dataset, [dataset[i] for i in entry["viable"]]
+    prs = entry.get("prs", [])
+    return prs, prs
+
+
+def is_legacy(entry) -> bool:
+    return any(field in entry for field in LEGACY_FIELDS)
@@ -0,0 +1,177 @@
+"""Columnar, array backed representation of a batch of PRs.
+
+Build it with analysis.to_batch from gh_gql rows, the analysis functions
+accept it wherever they accept a list of PR dicts. Those only import this
+module (and NumPy) once a PRBatch is built, see prfields.is_batch.
+
+The web app works on PR dicts only, NumPy is a benchmark requirement
+(benchmarks/requirements.txt) and PRBatch is there for offline analysis
+of large repos.
+"""
+from enum import IntEnum
+import time
+
+import numpy as np
+
+from mergechance.prfields import closer_login
+
+NO_AUTHOR = -1  # author/closer id of removed GitHub users
+NO_TS = -1  # closed time of PRs that are still open
+
+
+class State(IntEnum):
+    OPEN = 0
+    CLOSED = 1
+    MERGED = 2
+
+
+class Association(IntEnum):
+    NONE = 0
+    OWNER = 1
+    MEMBER = 2
+    COLLABORATOR = 3
+    CONTRIBUTOR = 4
+    FIRST_TIME_CONTRIBUTOR = 5
+    FIRST_TIMER = 6
+    MANNEQUIN = 7
+
+    @classmethod
+    def code(cls, name):
+        """Unknown or missing associations are treated as NONE."""
+        if not name:
+            return cls.NONE
+        return cls.__members__.get(name, cls.NONE)
+
+
+class PRBatch:
+    """PR fields kept as parallel NumPy arrays.
+
+    state - State codes
+    created, closed - int64 epoch seconds, closed is NO_TS for open PRs
+    association - Association codes
+    author, closer - ids into logins, closer is the actor of the last
+        closed event
+    title, permalink - plain lists, only needed by filtering and export
+    """
+
+    def __init__(self, state, created, closed, association, author, closer, logins, title, permalink):
+        self.state = np.asarray(state, dtype=np.int8)
+        self.created = np.asarray(created, dtype=np.int64)
+        self.closed = np.asarray(closed, dtype=np.int64)
+        self.association = np.asarray(association, dtype=np.int8)
+        self.author = np.asarray(author, dtype=np.int32)
+        self.closer = np.asarray(closer, dtype=np.int32)
+        self.logins = logins
+        self._login_ids = {login: i for i, login in enumerate(logins)}
+        self.title = title
+        self.permalink = permalink
+
+    @classmethod
+    def from_rows(cls, rows: list, created: list, closed: list):
+        """Build a batch from gh_gql rows and their parsed timestamps
+        (closed is None for open PRs)."""
+        logins = []
+        ids = {}
+
+        def intern(login):
+            if login is None:
+                return NO_AUTHOR
+            if login not in ids:
+                ids[login] = len(logins)
+                logins.append(login)
+            return ids[login]
+
+        return cls(
+            state=[State[pr["state"]] for pr in rows],
+            created=created,
+            closed=[NO_TS if ts is None else ts for ts in closed],
+            association=[Association.code(pr.get("authorAssociation")) for pr in rows],
+            author=[intern(pr["author"]["login"] if pr.get("author") else None) for pr in rows],
+            closer=[intern(closer_login(pr)) for pr in rows],
+            logins=logins,
+            title=[pr.get("title") or "" for pr in rows],
+            permalink=[pr.get("permalink") for pr in rows],
+        )
+
+    @classmethod
+    def concat(cls, batches: list):
+        """Concatenate batches, re-interning their logins into one table."""
+        logins = []
+        ids = {}
+        authors = []
+        closers = []
+        for batch in batches:
+            for login in batch.logins:
+                if login not in ids:
+                    ids[login] = len(logins)
+                    logins.append(login)
+            # last slot maps NO_AUTHOR to itself
+            remap = np.array([ids[login] for login in batch.logins] + [NO_AUTHOR], dtype=np.int32)
+            authors.append(remap[batch.author])
+            closers.append(remap[batch.closer])
+        return cls(
+            state=np.concatenate([b.state for b in batches]) if batches else [],
+            created=np.concatenate([b.created for b in batches]) if batches else [],
+            closed=np.concatenate([b.closed for b in batches]) if batches else [],
+            association=np.concatenate([b.association for b in batches]) if batches else [],
+            author=np.concatenate(authors) if batches else [],
+            closer=np.concatenate(closers) if batches else [],
+            logins=logins,
+            title=[t for b in batches for t in b.title],
+            permalink=[p for b in batches for p in b.permalink],
+        )
+
+    def __len__(self):
+        return len(self.state)
+
+    def take(self, mask):
+        """Return a batch of the rows selected by a boolean mask, sharing the login table."""
+        index = np.flatnonzero(mask)
+        return PRBatch(
+            state=self.state[index],
+            created=self.created[index],
+            closed=self.closed[index],
+            association=self.association[index],
+            author=self.author[index],
+            closer=self.closer[index],
+            logins=self.logins,
+            title=[self.title[i] for i in index],
+            permalink=[self.permalink[i] for i in index],
+        )
+
+    def login_ids(self, logins) -> np.ndarray:
+        """Ids of those logins which are present in this batch."""
+        return np.array([self._login_ids[l] for l in logins if l in self._login_ids], dtype=np.int32)
+
+    def merge_counts(self) -> np.ndarray:
+        """Number of merged PRs per login id."""
+        merged = (self.state == State.MERGED) & (self.author != NO_AUTHOR)
+        return np.bincount(self.author[merged], minlength=len(self.logins))
+
+    def stale_mask(self, now, threshold) -> np.ndarray:
+        return (self.state == State.OPEN) & ((now - self.created) > threshold)
+
+    def to_rows(self) -> list:
+        """Back to GitHub GraphQL shaped dicts (timestamps at second precision)."""
+        rows = []
+        for i in range(len(self)):
+            author = self.author[i]
+            closer = self.closer[i]
+            closed = self.closed[i]
+            rows.append({
+                "state": State(self.state[i]).name,
+                "createdAt": _to_iso(self.created[i]),
+                "closedAt": None if closed == NO_TS else _to_iso(closed),
+                "authorAssociation": Association(self.association[i]).name,
+                "author": None if author == NO_AUTHOR else {"login": self.logins[author]},
+                "timelineItems": {"edges": [] if closer == NO_AUTHOR else [
+                    {"node": {"actor": {"login": self.logins[closer]}}}
+                ]},
+                "title": self.title[i],
+                "permalink": self.permalink[i],
+            })
+        return rows
+
+
+def _to_iso(ts):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(int(ts)))
@@ -0,0 +1,30 @@
+"""PR helpers shared by the PR dict and PRBatch code paths.
+
+Kept free of NumPy: the web app only handles PR dicts, and importing
+NumPy (through mergechance.prbatch) adds noticeably to its cold start.
+"""
+import sys
+
+
+def is_batch(prs) -> bool:
+    """Whether prs is a PRBatch rather than a list of PR dicts.
+
+    There can be no PRBatch before mergechance.prbatch is imported, so
+    checking does not import it.
+    """
+    prbatch = sys.modules.get("mergechance.prbatch")
+    return prbatch is not None and isinstance(prs, prbatch.PRBatch)
+
+
+def closer_login(pr):
+    """Login of whoever closed the PR, None if unknown."""
+    timeline = pr.get("timelineItems")
+    if not timeline:
+        return None
+    edges = timeline.get("edges") or []
+    if not edges:
+        return None
+    actor = edges[-1]["node"].get("actor")
+    if not actor:
+        return None
+    return actor.get("login")
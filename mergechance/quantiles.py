@@ -0,0 +1,131 @@
+"""Mergeable streaming quantile sketch (merging t-digest).
+
+Memory stays bounded by the compression parameter no matter how many
+values are added, sketches built per page can be merged, and a sketch
+serializes to a small dict which fits in a cache document.
+"""
+from bisect import bisect_right
+import math
+
+DEFAULT_COMPRESSION = 100
+
+
+class TDigest:
+    """t-digest with the k1 (arcsine) scale function, accurate at the tails."""
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = []
+        self.weights = []
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._buffer = []
+        self._buffer_size = 5 * compression
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value, weight=1):
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def update(self, values):
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other: "TDigest"):
+        """Fold another sketch into this one."""
+        other._compress()
+        self._buffer.extend(zip(other.means, other.weights))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimated value at quantile q (0..1), None for an empty sketch."""
+        self._compress()
+        if not self.count:
+            return None
+        means, weights = self.means, self.weights
+        if len(means) == 1:
+            return means[0]
+        target = q * self.count
+        # centroid i is assumed to be centered at cumulative weight centers[i]
+        centers = []
+        cumulative = 0
+        for weight in weights:
+            centers.append(cumulative + weight / 2)
+            cumulative += weight
+        if target <= centers[0]:
+            return _interpolate(0, self.min, centers[0], means[0], target)
+        if target >= centers[-1]:
+            return _interpolate(centers[-1], means[-1], self.count, self.max, target)
+        i = bisect_right(centers, target) - 1
+        return _interpolate(centers[i], means[i], centers[i + 1], means[i + 1], target)
+
+    def to_dict(self) -> dict:
+        self._compress()
+        return {
+            "compression": self.compression,
+            "means": list(self.means),
+            "weights": list(self.weights),
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TDigest":
+        digest = cls(data["compression"])
+        digest.means = list(data["means"])
+        digest.weights = list(data["weights"])
+        digest.count = sum(digest.weights)
+        if digest.count:
+            digest.min = data["min"]
+            digest.max = data["max"]
+        return digest
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        items = sorted(list(zip(self.means, self.weights)) + self._buffer)
+        self._buffer = []
+        total = self.count
+        means = []
+        weights = []
+        mean, weight = items[0]
+        done = 0  # weight of the centroids already emitted
+        limit = total * self._k_inverse(self._k(0) + 1)
+        for next_mean, next_weight in items[1:]:
+            if done + weight + next_weight <= limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+                continue
+            means.append(mean)
+            weights.append(weight)
+            done += weight
+            limit = total * self._k_inverse(self._k(done / total) + 1)
+            mean, weight = next_mean, next_weight
+        means.append(mean)
+        weights.append(weight)
+        self.means = means
+        self.weights = weights
+
+    def _k(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0), 1) - 1)
+
+    def _k_inverse(self, k):
+        return (math.sin(min(k * 2 * math.pi / self.compression, math.pi / 2)) + 1) / 2
+
+
+def _interpolate(x0, y0, x1, y1, x):
+    if x1 == x0:
+        return y0
+    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
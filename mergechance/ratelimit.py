@@ -0,0 +1,145 @@
+"""Pacing of GitHub GraphQL requests within the hourly point budget.
+
+Every query asks GitHub for its rateLimit { cost remaining resetAt }, the
+RateLimitScheduler learns the cost of each query shape from it and lets
+requests through at a pace which spreads the budget over the hour.
+Interactive requests go first, background refreshes wait while
+interactive ones are queued or when the budget gets low. Once the budget
+is spent, requests sleep until it resets instead of failing.
+"""
+import calendar
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+HOURLY_BUDGET = 5000  # GitHub's GraphQL points per hour for a user token
+WINDOW = 60 * 60
+BURST = 500  # points that can be spent at once before pacing kicks in
+BACKGROUND_RESERVE = 500  # points background requests leave for interactive ones
+DEFAULT_COST = 1  # estimate for query shapes not seen yet
+INTERACTIVE_MAX_WAIT = 60  # seconds, a user is waiting for the response
+
+RATE_LIMIT_FIELDS = """
+    rateLimit {
+      cost
+      remaining
+      resetAt
+    }
+"""
+
+
+class RateLimitError(Exception):
+    """Not enough budget within the time the caller was willing to wait."""
+
+
+class RateLimitScheduler:
+    """Token bucket refilled at budget/window points per second, capped at burst,
+    combined with the remaining budget GitHub reports."""
+
+    def __init__(self, budget=HOURLY_BUDGET, window=WINDOW, burst=BURST, reserve=BACKGROUND_RESERVE):
+        self.budget = budget
+        self.rate = budget / window
+        self.burst = burst
+        self.reserve = reserve
+        self.remaining = budget
+        self.reset_at = None
+        self.costs = {}
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._interactive_waiting = 0
+        self._cond = threading.Condition()
+
+    def estimate(self, shape) -> float:
+        return self.costs.get(shape, DEFAULT_COST)
+
+    def acquire(self, shape, priority=INTERACTIVE, max_wait=None):
+        """Block until a query of this shape may be sent.
+
+        max_wait - seconds, RateLimitError is raised when the wait would be
+        longer, by default INTERACTIVE_MAX_WAIT for interactive requests,
+        unlimited for background ones
+        """
+        if max_wait is None and priority == INTERACTIVE:
+            max_wait = INTERACTIVE_MAX_WAIT
+        cost = self.estimate(shape)
+        deadline = None if max_wait is None else time.monotonic() + max_wait
+        with self._cond:
+            if priority == INTERACTIVE:
+                self._interactive_waiting += 1
+            try:
+                while True:
+                    wait = self._wait_time(cost, priority)
+                    if wait <= 0:
+                        self._tokens -= cost
+                        self.remaining -= cost
+                        return
+                    if deadline is not None and time.monotonic() + wait > deadline:
+                        raise RateLimitError(f"GitHub rate limit budget exhausted, would wait {wait:.0f}s")
+                    self._cond.wait(wait)
+            finally:
+                if priority == INTERACTIVE:
+                    self._interactive_waiting -= 1
+                    self._cond.notify_all()
+
+    def record(self, shape, rate_limit: dict):
+        """Update budget and cost estimate from a response's rateLimit object."""
+        if not rate_limit:
+            return
+        with self._cond:
+            cost = rate_limit.get("cost")
+            if cost is not None:
+                previous = self.costs.get(shape)
+                self.costs[shape] = cost if previous is None else 0.8 * previous + 0.2 * cost
+            if rate_limit.get("remaining") is not None:
+                self.remaining = rate_limit["remaining"]
+            if rate_limit.get("resetAt"):
+                self.reset_at = _parse_iso(rate_limit["resetAt"])
+            self._cond.notify_all()
+
+    def exhausted(self, reset_at=None):
+        """GitHub refused a request for lack of budget, hold requests until reset_at (epoch)."""
+        with self._cond:
+            self.remaining = 0
+            if reset_at:
+                self.reset_at = reset_at
+            log.warning(f"GitHub rate limit exhausted until {self.reset_at}")
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "remaining": self.remaining,
+                "reset_at": self.reset_at,
+                "tokens": round(self._tokens, 2),
+                "interactive_waiting": self._interactive_waiting,
+                "costs": dict(self.costs),
+            }
+
+    def _wait_time(self, cost, priority):
+        """Seconds until a request of this cost and priority may go, <= 0 for now."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        budget_wait = 0
+        if self.reset_at is not None and time.time() >= self.reset_at:
+            # a new window started, the next response corrects the estimate
+            self.remaining = self.budget
+            self.reset_at = None
+        needed = cost
+        if priority == BACKGROUND:
+            if self._interactive_waiting:
+                return 1
+            needed += self.reserve
+        if self.remaining < needed:
+            budget_wait = (self.reset_at - time.time()) if self.reset_at else WINDOW / 60
+        token_wait = (cost - self._tokens) / self.rate
+        return max(budget_wait, token_wait)
+
+
+def _parse_iso(ts):
+    return calendar.timegm(time.strptime(ts, "%Y-%m-%dT%H:%M:%SZ"))
+
@@ -0,0 +1,73 @@
+"""Background refreshes of stale cache entries."""
+from collections import Counter
+import logging
+import queue
+import threading
+
+WORKERS = 2
+QUEUE_SIZE = 100
+
+log = logging.getLogger(__name__)
+
+
+class RefreshPool:
+    """Worker threads running refreshes off the request path.
+
+    At most one refresh per key is queued or running at a time, and the
+    queue is bounded: when it is full new refreshes are dropped, the
+    entry is still served stale and the next request tries again.
+    Workers are started on the first submit.
+    """
+
+    def __init__(self, workers=WORKERS, queue_size=QUEUE_SIZE):
+        self.workers = workers
+        self.counters = Counter()
+        self._queue = queue.Queue(queue_size)
+        self._pending = set()
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn) -> bool:
+        """Queue fn() as the refresh of key, False if it was not queued
+        because key is already pending or the queue is full."""
+        with self._lock:
+            if key in self._pending:
+                self.counters["deduped"] += 1
+                return False
+            try:
+                self._queue.put_nowait((key, fn))
+            except queue.Full:
+                self.counters["dropped"] += 1
+                return False
+            self._pending.add(key)
+            self.counters["queued"] += 1
+            self._start()
+        return True
+
+    def join(self):
+        """Wait until every queued refresh has run."""
+        self._queue.join()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"pending": len(self._pending), **self.counters}
+
+    def _start(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f"refresh-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            key, fn = self._queue.get()
+            try:
+                fn()
+                outcome = "done"
+            except Exception as e:
+                log.critical(f"Refreshing {key} failed: {e}")
+                outcome = "failed"
+            with self._lock:
+                self._pending.discard(key)
+                self.counters[outcome] += 1
+            self._queue.task_done()
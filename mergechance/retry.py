@@ -0,0 +1,84 @@
+"""Retry policy and circuit breaker for requests to GitHub."""
+import random
+import threading
+import time
+
+MAX_ATTEMPTS = 4
+BASE_DELAY = 0.5  # seconds, doubled with every attempt
+MAX_DELAY = 8  # seconds
+FAILURE_THRESHOLD = 5  # consecutive failures which open the circuit
+COOLDOWN = 30  # seconds the circuit stays open
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, capped at max_delay.
+
+    A Retry-After given by the server takes precedence.
+    """
+
+    def __init__(self, max_attempts=MAX_ATTEMPTS, base_delay=BASE_DELAY, max_delay=MAX_DELAY):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after=None) -> float:
+        """Seconds to wait before retry number attempt (1 for the first retry)."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitOpenError(Exception):
+    """GitHub is failing, requests are rejected without being sent."""
+
+
+class CircuitBreaker:
+    """Opens after threshold consecutive failures and rejects requests for cooldown
+    seconds, then lets a single trial request through (half open). The
+    trial's outcome closes or re-opens the circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be sent now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    raise CircuitOpenError(f"Circuit open after {self._failures} failures")
+                self.state = self.HALF_OPEN
+                self._trial_running = False
+            if self._trial_running:
+                raise CircuitOpenError("Circuit half open, trial request in flight")
+            self._trial_running = True
+
+    def cancel(self):
+        """The request let through by before_request was not sent after all."""
+        with self._lock:
+            self._trial_running = False
+
+    def success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._trial_running = False
+
+    def failure(self):
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self._failures >= self.threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -0,0 +1,62 @@
+"""Coalescing of concurrent calls for the same key within a process."""
+from collections import Counter
+import threading
+
+
+class CoalesceTimeout(Exception):
+    """The call this request waited for did not finish in time."""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Runs one call per key at a time, concurrent callers for the same
+    key wait for it and get its result (or exception) instead of running
+    their own."""
+
+    def __init__(self):
+        self.counters = Counter()
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, timeout=None):
+        """Return fn(), or the result of the fn() already running for key.
+
+        timeout - seconds to wait for a running call, CoalesceTimeout is
+            raised after that (the call itself goes on)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.counters["calls"] += 1
+            else:
+                self.counters["coalesced"] += 1
+        if not leader:
+            if not call.done.wait(timeout):
+                with self._lock:
+                    self.counters["timeouts"] += 1
+                raise CoalesceTimeout(f"Gave up waiting for {key} after {timeout}s")
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"in_flight": len(self._calls), **self.counters}
@@ -0,0 +1,84 @@
+"""Incremental parsing of large JSON responses.
+
+Uses ijson when it is installed (pip install ijson), so only one item of
+the streamed array is in memory at a time. Without it the document is
+loaded whole and the items are handed out the same way, with a warning
+logged the first time.
+"""
+import json
+import logging
+
+try:
+    import ijson
+except ImportError:  # optional, see module docstring
+    ijson = None
+
+log = logging.getLogger(__name__)
+_warned = False
+
+
+def iter_items(fp, prefix: str, rest: dict):
+    """Yield the items of the array at prefix one at a time.
+
+    fp - binary file-like object, e.g. the raw stream of a response
+    prefix - dotted path of the array, e.g. "data.repository.pullRequests.edges"
+    rest - filled with the rest of the document, the array left empty,
+        once all items have been yielded
+    """
+    if ijson is None:
+        _warn_loaded()
+        yield from _iter_loaded(fp, prefix, rest)
+        return
+    try:
+        yield from _iter_parsed(fp, prefix, rest)
+    except ijson.JSONError as e:
+        # same as json.load's errors, so callers handle one exception type
+        raise ValueError(str(e)) from e
+
+
+def _iter_parsed(fp, prefix, rest):
+    item_prefix = f"{prefix}.item"
+    document = ijson.ObjectBuilder()
+    item = None
+    depth = 0
+    for event_prefix, event, value in ijson.parse(fp, use_float=True):
+        if item is None and event_prefix != item_prefix:
+            document.event(event, value)
+            continue
+        if item is None:
+            if event not in ("start_map", "start_array"):
+                # scalar item
+                yield value
+                continue
+            item = ijson.ObjectBuilder()
+        item.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if not depth:
+                yield item.value
+                item = None
+    if hasattr(document, "value"):
+        rest.update(document.value)
+
+
+def _warn_loaded():
+    global _warned
+    if not _warned:
+        _warned = True
+        log.warning("ijson is not installed, responses are loaded whole instead of streamed (pip install ijson)")
+
+
+def _iter_loaded(fp, prefix, rest):
+    document = json.load(fp)
+    rest.update(document)
+    parent = document
+    keys = prefix.split(".")
+    for key in keys[:-1]:
+        parent = parent.get(key) if isinstance(parent, dict) else None
+        if parent is None:
+            return
+    items = parent.get(keys[-1]) or []
+    parent[keys[-1]] = []
+    yield from items
@@ -0,0 +1,85 @@
+"""Seeded generator of synthetic, GraphQL shaped PR nodes.
+
+Used by the benchmarks and tests, the distributions roughly follow what
+gh_gql returns for busy open-source repositories: most PRs are merged,
+a handful of authors open most of them, members merge their own work
+and some outsiders close their PRs themselves.
+"""
+from itertools import accumulate
+import random
+import time
+
+DAY = 24 * 60 * 60
+
+STATES = ["MERGED", "CLOSED", "OPEN"]
+STATE_WEIGHTS = [0.6, 0.25, 0.15]
+
+ASSOCIATIONS = ["MEMBER", "OWNER", "COLLABORATOR", "CONTRIBUTOR", "FIRST_TIME_CONTRIBUTOR", "NONE"]
+ASSOCIATION_WEIGHTS = [0.25, 0.02, 0.05, 0.3, 0.13, 0.25]
+
+TITLE_VERBS = ["Fix", "Add", "Remove", "Refactor", "Improve", "Support", "Update", "Document"]
+TITLE_OBJECTS = ["crash on startup", "parser", "README", "typo in docs", "CI config", "memory leak",
+                 "dependency versions", "error messages", "tests", "logging", "API docs", "cache"]
+
+SELF_CLOSED = 0.3  # share of CLOSED PRs closed by their own author
+GHOST = 0.01  # share of PRs whose author account was removed
+
+
+def generate_prs(n: int, seed=0, now=None, authors=None, span_days=3 * 365) -> list:
+    """Return n PR nodes, oldest first, as gh_gql rows with all of SYNC_FIELDS.
+
+    authors - size of the author pool, defaults to n // 5, authors are
+        picked with a heavy-tailed distribution so some of them are
+        repeat contributors (and become implied insiders)
+    span_days - PRs are created uniformly over this many days before now
+    """
+    rnd = random.Random(seed)
+    now = int(now if now is not None else time.time())
+    authors = authors or max(n // 5, 1)
+    pool = [_author(rnd, i) for i in range(authors)]
+    # Zipf distributed authorship, the i-th author opens ~1/i as many PRs as the first
+    cum_weights = list(accumulate(1 / (i + 1) for i in range(authors)))
+    maintainers = [login for login, association in pool if association in {"MEMBER", "OWNER"}] or ["maintainer"]
+    created = sorted(now - int(rnd.uniform(0, span_days * DAY)) for _ in range(n))
+    prs = []
+    for number, created_at in enumerate(created, 1):
+        login, association = rnd.choices(pool, cum_weights=cum_weights)[0]
+        state = rnd.choices(STATES, STATE_WEIGHTS)[0]
+        closed_at = None
+        closer = None
+        if state != "OPEN":
+            # lognormal time to close, median around 2 days
+            closed_at = min(created_at + int(rnd.lognormvariate(12, 1.5)), now)
+            if state == "CLOSED" and rnd.random() < SELF_CLOSED:
+                closer = login
+            else:
+                closer = rnd.choice(maintainers)
+        author = None if rnd.random() < GHOST else {"login": login}
+        prs.append({
+            "timelineItems": {"edges": [{"node": {"actor": {"login": closer}}}] if closer else []},
+            "author": author,
+            "closedAt": _iso(closed_at),
+            "createdAt": _iso(created_at),
+            "authorAssociation": association,
+            "state": state,
+            "permalink": f"https://github.com/synthetic/repo/pull/{number}",
+            "title": _title(rnd),
+            "updatedAt": _iso(closed_at or created_at),
+        })
+    return prs
+
+
+def _author(rnd, i):
+    return f"user{i}", rnd.choices(ASSOCIATIONS, ASSOCIATION_WEIGHTS)[0]
+
+
+def _title(rnd):
+    if rnd.random() < 0.02:
+        return "test"
+    return f"{rnd.choice(TITLE_VERBS)} {rnd.choice(TITLE_OBJECTS)}"
+
+
+def _iso(ts):
+    if ts is None:
+        return None
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
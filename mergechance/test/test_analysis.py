@@ -5,13 +5,32 @@ from mergechance.analysis import (
     get_open,
     merge_chance,
     median_time_to_merge,
-    get_implied_insiders
+    get_implied_insiders,
+    get_viable_prs,
+    InsiderIndex,
+    IncrementalAnalysis,
+    get_median_outsider_time,
+    created_ts,
+    closed_ts,
+    _to_ts,
+    filter_prs,
+    to_batch,
+    duration_sketches,
+    duration_percentiles,
 )
+from dateutil import parser
 
+from importlib.util import find_spec
 import datetime
+import random
+import subprocess
+import sys
 
 import pytest
 
+# PRBatch needs NumPy, a benchmark requirement
+needs_numpy = pytest.mark.skipif(find_spec("numpy") is None, reason="NumPy is not installed")
+
 
 @pytest.fixture()
 def pr_open_outsider():
@@ -235,3 +254,166 @@ def test_implied_insider(pr_merged_outsider):
     prs = [pr_merged_outsider] * 6
     implied = get_implied_insiders(prs)
     assert {'author1'} == implied
+
+
+def test_implied_insider_below_threshold(pr_merged_outsider, pr_closed_outsider):
+    prs = [pr_merged_outsider] * 5 + [pr_closed_outsider] * 3
+    assert get_implied_insiders(prs) == set()
+
+
+def test_implied_insider_ghost_author(pr_merged_outsider):
+    ghost = dict(pr_merged_outsider, author=None)
+    assert get_implied_insiders([ghost] * 6) == set()
+
+
+def test_insider_index_incremental(pr_merged_outsider):
+    index = InsiderIndex()
+    assert index.add([pr_merged_outsider] * 3) == set()
+    assert index.add([pr_merged_outsider] * 3) == {'author1'}
+    # already an insider, not promoted again
+    assert index.add([pr_merged_outsider]) == set()
+    assert index.insiders == {'author1'}
+    assert index.merge_counts['author1'] == 7
+
+
+def test_viable_prs_with_index(pr_merged_outsider):
+    prs = [pr_merged_outsider] * 6
+    index = InsiderIndex()
+    index.add(prs)
+    assert get_viable_prs(prs, index.insiders) == []
+    assert get_viable_prs(prs, set()) == prs
+
+
+def _random_prs(n, seed):
+    rnd = random.Random(seed)
+    now = datetime.datetime.now()
+    prs = []
+    for number in range(n):
+        created = now - datetime.timedelta(days=rnd.uniform(0, 200))
+        state = rnd.choice(["MERGED", "MERGED", "CLOSED", "OPEN"])
+        closed = created + datetime.timedelta(hours=rnd.uniform(1, 500))
+        author = rnd.choice([None] + [{"login": f"user{i}"} for i in range(8)])
+        closer = rnd.choice([None, author, {"login": "maintainer"}])
+        prs.append({
+            "title": rnd.choice(["Fix crash", "Update README", "fix typo", "test", "Add feature"]),
+            "timelineItems": {"edges": [{"node": {"actor": closer}}]},
+            "permalink": f"https://github.com/o/r/pull/{number}",
+            "createdAt": created.isoformat(),
+            "closedAt": None if state == "OPEN" else closed.isoformat(),
+            "authorAssociation": rnd.choice(["MEMBER", "CONTRIBUTOR", "NONE"]),
+            "state": state,
+            "author": author,
+        })
+    return prs
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_analysis_matches_full_recompute(seed):
+    prs = _random_prs(300, seed)
+    analysis = IncrementalAnalysis()
+    for start in range(0, len(prs), 50):
+        analysis.add(prs[start:start + 50])
+        seen = prs[:start + 50]
+        viable = get_viable_prs(seen)
+        assert analysis.viable_prs() == viable
+        assert analysis.merge_chance() == merge_chance(viable)
+        assert analysis.median_time_to_merge() == get_median_outsider_time(viable)
+
+
+def test_incremental_analysis_promotion(pr_merged_outsider, pr_closed_outsider):
+    analysis = IncrementalAnalysis()
+    analysis.add([pr_closed_outsider] + [pr_merged_outsider] * 5)
+    assert analysis.viable_count == 6
+    assert analysis.counts["MERGED"] == 5
+    analysis.add([pr_merged_outsider])
+    # author1 became an implied insider, none of their PRs count anymore
+    assert analysis.viable_count == 0
+    assert analysis.merge_chance() is None
+    assert analysis.median_time_to_merge() is None
+
+
+@pytest.mark.parametrize("ts", [
+    "2021-01-31T12:00:00Z",
+    "1999-12-31T23:59:59Z",
+    "2020-02-29T00:00:01Z",
+    "2021-01-31T12:00:00+02:00",
+    "2021-01-31T12:00:00.123Z",
+])
+def test_to_ts_matches_dateutil(ts):
+    assert _to_ts(ts) == parser.parse(ts).timestamp()
+
+
+def test_to_ts_rejects_out_of_range_fields():
+    # the fast path must not roll this over into March
+    with pytest.raises(ValueError):
+        _to_ts("2021-02-30T00:00:00Z")
+
+
+def test_timestamps_parsed_once(pr_merged_1day, pr_open_outsider):
+    created = created_ts(pr_merged_1day)
+    pr_merged_1day["createdAt"] = "not a date anymore"
+    assert created_ts(pr_merged_1day) == created
+    assert closed_ts(pr_merged_1day) > created
+    assert closed_ts(pr_open_outsider) is None
+
+
+@needs_numpy
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_matches_dict_api(seed):
+    prs = _random_prs(300, seed)
+    batch = to_batch(prs)
+    assert get_implied_insiders(batch) == get_implied_insiders(prs)
+
+    filtered = filter_prs(prs)
+    filtered_batch = filter_prs(batch)
+    assert filtered_batch.permalink == [pr.get("permalink") for pr in filtered]
+    assert len(filtered_batch) == len(filtered)
+
+    viable = get_viable_prs(filtered)
+    viable_batch = get_viable_prs(filtered_batch)
+    assert len(viable_batch) == len(viable)
+    assert merge_chance(viable_batch) == merge_chance(viable)
+    assert get_median_outsider_time(viable_batch) == pytest.approx(get_median_outsider_time(viable), abs=0.01)
+
+
+@needs_numpy
+def test_batch_empty():
+    batch = to_batch([])
+    assert merge_chance(batch) is None
+    assert get_median_outsider_time(batch) is None
+    assert len(get_viable_prs(filter_prs(batch))) == 0
+
+
+def test_duration_percentiles(pr_merged_1day, pr_merged_2day, pr_merged_3day, pr_closed_outsider):
+    prs = [pr_merged_1day, pr_merged_2day, pr_merged_3day, pr_closed_outsider]
+    sketches = duration_sketches(prs)
+    assert sketches["merge"].count == 3
+    assert sketches["close"].count == 1
+    percentiles = duration_percentiles(sketches["merge"])
+    assert list(percentiles) == ["p25", "p50", "p75", "p90", "p99"]
+    assert percentiles["p50"] == pytest.approx(median_time_to_merge(prs[:3]), abs=0.01)
+
+
+@needs_numpy
+def test_batch_duration_percentiles(pr_merged_1day, pr_merged_2day, pr_merged_3day, pr_closed_outsider):
+    prs = [pr_merged_1day, pr_merged_2day, pr_merged_3day, pr_closed_outsider]
+    percentiles = duration_percentiles(duration_sketches(prs)["merge"])
+    batch_sketches = duration_sketches(to_batch(prs))
+    assert duration_percentiles(batch_sketches["merge"])["p50"] == pytest.approx(percentiles["p50"], abs=0.01)
+
+
+def test_duration_percentiles_empty():
+    assert duration_percentiles(duration_sketches([])["merge"]) == {}
+
+
+def test_dict_path_does_not_import_numpy():
+    code = (
+        "import sys\n"
+        "from mergechance import analysis, data_export, fetch, filters\n"
+        "prs = [{'state': 'MERGED', 'createdAt': '2021-01-01T00:00:00Z', 'closedAt': '2021-01-02T00:00:00Z',"
+        " 'authorAssociation': 'NONE', 'author': {'login': 'a'}, 'title': 'Fix', 'permalink': 'x'}]\n"
+        "analysis.get_viable_prs(filters.pr_filter(prs))\n"
+        "data_export.prep_tsv(prs)\n"
+        "assert 'numpy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
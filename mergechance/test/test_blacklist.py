@@ -0,0 +1,39 @@
+from mergechance.blacklist import BlacklistStore, parse_blacklist, blacklist
+
+import os
+
+
+def test_default_blacklist():
+    assert "aka434112" in blacklist
+    assert "SMAKSS" in blacklist
+    assert "aka434112SMAKSS" not in blacklist
+    assert len(blacklist) > 2000
+
+
+def test_parse_blacklist():
+    lines = ["# comment", "", "  spammer  ", "bad login", "-leading", "renovate[bot]", "spammer"]
+    assert parse_blacklist(lines) == frozenset({"spammer", "renovate[bot]"})
+
+
+def test_reload(tmp_path):
+    path = tmp_path / "blacklist.txt"
+    path.write_text("first\n")
+    store = BlacklistStore(str(path))
+    assert "first" in store
+    assert not store.reload()
+
+    path.write_text("second\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert store.reload()
+    assert "first" not in store
+    assert "second" in store
+
+
+def test_missing_file_keeps_list(tmp_path):
+    path = tmp_path / "blacklist.txt"
+    path.write_text("first\n")
+    store = BlacklistStore(str(path))
+    path.unlink()
+    assert not store.reload(force=True)
+    assert "first" in store
@@ -0,0 +1,77 @@
+from mergechance import codec
+from mergechance.analysis import CLOSED_TS, CREATED_TS, parse_timestamps
+from mergechance.synthetic import generate_prs
+
+import json
+import zlib
+
+import pytest
+
+NOW = 1_600_000_000
+
+
+def _prs(n=200):
+    return parse_timestamps(generate_prs(n, seed=n, now=NOW))
+
+
+def test_round_trip():
+    prs = _prs()
+    assert codec.decode(codec.encode(prs)) == prs
+
+
+def test_parsed_timestamps_are_restored():
+    prs = generate_prs(10, now=NOW)
+    decoded = codec.decode(codec.encode(prs))
+    assert decoded == parse_timestamps(prs)
+    assert all(isinstance(pr[CREATED_TS], int) for pr in decoded)
+    assert all(pr[CLOSED_TS] is None or pr.get("closedAt") for pr in decoded)
+
+
+def test_much_smaller_than_json():
+    prs = _prs(2000)
+    assert len(codec.encode(prs)) * 10 < len(json.dumps(prs))
+
+
+def test_columns_that_do_not_fit_are_kept_as_is():
+    prs = _prs(5)
+    prs[0]["createdAt"] = "2021-01-01T00:00:00.123Z"
+    del prs[0][CREATED_TS]
+    prs[1]["permalink"] = "https://github.com/other/repo/pull/1"
+    prs[2]["state"] = "DRAFT"
+    prs[3]["author"] = {"login": "someone", "url": "https://github.com/someone"}
+    prs[4]["timelineItems"]["edges"] = [{"node": {}}]
+    document = codec._columns(prs)
+    assert set(document["raw"]) == {"createdAt", "permalink", "state", "author", "timelineItems", "title"}
+    decoded = codec.decode(codec.encode(prs))
+    # only the parsed timestamps of the raw createdAt column are lost
+    assert [{k: v for k, v in pr.items() if k != CREATED_TS} for pr in decoded] == \
+        [{k: v for k, v in pr.items() if k != CREATED_TS} for pr in prs]
+
+
+def test_ghosts_and_unclosed():
+    prs = _prs(3)
+    prs[0]["author"] = None
+    prs[1]["timelineItems"] = {"edges": [{"node": {"actor": None}}]}
+    prs[2]["timelineItems"] = {"edges": []}
+    assert codec.decode(codec.encode(prs)) == prs
+
+
+def test_missing_and_extra_keys():
+    prs = [{"title": "a", "number": 1}, {"title": "b", "state": "OPEN"}]
+    assert codec.decode(codec.encode(prs)) == prs
+    assert codec.decode(codec.encode([])) == []
+
+
+def test_zlib_blob_header():
+    # zlib by default, production has no zstandard to read zstd blobs
+    blob = codec.encode(_prs(3))
+    assert blob[:2] == bytes((codec.VERSION, codec.ZLIB))
+    json.loads(zlib.decompress(blob[2:]))
+
+
+def test_unknown_version():
+    blob = codec.encode(_prs(3), compression=codec.ZLIB)
+    with pytest.raises(codec.CodecError):
+        codec.decode(bytes((codec.VERSION + 1,)) + blob[1:])
+    with pytest.raises(codec.CodecError):
+        codec.decode(bytes((codec.VERSION, 9)) + blob[2:])
@@ -0,0 +1,84 @@
+from mergechance import gh_gql
+from mergechance.analysis import SYNC_FIELDS
+from mergechance.fake_gql import FakeGitHub, synthetic_repos
+from mergechance.retry import RetryPolicy
+
+import time
+
+import pytest
+
+NOW = 1_600_000_000
+
+
+@pytest.fixture()
+def fake():
+    with FakeGitHub(synthetic_repos(2, prs=250, now=NOW)) as fake:
+        yield fake
+
+
+def _client(url, **kwargs):
+    return gh_gql.GQLClient("token", url=url, retry=RetryPolicy(base_delay=0.01, max_delay=0.05), **kwargs)
+
+
+def test_pages_backwards(fake):
+    client = _client(fake.url)
+    rows, cursor = gh_gql.get_pr_fields("synthetic", "repo0", SYNC_FIELDS, page_cap=2, client=client)
+    expected = fake.repos["synthetic/repo0"]
+    assert rows == expected[150:250] + expected[50:150]
+    rows, cursor = gh_gql.get_pr_fields("synthetic", "repo0", SYNC_FIELDS, page_cap=5, cursor=cursor, client=client)
+    assert rows == expected[:50]
+
+
+def test_states_batches_and_updates(fake):
+    client = _client(fake.url)
+    walks = gh_gql.iter_pr_fields_by_state("synthetic", "repo1", SYNC_FIELDS, page_cap=5, client=client)
+    rows = [row for page in walks for row in page]
+    assert rows == fake.repos["synthetic/repo1"][::-1]
+    pages = gh_gql.get_first_pages([("synthetic", "repo0"), ("synthetic", "nope")], SYNC_FIELDS, client=client)
+    assert len(pages[("synthetic", "repo0")][0]) == 100
+    assert isinstance(pages[("synthetic", "nope")], gh_gql.GQLError)
+    since = sorted(pr["updatedAt"] for pr in fake.repos["synthetic/repo0"])[-10]
+    rows, complete = gh_gql.get_updated_prs("synthetic", "repo0", SYNC_FIELDS, since, client=client)
+    assert complete
+    assert all(row["updatedAt"] >= since for row in rows)
+    assert len(rows) >= 10
+
+
+def test_unknown_repository(fake):
+    with pytest.raises(gh_gql.GQLError):
+        gh_gql.get_pr_fields("synthetic", "missing", SYNC_FIELDS, client=_client(fake.url))
+
+
+def test_latency_and_errors():
+    with FakeGitHub(synthetic_repos(prs=10, now=NOW), latency=0.05, error_rate=0.5, seed=1) as fake:
+        client = _client(fake.url)
+        start = time.monotonic()
+        rows, _ = gh_gql.get_pr_fields("synthetic", "repo0", SYNC_FIELDS, client=client)
+        assert len(rows) == 10
+        assert time.monotonic() - start >= 0.05 * fake.requests
+        assert client.stats()["retries"] == fake.requests - 1
+
+
+def test_rate_limit():
+    with FakeGitHub(synthetic_repos(prs=10, now=NOW), budget=2) as fake:
+        client = _client(fake.url)
+        for remaining in [1, 0]:
+            gh_gql.get_pr_fields("synthetic", "repo0", SYNC_FIELDS, client=client)
+            assert client.token_pool.tokens[0].scheduler.remaining == remaining
+        status, body, headers = fake.handle({"query": "{}", "variables": {"owner": "synthetic", "name": "repo0"}}, "t")
+        assert headers["X-RateLimit-Remaining"] == "1"
+        fake.handle({"query": "{}", "variables": {"owner": "synthetic", "name": "repo0"}}, "t")
+        status, body, headers = fake.handle({"query": "{}", "variables": {}}, "t")
+        assert body["errors"][0]["type"] == "RATE_LIMITED"
+
+
+def test_record_and_replay(tmp_path, fake):
+    with FakeGitHub(fixtures=str(tmp_path), upstream=fake.url) as recorder:
+        recorded, _ = gh_gql.get_pr_fields("synthetic", "repo0", SYNC_FIELDS, page_cap=2, client=_client(recorder.url))
+    assert len(list(tmp_path.iterdir())) == 2
+    with FakeGitHub(fixtures=str(tmp_path)) as replay:
+        client = _client(replay.url)
+        replayed, _ = gh_gql.get_pr_fields("synthetic", "repo0", SYNC_FIELDS, page_cap=2, client=client)
+        assert replayed == recorded
+        with pytest.raises(gh_gql.GQLError):
+            gh_gql.get_pr_fields("synthetic", "repo1", SYNC_FIELDS, client=client)
@@ -0,0 +1,157 @@
+from mergechance import codec, fetch
+from mergechance.fake_gql import FakeGitHub, synthetic_repos
+from mergechance.filters import pr_filter
+from mergechance.gh_gql import GQLClient
+from mergechance.ratelimit import BACKGROUND, INTERACTIVE, RateLimitScheduler
+
+import random
+
+import pytest
+
+NOW = 1_600_000_000
+
+
+@pytest.fixture(scope="module")
+def fake():
+    repos = synthetic_repos(3, prs=2_000, now=NOW)
+    # outsider PRs are rare in repo2, the fetches go through many pages
+    rnd = random.Random(0)
+    for pr in repos["synthetic/repo2"]:
+        if rnd.random() < 0.9:
+            pr["authorAssociation"] = "MEMBER"
+    with FakeGitHub(repos, budget=10**9) as fake:
+        yield fake
+
+
+@pytest.fixture()
+def client(fake):
+    client = GQLClient("token", url=fake.url, scheduler=RateLimitScheduler(budget=10**9, burst=10**9))
+    yield client
+    client.close()
+
+
+def _summary(fetched):
+    analysis, window = fetched
+    # the order within a page is up to the walk
+    viable = sorted(pr["permalink"] for pr in analysis.viable_prs())
+    return analysis.merge_chance(), analysis.median_time_to_merge(), viable, window.synced_at
+
+
+def _cached(window):
+    """window the way get_refresh_state returns it."""
+    return fetch.Window(codec.decode(codec.encode(window.rows)), window.synced_at, window.cursor, window.complete)
+
+
+@pytest.mark.parametrize("repo", ["repo0", "repo1"])
+def test_by_state_matches_fetch_all(client, repo):
+    expected = _summary(fetch.fetch_all("synthetic", repo, client=client))
+    assert _summary(fetch.fetch_by_state("synthetic", repo, client=client)) == expected
+
+
+def test_by_state_keeps_to_page_budget(client):
+    before = client.stats()["requests"]
+    by_state, window = fetch.fetch_by_state("synthetic", "repo2", client=client)
+    assert client.stats()["requests"] - before <= fetch.MAX_PAGES
+    # the budget ran out first, the newest of fetch_all's PRs were replayed
+    viable = [pr["permalink"] for pr in fetch.fetch_all("synthetic", "repo2", client=client)[0].viable_prs()]
+    assert sorted(pr["permalink"] for pr in by_state.viable_prs()) == sorted(viable[:by_state.viable_count])
+    # and a delta can not pick up where the walks stopped
+    assert fetch.fetch_delta("synthetic", "repo2", _cached(window), client=client) is None
+
+
+def test_by_state_counts_filter_hits_once(client):
+    def hits(fetch_prs):
+        before = sum(pr_filter.hits().values())
+        fetch_prs("synthetic", "repo1", client=client)
+        return sum(pr_filter.hits().values()) - before
+
+    # every PR replayed is filtered once, whatever the walks fetched on top
+    assert hits(fetch.fetch_by_state) == hits(fetch.fetch_all)
+
+
+@pytest.mark.parametrize(
+    "full, repo",
+    [(fetch.fetch_all, "repo0"), (fetch.fetch_all, "repo1"), (fetch.fetch_all, "repo2"),
+     (fetch.fetch_by_state, "repo0"), (fetch.fetch_by_state, "repo1")],
+    ids=["all-repo0", "all-repo1", "all-repo2", "by_state-repo0", "by_state-repo1"],
+)
+def test_delta_of_unchanged_repo_matches_full_fetch(client, full, repo):
+    expected, window = full("synthetic", repo, client=client)
+    assert _summary(fetch.fetch_delta("synthetic", repo, _cached(window), client=client)) == _summary(
+        (expected, window)
+    )
+
+
+def _new_pr(prs, association):
+    """Append a merged PR opened after every other (and after NOW)."""
+    number = len(prs) + 1
+    ts = f"2021-01-01T{number // 3600:02}:{number // 60 % 60:02}:{number % 60:02}Z"
+    prs.append(dict(
+        prs[-1],
+        authorAssociation=association,
+        number=number,
+        permalink=f"https://github.com/synthetic/repo0/pull/{number}",
+        state="MERGED",
+        createdAt=ts,
+        updatedAt=ts,
+        closedAt=ts,
+    ))
+
+
+def test_delta_matches_full_fetch_after_changes():
+    repos = synthetic_repos(1, prs=3_000, now=NOW)
+    prs = repos["synthetic/repo0"]
+    rnd = random.Random(0)
+    for pr in prs:
+        if rnd.random() < 0.7:
+            pr["authorAssociation"] = "MEMBER"
+    with FakeGitHub(repos, budget=10**9) as fake:
+        client = GQLClient("token", url=fake.url, scheduler=RateLimitScheduler(budget=10**9, burst=10**9))
+        _, window = fetch.fetch_all("synthetic", "repo0", client=client)
+        # an open PR in the window and an outsider one long before it are merged
+        old = next(pr for pr in prs if pr["state"] == "OPEN" and pr["authorAssociation"] == "NONE")
+        recent = next(pr for pr in window.rows if pr["state"] == "OPEN")
+        for link in [old["permalink"], recent["permalink"]]:
+            node = next(node for node in prs if node["permalink"] == link)
+            node.update(
+                state="MERGED",
+                closedAt="2020-12-31T00:00:00Z",
+                updatedAt="2020-12-31T00:00:00Z",
+                title="Rewrite the scheduler",
+                timelineItems={"edges": [{"node": {"actor": {"login": "maintainer"}}}]},
+            )
+        # new member PRs push the window's oldest PRs into a page with older ones
+        for _ in range(fetch.STEP_SIZE + fetch.STEP_SIZE // 2):
+            _new_pr(prs, "MEMBER")
+        _new_pr(prs, "NONE")
+        delta = fetch.fetch_delta("synthetic", "repo0", _cached(window), client=client)
+        assert _summary(delta) == _summary(fetch.fetch_all("synthetic", "repo0", client=client))
+        # the walk was resumed from the window's cursor
+        assert len(delta[1].rows) > len(window.rows) + fetch.STEP_SIZE
+
+
+def test_delta_without_cursor_needs_full_fetch(client):
+    _, window = fetch.fetch_all("synthetic", "repo2", client=client)
+    window.rows = window.rows[:fetch.STEP_SIZE]
+    window.cursor = None
+    assert fetch.fetch_delta("synthetic", "repo2", _cached(window), client=client) is None
+
+
+class _RecordingScheduler(RateLimitScheduler):
+    def __init__(self):
+        super().__init__(budget=10**9, burst=10**9)
+        self.priorities = []
+
+    def acquire(self, shape, priority=INTERACTIVE, max_wait=None):
+        self.priorities.append(priority)
+        return super().acquire(shape, priority, max_wait)
+
+
+@pytest.mark.parametrize("full", [fetch.fetch_all, fetch.fetch_by_state], ids=["all", "by_state"])
+def test_fetches_keep_priority(fake, full):
+    scheduler = _RecordingScheduler()
+    client = GQLClient("token", url=fake.url, scheduler=scheduler)
+    _, window = full("synthetic", "repo2", client=client, priority=BACKGROUND)
+    fetch.fetch_delta("synthetic", "repo2", _cached(window), client=client, priority=BACKGROUND)
+    client.close()
+    assert scheduler.priorities and set(scheduler.priorities) == {BACKGROUND}
@@ -0,0 +1,74 @@
+from mergechance.analysis import to_batch
+from mergechance.filters import PRFilter, TRIVIAL, BLACKLISTED, CLOSED_BY_AUTHOR, KEPT
+
+from importlib.util import find_spec
+
+import pytest
+
+# PRBatch needs NumPy, a benchmark requirement
+needs_numpy = pytest.mark.skipif(find_spec("numpy") is None, reason="NumPy is not installed")
+
+
+def _pr(title="Fix crash", login="author1", state="MERGED", closer=None):
+    return {
+        "title": title,
+        "createdAt": "2021-01-01T00:00:00Z",
+        "closedAt": None if state == "OPEN" else "2021-01-02T00:00:00Z",
+        "authorAssociation": "CONTRIBUTOR",
+        "state": state,
+        "author": {"login": login} if login else None,
+        "timelineItems": {"edges": [{"node": {"actor": {"login": closer} if closer else None}}]},
+    }
+
+
+@pytest.fixture()
+def pr_filter():
+    return PRFilter(["readme", "typo"], ["test"], ["spammer"])
+
+
+@pytest.mark.parametrize("pr,rule", [
+    (_pr(), None),
+    (_pr(title="Update README.md"), TRIVIAL),
+    (_pr(title="Fix TYPO in docs"), TRIVIAL),
+    (_pr(title="Test"), TRIVIAL),
+    (_pr(title="Add test"), None),
+    (_pr(login="spammer"), BLACKLISTED),
+    (_pr(title="readme", login="spammer"), TRIVIAL),
+    (_pr(state="CLOSED", closer="author1"), CLOSED_BY_AUTHOR),
+    (_pr(state="CLOSED", closer="maintainer"), None),
+    (_pr(state="MERGED", closer="author1"), None),
+    (_pr(login=None, state="CLOSED"), None),
+])
+def test_rule(pr_filter, pr, rule):
+    assert pr_filter.rule(pr) == rule
+
+
+def test_hits(pr_filter):
+    prs = [
+        _pr(),
+        _pr(title="typo"),
+        _pr(login="spammer"),
+        _pr(state="CLOSED", closer="author1"),
+        _pr(title="Add feature"),
+    ]
+    kept = pr_filter(prs)
+    assert kept == [prs[0], prs[4]]
+    assert pr_filter.hits() == {TRIVIAL: 1, BLACKLISTED: 1, CLOSED_BY_AUTHOR: 1, KEPT: 2}
+
+
+@needs_numpy
+def test_hits_batch(pr_filter):
+    prs = [
+        _pr(),
+        _pr(title="typo"),
+        _pr(login="spammer"),
+        _pr(state="CLOSED", closer="author1"),
+        _pr(title="Add feature"),
+    ]
+    kept_batch = pr_filter(to_batch(prs))
+    assert len(kept_batch) == 2
+    assert pr_filter.hits() == {TRIVIAL: 1, BLACKLISTED: 1, CLOSED_BY_AUTHOR: 1, KEPT: 2}
+
+
+def test_no_keywords():
+    assert PRFilter([], [], []).rule(_pr(title="anything")) is None
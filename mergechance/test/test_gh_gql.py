@@ -0,0 +1,479 @@
+from mergechance import gh_gql
+
+import time
+
+import pytest
+
+
+def _page(nodes, has_next, end_cursor="c"):
+    return {
+        "data": {
+            "repository": {
+                "pullRequests": {
+                    "pageInfo": {"hasNextPage": has_next, "endCursor": end_cursor},
+                    "edges": [{"cursor": "x", "node": node} for node in nodes],
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture()
+def pages(monkeypatch):
+    """Serve pages of PRs by updatedAt, record which cursors were requested."""
+    served = []
+    requested = []
+
+    def fake_query(owner, repo, cursor, fields, client=None, priority=None):
+        requested.append(cursor)
+        return served.pop(0)
+
+    monkeypatch.setattr(gh_gql, "_updated_query", fake_query)
+    return served, requested
+
+
+def test_get_updated_prs_stops_at_since(pages):
+    served, requested = pages
+    served.append(_page([{"updatedAt": "2021-03-03T00:00:00Z"}, {"updatedAt": "2021-03-02T00:00:00Z"}], True, "p1"))
+    served.append(_page([
+        {"updatedAt": "2021-03-01T12:00:00Z"},
+        {"updatedAt": "2021-03-01T00:00:00Z"},
+        {"updatedAt": "2021-02-01T00:00:00Z"},
+    ], True, "p2"))
+    rows, complete = gh_gql.get_updated_prs("o", "r", ["updatedAt"], since="2021-03-01T00:00:00Z")
+    assert complete
+    # the PR updated in the second of since may have changed after the last sync
+    assert [r["updatedAt"] for r in rows] == [
+        "2021-03-03T00:00:00Z",
+        "2021-03-02T00:00:00Z",
+        "2021-03-01T12:00:00Z",
+        "2021-03-01T00:00:00Z",
+    ]
+    assert requested == [None, "p1"]
+
+
+def test_get_updated_prs_last_page(pages):
+    served, _ = pages
+    served.append(_page([{"updatedAt": "2021-03-03T00:00:00Z"}], False))
+    rows, complete = gh_gql.get_updated_prs("o", "r", ["updatedAt"], since="2021-01-01T00:00:00Z")
+    assert complete
+    assert len(rows) == 1
+
+
+def test_get_updated_prs_page_cap(pages):
+    served, _ = pages
+    served.extend(_page([{"updatedAt": "2021-03-03T00:00:00Z"}], True) for _ in range(2))
+    rows, complete = gh_gql.get_updated_prs("o", "r", ["updatedAt"], since="2021-01-01T00:00:00Z", page_cap=2)
+    assert not complete
+    assert len(rows) == 2
+
+
+class _Server:
+    def __init__(self):
+        self.url = None
+        self.responses = []
+        self.requests = []
+        self.connections = []
+
+    def respond(self, request):
+        """Answer with the queued responses by default, tests may replace it."""
+        return self.responses.pop(0)
+
+
+@pytest.fixture()
+def gql_server():
+    """Local HTTP/1.1 GraphQL stand-in, answers POSTs with server.respond(request json),
+    which returns the response body or a (status, body, headers) tuple."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import json
+    import threading
+
+    state = _Server()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            state.connections.append(self.client_address)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            state.requests.append(request)
+            response = state.respond(request)
+            status, headers = 200, {}
+            if isinstance(response, tuple):
+                status, response, headers = response
+            body = json.dumps(response).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    # clients hanging up on purpose (timeouts) are not errors here
+    server.handle_error = lambda request, client_address: None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.url = f"http://127.0.0.1:{server.server_port}/graphql"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_reuses_connection(gql_server):
+    gql_server.responses.extend([{"data": {"n": 1}}, {"data": {"n": 2}}])
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    assert client.request({"query": "{}"}) == {"data": {"n": 1}}
+    assert client.request({"query": "{}"}) == {"data": {"n": 2}}
+    assert len(gql_server.connections) == 1
+    client.close()
+
+
+def test_client_raises_on_errors(gql_server):
+    gql_server.responses.append({"errors": [{"message": "Could not resolve to a Repository"}]})
+    with pytest.raises(gh_gql.GQLError):
+        gh_gql.GQLClient("token", url=gql_server.url).request({"query": "{}"})
+
+
+def _backwards_page(repo, cursor):
+    """Two pages of one PR each per repository, titled after the repo."""
+    page = 2 if cursor else 1
+    return {
+        "data": {
+            "repository": {
+                "pullRequests": {
+                    "pageInfo": {"hasPreviousPage": page == 1, "startCursor": f"{repo}-{page}"},
+                    "edges": [{"cursor": "x", "node": {"title": f"{repo} {page}"}}],
+                }
+            }
+        }
+    }
+
+
+def test_async_client_fetches_many_repos(gql_server):
+    def respond(request):
+        repo = request["variables"]["name"]
+        cursor = request["variables"]["cursor"]
+        if repo == "missing":
+            return {"errors": [{"message": "Could not resolve to a Repository"}]}
+        return _backwards_page(repo, cursor)
+
+    gql_server.respond = respond
+    client = gh_gql.AsyncGQLClient(gh_gql.GQLClient("token", url=gql_server.url), concurrency=4)
+    repos = [("o", "a"), ("o", "b"), ("o", "c"), ("o", "missing")]
+    try:
+        import asyncio
+        results = asyncio.run(client.get_many_pr_fields(repos, ["title"], page_cap=5))
+    finally:
+        client.close()
+    for name in "abc":
+        rows, cursor = results[("o", name)]
+        assert [row["title"] for row in rows] == [f"{name} 1", f"{name} 2"]
+        assert cursor == f"{name}-2"
+    assert isinstance(results[("o", "missing")], gh_gql.GQLError)
+    assert len(gql_server.requests) == 7
+
+
+def test_client_records_rate_limit(gql_server):
+    from mergechance.ratelimit import RateLimitScheduler
+
+    scheduler = RateLimitScheduler()
+    rate_limit = {"cost": 3, "remaining": 4321, "resetAt": "2030-01-01T00:00:00Z"}
+    gql_server.responses.append({"data": {"rateLimit": rate_limit}})
+    client = gh_gql.GQLClient("token", url=gql_server.url, scheduler=scheduler)
+    client.request({"query": "{}"}, shape=gh_gql.PR_PAGE)
+    assert scheduler.estimate(gh_gql.PR_PAGE) == 3
+    assert scheduler.remaining == 4321
+    assert "rateLimit" in gh_gql._pr_page_query("o", "r", None, ["title"])["query"]
+
+
+def test_client_rotates_revoked_token(gql_server):
+    from mergechance.tokens import TokenPool
+
+    def respond(request):
+        auth = gql_server.auth.pop(0)
+        if auth == "bearer bad":
+            return 401, {"message": "Bad credentials"}, {}
+        return {"data": {"auth": auth}}
+
+    gql_server.respond = respond
+    gql_server.auth = []
+    token_pool = TokenPool(["bad", "good"], round_robin=True)
+    client = gh_gql.GQLClient(url=gql_server.url, token_pool=token_pool)
+    original_post = client.session.post
+
+    def post(url, json, headers, **kwargs):
+        gql_server.auth.append(headers["Authorization"])
+        return original_post(url, json=json, headers=headers, **kwargs)
+
+    client.session.post = post
+    for _ in range(3):
+        assert client.request({"query": "{}"}) == {"data": {"auth": "bearer good"}}
+    states = {t["token"]: t["state"] for t in token_pool.stats()["tokens"]}
+    assert states == {"...bad": "revoked", "...good": "active"}
+
+
+def _retrying_client(url, **kwargs):
+    from mergechance.retry import RetryPolicy
+
+    return gh_gql.GQLClient("token", url=url, retry=RetryPolicy(base_delay=0.01, max_delay=0.05), **kwargs)
+
+
+def test_client_retries_server_errors(gql_server):
+    gql_server.responses.extend([
+        (502, {"message": "Bad Gateway"}, {}),
+        (503, {"message": "Unavailable"}, {}),
+        {"data": {"n": 1}},
+    ])
+    client = _retrying_client(gql_server.url)
+    assert client.request({"query": "{}"}) == {"data": {"n": 1}}
+    stats = client.stats()
+    assert stats["requests"] == 3
+    assert stats["retries"] == 2
+    assert stats["retry_reasons"] == {"http_502": 1, "http_503": 1}
+    assert stats["failures"] == 0
+
+
+def test_client_honors_retry_after(gql_server):
+    gql_server.responses.extend([
+        (403, {"message": "You have exceeded a secondary rate limit"}, {"Retry-After": "1"}),
+        {"data": {"n": 1}},
+    ])
+    client = _retrying_client(gql_server.url)
+    start = time.monotonic()
+    assert client.request({"query": "{}"}) == {"data": {"n": 1}}
+    assert time.monotonic() - start >= 1
+    assert client.stats()["retry_reasons"] == {"secondary_rate_limit": 1}
+
+
+def test_client_does_not_retry_client_errors(gql_server):
+    gql_server.responses.extend([(404, {"message": "Not Found"}, {}), {"data": {}}])
+    client = _retrying_client(gql_server.url)
+    with pytest.raises(gh_gql.GQLError):
+        client.request({"query": "{}"})
+    assert len(gql_server.requests) == 1
+    assert client.stats()["failures"] == 1
+
+
+def test_client_gives_up_at_deadline(gql_server):
+    gql_server.responses.append((403, {"message": "secondary rate limit"}, {"Retry-After": "60"}))
+    client = _retrying_client(gql_server.url, deadline=5)
+    start = time.monotonic()
+    with pytest.raises(gh_gql.GQLError):
+        client.request({"query": "{}"})
+    assert time.monotonic() - start < 1
+
+
+def test_client_retries_read_timeout(gql_server):
+    def respond(request):
+        n = len(gql_server.requests)
+        if n == 1:
+            time.sleep(0.5)
+        return {"data": {"n": n}}
+
+    gql_server.respond = respond
+    client = _retrying_client(gql_server.url, read_timeout=0.2)
+    assert client.request({"query": "{}"}) == {"data": {"n": 2}}
+    assert client.stats()["retry_reasons"] == {"ReadTimeout": 1}
+
+
+def test_client_retries_truncated_body(gql_server):
+    import requests
+
+    gql_server.responses.append({"data": {"n": 1}})
+    client = _retrying_client(gql_server.url)
+    post = client.session.post
+    calls = []
+
+    def truncated_once(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead")
+        return post(*args, **kwargs)
+
+    client.session.post = truncated_once
+    assert client.request({"query": "{}"}) == {"data": {"n": 1}}
+    assert client.stats()["retry_reasons"] == {"ChunkedEncodingError": 1}
+
+
+def test_open_circuit_fails_fast(gql_server):
+    from mergechance.retry import CircuitBreaker
+
+    gql_server.respond = lambda request: (502, {"message": "Bad Gateway"}, {})
+    client = _retrying_client(gql_server.url, breaker=CircuitBreaker(threshold=3, cooldown=60))
+    with pytest.raises(gh_gql.GQLError):
+        client.request({"query": "{}"})
+    assert len(gql_server.requests) == 3
+    with pytest.raises(gh_gql.GQLError):
+        client.request({"query": "{}"})
+    assert len(gql_server.requests) == 3
+    stats = client.stats()
+    assert stats["circuit"] == "open"
+    # the first request's last retry was already rejected
+    assert stats["rejected"] == 2
+
+
+def test_first_pages_batches_repositories(gql_server):
+    def respond(request):
+        variables = request["variables"]
+        data, errors = {}, []
+        for i in range(len(variables) // 2):
+            alias, repo = f"r{i}", variables[f"name{i}"]
+            if repo == "missing":
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias], "message": "Could not resolve to a Repository"})
+            else:
+                data[alias] = _backwards_page(repo, None)["data"]["repository"]
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+    gql_server.respond = respond
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    repos = [("o", "a"), ("o", "missing"), ("o", "b"), ("o", "c"), ("o", "d")]
+    results = gh_gql.get_first_pages(repos, ["title"], batch_size=3, client=client)
+    assert len(gql_server.requests) == 2
+    for name in "abcd":
+        rows, cursor = results[("o", name)]
+        assert [row["title"] for row in rows] == [f"{name} 1"]
+        assert cursor == f"{name}-1"
+    assert isinstance(results[("o", "missing")], gh_gql.GQLError)
+
+
+def test_batch_query_aliases():
+    data = gh_gql._batch_page_query([("o", "a"), ("p", "b")], ["title"])
+    assert "r0: repository(owner: $owner0, name: $name0)" in data["query"]
+    assert "r1: repository(owner: $owner1, name: $name1)" in data["query"]
+    assert data["query"].count("rateLimit") == 1
+    assert data["variables"] == {"owner0": "o", "name0": "a", "owner1": "p", "name1": "b", "pageSize": 100}
+
+
+def test_query_documents_are_reused():
+    first = gh_gql._pr_page_query("o", "a", None, ["title", "state"])
+    second = gh_gql._pr_page_query('o"', "b) {", "cursor", ["title", "state"])
+    assert first["query"] is second["query"]
+    assert second["variables"] == {"owner": 'o"', "name": "b) {", "cursor": "cursor", "pageSize": 100, "states": None}
+    assert gh_gql._pr_page_query("o", "a", None, ["title"])["query"] != first["query"]
+
+
+def _state_server(gql_server, prs):
+    """Serve prs (oldest first) backwards in pages of 2, filtered by the states variable."""
+
+    def respond(request):
+        variables = request["variables"]
+        states = variables["states"] or gh_gql.PR_STATES
+        matching = [pr for pr in prs if pr["state"] in states]
+        end = int(variables["cursor"]) if variables["cursor"] else len(matching)
+        start = max(end - 2, 0)
+        return {"data": {"repository": {"pullRequests": {
+            "pageInfo": {"hasPreviousPage": start > 0, "startCursor": str(start)},
+            "edges": [{"cursor": "x", "node": pr} for pr in matching[start:end]],
+        }}}}
+
+    gql_server.respond = respond
+
+
+def _drain(walks):
+    """Rows and return value of iter_pr_fields_by_state."""
+    rows = []
+    while True:
+        try:
+            rows.extend(next(walks))
+        except StopIteration as stop:
+            return rows, stop.value
+
+
+def test_pr_fields_by_state(gql_server):
+    states = ["MERGED"] * 6 + ["CLOSED", "OPEN"] * 3
+    prs = [{"state": state, "createdAt": f"2021-01-{day:02}T00:00:00Z"} for day, state in enumerate(states, 1)]
+    _state_server(gql_server, prs)
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    newest_first = prs[::-1]
+    # MERGED may run at most LEAD_PAGES ahead, the rest of the budget gets the newest PRs of the others
+    walks = gh_gql.iter_pr_fields_by_state("o", "r", ["state", "createdAt"], page_cap=6, client=client)
+    rows = []
+    for page in walks:
+        rows.extend(page)
+        # whatever each walk reached, what was yielded has no gaps
+        assert rows == newest_first[:len(rows)]
+        if len(rows) >= 3:
+            break
+    walks.close()
+    assert len(rows) >= 3
+    assert len(gql_server.requests) <= 6
+    assert {tuple(request["variables"]["states"]) for request in gql_server.requests} == {
+        ("MERGED",), ("CLOSED",), ("OPEN",)
+    }
+
+
+def test_pr_fields_by_state_page_cap(gql_server):
+    states = ["MERGED"] * 6 + ["CLOSED", "OPEN"] * 3
+    prs = [{"state": state, "createdAt": f"2021-01-{day:02}T00:00:00Z"} for day, state in enumerate(states, 1)]
+    _state_server(gql_server, prs)
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    rows, complete = _drain(gh_gql.iter_pr_fields_by_state("o", "r", ["state", "createdAt"], page_cap=4, client=client))
+    assert not complete
+    assert len(gql_server.requests) == 4
+    assert rows == prs[::-1][:len(rows)]
+
+
+def test_pr_fields_by_state_exhausted(gql_server):
+    prs = [{"state": state, "createdAt": f"2021-01-0{day}T00:00:00Z"} for day, state in enumerate(["MERGED", "OPEN"], 1)]
+    _state_server(gql_server, prs)
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    rows, complete = _drain(gh_gql.iter_pr_fields_by_state("o", "r", ["state", "createdAt"], client=client))
+    assert complete
+    assert [row["state"] for row in rows] == ["OPEN", "MERGED"]
+
+
+def test_pr_fields_by_state_raises_walk_errors(gql_server):
+    gql_server.respond = lambda request: {"errors": [{"message": "boom"}]}
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    with pytest.raises(gh_gql.GQLError):
+        _drain(gh_gql.iter_pr_fields_by_state("o", "r", ["state", "createdAt"], client=client))
+
+
+def test_iter_pr_fields_streams_pages(gql_server):
+    def respond(request):
+        return _backwards_page("a", request["variables"]["cursor"])
+
+    gql_server.respond = respond
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    nodes = gh_gql.iter_pr_fields("o", "a", ["title"], page_cap=5, client=client)
+    assert next(nodes) == {"title": "a 1"}
+    assert len(gql_server.requests) == 1
+    with pytest.raises(StopIteration) as stop:
+        while True:
+            assert next(nodes) == {"title": "a 2"}
+    assert stop.value.value == "a-2"
+    assert len(gql_server.requests) == 2
+
+
+def test_stream_releases_connections_of_failed_attempts(gql_server):
+    import threading
+
+    gql_server.responses.extend([
+        (502, {"message": "Bad Gateway"}, {}),
+        (502, {"message": "Bad Gateway"}, {}),
+        _backwards_page("a", None),
+    ])
+    # a single pooled connection, it must come back after each failure
+    client = _retrying_client(gql_server.url, pool_size=1)
+    nodes = []
+    thread = threading.Thread(target=lambda: nodes.extend(client.stream({"query": "{}"}, gh_gql.PR_EDGES)), daemon=True)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert len(nodes) == 1
+
+
+def test_stream_raises_on_errors(gql_server):
+    gql_server.responses.append({"data": None, "errors": [{"message": "Could not resolve to a Repository"}]})
+    client = gh_gql.GQLClient("token", url=gql_server.url)
+    with pytest.raises(gh_gql.GQLError):
+        list(client.stream({"query": "{}"}, gh_gql.PR_EDGES))
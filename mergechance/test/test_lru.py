@@ -0,0 +1,83 @@
+from mergechance.lru import TTLCache, approx_size
+
+import threading
+
+NOW = 1_600_000_000
+
+
+def test_get_put():
+    cache = TTLCache()
+    assert cache.get("a", now=NOW) is None
+    cache.put("a", 1, expires_at=NOW + 10)
+    assert cache.get("a", now=NOW) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_expiry():
+    cache = TTLCache()
+    cache.put("a", 1, expires_at=NOW + 10)
+    assert cache.get("a", now=NOW + 9) == 1
+    assert cache.get("a", now=NOW + 10) is None
+    assert len(cache) == 0
+    assert cache.stats()["expired"] == 1
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2)
+    cache.put("a", 1, NOW + 10)
+    cache.put("b", 2, NOW + 10)
+    cache.get("a", now=NOW)
+    cache.put("c", 3, NOW + 10)
+    assert cache.get("b", now=NOW) is None
+    assert cache.get("a", now=NOW) == 1
+    assert cache.get("c", now=NOW) == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_bound():
+    cache = TTLCache(max_bytes=100, sizeof=len)
+    cache.put("a", "x" * 60, NOW + 10)
+    cache.put("b", "y" * 30, NOW + 10)
+    assert cache.bytes == 90
+    cache.put("c", "z" * 30, NOW + 10)
+    assert cache.get("a", now=NOW) is None
+    assert cache.bytes == 60
+    # larger than the whole budget, not cached at all
+    cache.put("d", "w" * 101, NOW + 10)
+    assert cache.get("d", now=NOW) is None
+    assert cache.bytes == 60
+
+
+def test_replacing_updates_size():
+    cache = TTLCache(sizeof=len)
+    cache.put("a", "xx", NOW + 10)
+    cache.put("a", "xxxx", NOW + 10)
+    assert cache.bytes == 4
+    cache.pop("a")
+    assert cache.bytes == 0
+
+
+def test_approx_size_follows_containers():
+    prs = [{"title": "Fix parser", "author": {"login": "user1"}} for _ in range(10)]
+    assert approx_size(prs) > 10 * approx_size("Fix parser")
+
+
+def test_threads():
+    cache = TTLCache(max_entries=50)
+
+    def worker(offset):
+        for i in range(1000):
+            key = (offset + i) % 100
+            if cache.get(key, now=NOW) is None:
+                cache.put(key, key, NOW + 10)
+
+    threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats["entries"] <= 50
+    assert stats["hits"] + stats["misses"] == 8000
+    assert cache.bytes == sum(approx_size(key) for key in range(100) if cache.get(key, now=NOW) is not None)
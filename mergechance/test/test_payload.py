@@ -0,0 +1,54 @@
+from mergechance import codec, payload
+
+
+def _prs(n):
+    return [{"number": i} for i in range(n)]
+
+
+def test_split_join_round_trip():
+    dataset = _prs(1200)
+    prs = dataset[::7]
+    chunks = payload.split(dataset, prs, chunk_size=500)
+    assert [len(codec.decode(chunk["data"])) for chunk in chunks] == [500, 500, 200]
+    assert payload.join(chunks) == (dataset, prs)
+
+
+def test_viable_indexes_are_per_chunk():
+    dataset = _prs(4)
+    chunks = payload.split(dataset, [dataset[1], dataset[2]], chunk_size=2)
+    assert [chunk["viable"] for chunk in chunks] == [[1], [0]]
+
+
+def test_split_identical_prs_by_identity():
+    # equal but distinct rows must not be mistaken for viable ones
+    dataset = [{"number": 1}, {"number": 1}]
+    chunks = payload.split(dataset, [dataset[1]])
+    assert chunks[0]["viable"] == [1]
+
+
+def test_plain_chunks_still_join():
+    # written before chunks were encoded with mergechance.codec
+    dataset = _prs(3)
+    assert payload.join([{"dataset": dataset, "viable": [2]}]) == (dataset, [dataset[2]])
+
+
+def test_empty_dataset():
+    assert payload.split([], []) == []
+    assert payload.join([]) == ([], [])
+
+
+def test_legacy_entries():
+    dataset = _prs(3)
+    indexed = {"chance": 50, "dataset": dataset, "viable": [0, 2]}
+    assert payload.is_legacy(indexed)
+    assert payload.from_legacy(indexed) == (dataset, [dataset[0], dataset[2]])
+    inline = {"chance": 50, "prs": dataset}
+    assert payload.from_legacy(inline) == (dataset, dataset)
+    assert not payload.is_legacy({"chance": 50, "chunks": 1})
+
+
+def test_migrated_legacy_entry_joins_back():
+    dataset = _prs(3)
+    legacy = {"dataset": dataset, "viable": [1]}
+    chunks = payload.split(*payload.from_legacy(legacy))
+    assert payload.join(chunks) == (dataset, [dataset[1]])
@@ -0,0 +1,80 @@
+import pytest
+
+# a benchmark requirement, not installed with the app
+pytest.importorskip("numpy")
+
+from mergechance.analysis import to_batch
+from mergechance.prbatch import PRBatch, State, Association, NO_AUTHOR
+
+
+@pytest.fixture()
+def rows():
+    return [
+        {
+            "createdAt": "2021-01-01T00:00:00Z",
+            "closedAt": "2021-01-02T00:00:00Z",
+            "authorAssociation": "MEMBER",
+            "state": "MERGED",
+            "author": {"login": "alice"},
+            "timelineItems": {"edges": []},
+            "title": "Add feature",
+            "permalink": "https://github.com/o/r/pull/1",
+        },
+        {
+            "createdAt": "2021-01-03T00:00:00Z",
+            "closedAt": "2021-01-05T00:00:00Z",
+            "authorAssociation": "CONTRIBUTOR",
+            "state": "CLOSED",
+            "author": {"login": "bob"},
+            "timelineItems": {"edges": [{"node": {"actor": {"login": "alice"}}}]},
+            "title": "Fix bug",
+            "permalink": "https://github.com/o/r/pull/2",
+        },
+        {
+            "createdAt": "2021-01-04T00:00:00Z",
+            "closedAt": None,
+            "authorAssociation": None,
+            "state": "OPEN",
+            "author": None,
+            "timelineItems": {"edges": []},
+            "title": "Ghost PR",
+            "permalink": "https://github.com/o/r/pull/3",
+        },
+    ]
+
+
+def test_from_rows(rows):
+    batch = to_batch(rows)
+    assert len(batch) == 3
+    assert list(batch.state) == [State.MERGED, State.CLOSED, State.OPEN]
+    assert list(batch.association) == [Association.MEMBER, Association.CONTRIBUTOR, Association.NONE]
+    assert batch.logins == ["alice", "bob"]
+    assert list(batch.author) == [0, 1, NO_AUTHOR]
+    assert list(batch.closer) == [NO_AUTHOR, 0, NO_AUTHOR]
+    assert batch.closed[1] - batch.created[1] == 2 * 24 * 60 * 60
+
+
+def test_to_rows_round_trip(rows):
+    back = to_batch(rows).to_rows()
+    for row, orig in zip(back, rows):
+        for field in ["createdAt", "closedAt", "state", "author", "title", "permalink"]:
+            assert row[field] == orig[field]
+    assert back[2]["authorAssociation"] == "NONE"
+
+
+def test_concat_reinterns_logins(rows):
+    first = to_batch(rows[:1])
+    second = to_batch(rows[1:])
+    both = PRBatch.concat([first, second])
+    assert both.logins == ["alice", "bob"]
+    assert list(both.author) == [0, 1, NO_AUTHOR]
+    assert list(both.closer) == [NO_AUTHOR, 0, NO_AUTHOR]
+    assert both.permalink == [row["permalink"] for row in rows]
+
+
+def test_take(rows):
+    batch = to_batch(rows)
+    merged = batch.take(batch.state == State.MERGED)
+    assert len(merged) == 1
+    assert merged.title == ["Add feature"]
+    assert list(merged.merge_counts()) == [1, 0]
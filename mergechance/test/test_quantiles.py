@@ -0,0 +1,57 @@
+from mergechance.quantiles import TDigest
+
+import bisect
+import random
+import statistics
+
+import pytest
+
+
+@pytest.fixture()
+def values():
+    rnd = random.Random(0)
+    return [rnd.lognormvariate(10, 1.5) for _ in range(50_000)]
+
+
+def _rank_error(sorted_values, estimate, q):
+    return abs(bisect.bisect(sorted_values, estimate) / len(sorted_values) - q)
+
+
+@pytest.mark.parametrize("n", range(1, 8))
+def test_small_inputs_are_exact(n):
+    values = [random.Random(n).random() for _ in range(n)]
+    digest = TDigest().update(values)
+    assert digest.quantile(0.5) == pytest.approx(statistics.median(values))
+    assert digest.quantile(0) == min(values)
+    assert digest.quantile(1) == max(values)
+
+
+def test_empty():
+    assert TDigest().quantile(0.5) is None
+    assert TDigest.from_dict(TDigest().to_dict()).quantile(0.5) is None
+
+
+def test_accuracy_and_bounded_size(values):
+    digest = TDigest().update(values)
+    ordered = sorted(values)
+    for q in [0.25, 0.5, 0.75, 0.9, 0.99]:
+        assert _rank_error(ordered, digest.quantile(q), q) < 0.005
+    assert len(digest.means) <= digest.compression
+
+
+def test_merge_pages(values):
+    merged = TDigest()
+    for start in range(0, len(values), 100):
+        merged.merge(TDigest().update(values[start:start + 100]))
+    assert merged.count == len(values)
+    ordered = sorted(values)
+    for q in [0.25, 0.5, 0.75, 0.9, 0.99]:
+        assert _rank_error(ordered, merged.quantile(q), q) < 0.005
+
+
+def test_serialization(values):
+    digest = TDigest().update(values)
+    restored = TDigest.from_dict(digest.to_dict())
+    assert restored.count == digest.count
+    for q in [0.1, 0.5, 0.99]:
+        assert restored.quantile(q) == digest.quantile(q)
@@ -0,0 +1,64 @@
+from mergechance.ratelimit import RateLimitScheduler, RateLimitError, INTERACTIVE, BACKGROUND, DEFAULT_COST
+
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture()
+def scheduler():
+    # 100 points per second, bursts of 10 points
+    return RateLimitScheduler(budget=360_000, window=3600, burst=10, reserve=50)
+
+
+def test_burst_then_pacing(scheduler):
+    for _ in range(10):
+        scheduler.acquire("q")
+    with pytest.raises(RateLimitError):
+        scheduler.acquire("q", max_wait=0)
+    start = time.monotonic()
+    scheduler.acquire("q", max_wait=1)
+    assert time.monotonic() - start < 0.5
+
+
+def test_learns_cost(scheduler):
+    assert scheduler.estimate("q") == DEFAULT_COST
+    scheduler.record("q", {"cost": 5, "remaining": 1000, "resetAt": "2030-01-01T00:00:00Z"})
+    assert scheduler.estimate("q") == 5
+    scheduler.record("q", {"cost": 10, "remaining": 990, "resetAt": "2030-01-01T00:00:00Z"})
+    assert scheduler.estimate("q") == pytest.approx(6)
+    assert scheduler.remaining == 990
+
+
+def test_background_leaves_reserve(scheduler):
+    scheduler.record("q", {"cost": 1, "remaining": 40, "resetAt": "2030-01-01T00:00:00Z"})
+    with pytest.raises(RateLimitError):
+        scheduler.acquire("q", priority=BACKGROUND, max_wait=0)
+    scheduler.acquire("q", priority=INTERACTIVE)
+
+
+def test_sleeps_until_reset(scheduler):
+    scheduler.exhausted(reset_at=time.time() + 0.3)
+    with pytest.raises(RateLimitError):
+        scheduler.acquire("q", max_wait=0)
+    start = time.monotonic()
+    scheduler.acquire("q", max_wait=2)
+    assert 0.2 < time.monotonic() - start < 1.5
+
+
+def test_interactive_goes_first(scheduler):
+    scheduler.exhausted(reset_at=time.time() + 0.3)
+    order = []
+
+    def background():
+        scheduler.acquire("q", priority=BACKGROUND)
+        order.append("background")
+
+    thread = threading.Thread(target=background, daemon=True)
+    thread.start()
+    time.sleep(0.05)
+    scheduler.acquire("q", max_wait=2)
+    order.append("interactive")
+    thread.join(5)
+    assert order == ["interactive", "background"]
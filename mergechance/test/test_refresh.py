@@ -0,0 +1,64 @@
+from mergechance.refresh import RefreshPool
+
+import threading
+
+
+def test_refreshes_run_in_background():
+    pool = RefreshPool(workers=2)
+    done = []
+    assert pool.submit("a", lambda: done.append("a"))
+    assert pool.submit("b", lambda: done.append("b"))
+    pool.join()
+    assert sorted(done) == ["a", "b"]
+    assert pool.stats() == {"pending": 0, "queued": 2, "done": 2}
+
+
+def test_pending_key_is_deduplicated():
+    pool = RefreshPool(workers=1)
+    release = threading.Event()
+    runs = []
+
+    def refresh():
+        runs.append(1)
+        release.wait(5)
+
+    assert pool.submit("o/r", refresh)
+    assert not pool.submit("o/r", refresh)
+    release.set()
+    pool.join()
+    assert len(runs) == 1
+    # once done the key can be refreshed again
+    assert pool.submit("o/r", lambda: None)
+    pool.join()
+    assert pool.stats()["deduped"] == 1
+
+
+def test_full_queue_drops_refreshes():
+    pool = RefreshPool(workers=1, queue_size=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+
+    pool.submit("running", blocking)
+    started.wait(5)
+    assert pool.submit("queued", lambda: None)
+    assert not pool.submit("dropped", lambda: None)
+    release.set()
+    pool.join()
+    assert pool.stats()["dropped"] == 1
+    assert pool.stats()["pending"] == 0
+
+
+def test_failed_refresh_is_counted():
+    pool = RefreshPool(workers=1)
+
+    def fail():
+        raise ValueError("GitHub is down")
+
+    pool.submit("o/r", fail)
+    pool.join()
+    assert pool.stats()["failed"] == 1
+    assert pool.stats()["pending"] == 0
@@ -0,0 +1,61 @@
+from mergechance.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+import time
+
+import pytest
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+    for attempt, cap in [(1, 1), (2, 2), (3, 4), (6, 4)]:
+        delays = [policy.delay(attempt) for _ in range(200)]
+        assert all(0 <= d <= cap for d in delays)
+        # jittered, not the same delay every time
+        assert len(set(delays)) > 1
+
+
+def test_retry_after_takes_precedence():
+    assert RetryPolicy(max_delay=1).delay(1, retry_after=7) == 7
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    for _ in range(3):
+        breaker.before_request()
+        breaker.failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_success_resets_failures():
+    breaker = CircuitBreaker(threshold=2)
+    breaker.failure()
+    breaker.success()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=1, cooldown=0.05)
+    breaker.failure()
+    time.sleep(0.06)
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_request()
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(threshold=5, cooldown=0.05)
+    for _ in range(5):
+        breaker.failure()
+    time.sleep(0.06)
+    breaker.before_request()
+    breaker.failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
@@ -0,0 +1,80 @@
+from mergechance.singleflight import CoalesceTimeout, SingleFlight
+
+import threading
+import time
+
+import pytest
+
+
+def _run_concurrently(n, target):
+    results = [None] * n
+    errors = [None] * n
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,), daemon=True) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results, errors
+
+
+def test_concurrent_calls_share_one_result():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "chance"
+
+    threading.Timer(0.2, release.set).start()
+    results, errors = _run_concurrently(10, lambda: flight.do("o/r", compute))
+    assert results == ["chance"] * 10
+    assert len(calls) == 1
+    assert flight.stats() == {"in_flight": 0, "calls": 1, "coalesced": 9}
+
+
+def test_waiters_get_the_exception():
+    flight = SingleFlight()
+
+    def compute():
+        time.sleep(0.2)
+        raise ValueError("GitHub is down")
+
+    results, errors = _run_concurrently(5, lambda: flight.do("o/r", compute))
+    assert all(isinstance(e, ValueError) for e in errors)
+
+
+def test_keys_are_independent():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    # finished calls are not remembered
+    assert flight.do("a", lambda: 3) == 3
+
+
+def test_waiter_timeout():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return 1
+
+    leader = threading.Thread(target=flight.do, args=("k", slow), daemon=True)
+    leader.start()
+    started.wait(5)
+    with pytest.raises(CoalesceTimeout):
+        flight.do("k", lambda: 2, timeout=0.05)
+    release.set()
+    leader.join(5)
+    assert flight.stats()["timeouts"] == 1
@@ -0,0 +1,82 @@
+from mergechance import streaming
+
+import io
+import json
+
+import pytest
+
+DOCUMENT = {
+    "data": {
+        "rateLimit": {"cost": 1, "remaining": 4999},
+        "repository": {
+            "pullRequests": {
+                "pageInfo": {"hasPreviousPage": True, "startCursor": "c"},
+                "edges": [
+                    {"cursor": "x", "node": {"title": "first", "labels": [1, 2.5], "author": None}},
+                    {"cursor": "y", "node": {"title": "second", "labels": [], "author": {"login": "a"}}},
+                ],
+            }
+        },
+    }
+}
+PREFIX = "data.repository.pullRequests.edges"
+
+
+@pytest.fixture(params=["ijson", "json"])
+def parser(request, monkeypatch):
+    if request.param == "ijson":
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr(streaming, "ijson", None)
+    return request.param
+
+
+def _fp(document):
+    return io.BytesIO(json.dumps(document).encode())
+
+
+def test_iter_items(parser):
+    rest = {}
+    items = list(streaming.iter_items(_fp(DOCUMENT), PREFIX, rest))
+    assert items == DOCUMENT["data"]["repository"]["pullRequests"]["edges"]
+    assert rest["data"]["rateLimit"] == {"cost": 1, "remaining": 4999}
+    pull_requests = rest["data"]["repository"]["pullRequests"]
+    assert pull_requests == {"pageInfo": {"hasPreviousPage": True, "startCursor": "c"}, "edges": []}
+
+
+def test_iter_items_missing_array(parser):
+    rest = {}
+    document = {"data": None, "errors": [{"message": "Not found"}]}
+    assert list(streaming.iter_items(_fp(document), PREFIX, rest)) == []
+    assert rest == document
+
+
+def test_loading_whole_warns_once(monkeypatch, caplog):
+    monkeypatch.setattr(streaming, "ijson", None)
+    monkeypatch.setattr(streaming, "_warned", False)
+    for _ in range(2):
+        list(streaming.iter_items(_fp(DOCUMENT), PREFIX, {}))
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+
+
+def test_iter_items_is_lazy():
+    pytest.importorskip("ijson")
+    edges = [{"node": {"n": i}} for i in range(10_000)]
+    document = json.dumps({"data": {"repository": {"pullRequests": {"edges": edges}}}}).encode()
+    read = []
+
+    class Reader(io.BytesIO):
+        def read(self, size=-1):
+            chunk = super().read(size)
+            read.append(len(chunk))
+            return chunk
+
+    items = streaming.iter_items(Reader(document), PREFIX, {})
+    assert next(items) == {"node": {"n": 0}}
+    assert sum(read) < len(document)
+
+
+def test_truncated_document_raises_value_error(parser):
+    body = json.dumps(DOCUMENT).encode()[:-40]
+    with pytest.raises(ValueError):
+        list(streaming.iter_items(io.BytesIO(body), PREFIX, {}))
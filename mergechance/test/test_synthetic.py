@@ -0,0 +1,20 @@
+from mergechance.analysis import SYNC_FIELDS, get_implied_insiders, filter_prs
+from mergechance.synthetic import generate_prs
+
+
+def test_seeded():
+    assert generate_prs(50, seed=1, now=1_600_000_000) == generate_prs(50, seed=1, now=1_600_000_000)
+    assert generate_prs(50, seed=1, now=1_600_000_000) != generate_prs(50, seed=2, now=1_600_000_000)
+
+
+def test_shape():
+    prs = generate_prs(2000, now=1_600_000_000)
+    assert len(prs) == 2000
+    for pr in prs:
+        for field in SYNC_FIELDS:
+            assert field in pr
+        assert (pr["closedAt"] is None) == (pr["state"] == "OPEN")
+    assert [pr["createdAt"] for pr in prs] == sorted(pr["createdAt"] for pr in prs)
+    # repeat authors, spam-like titles and self-closed PRs are all present
+    assert get_implied_insiders(prs)
+    assert 0 < len(filter_prs(prs)) < len(prs)
@@ -0,0 +1,60 @@
+from mergechance.tokens import TokenPool, NoTokenError
+
+import time
+
+import pytest
+
+
+def _rate_limit(remaining, reset_in=3600):
+    reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + reset_in))
+    return {"cost": 1, "remaining": remaining, "resetAt": reset}
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("GH_TOKENS", "aaaa, bbbb,")
+    assert [t.value for t in TokenPool.from_env().tokens] == ["aaaa", "bbbb"]
+    monkeypatch.delenv("GH_TOKENS")
+    monkeypatch.setenv("GH_TOKEN", "cccc")
+    assert [t.value for t in TokenPool.from_env().tokens] == ["cccc"]
+
+
+def test_most_headroom_first():
+    pool = TokenPool(["aaaa", "bbbb"])
+    pool.tokens[0].scheduler.record("q", _rate_limit(100))
+    pool.tokens[1].scheduler.record("q", _rate_limit(4000))
+    assert pool.acquire("q").value == "bbbb"
+
+
+def test_round_robin():
+    pool = TokenPool(["aaaa", "bbbb"], round_robin=True)
+    picked = [pool.acquire("q").value for _ in range(4)]
+    assert sorted(picked) == ["aaaa", "aaaa", "bbbb", "bbbb"]
+
+
+def test_exhausted_token_skipped_until_reset():
+    pool = TokenPool(["aaaa", "bbbb"])
+    pool.tokens[0].scheduler.exhausted(reset_at=time.time() + 0.2)
+    pool.tokens[1].scheduler.record("q", _rate_limit(10))
+    assert pool.acquire("q").value == "bbbb"
+    time.sleep(0.3)
+    assert pool.acquire("q").value == "aaaa"
+
+
+def test_revoked():
+    pool = TokenPool(["aaaa", "bbbb"])
+    pool.revoke(pool.tokens[1])
+    assert {pool.acquire("q").value for _ in range(3)} == {"aaaa"}
+    pool.revoke(pool.tokens[0])
+    with pytest.raises(NoTokenError):
+        pool.acquire("q")
+
+
+def test_stats():
+    pool = TokenPool(["secret-aaaa", "secret-bbbb"])
+    pool.tokens[0].scheduler.record("q", _rate_limit(2500))
+    pool.acquire("q")
+    stats = pool.stats()
+    assert stats["active"] == 2
+    assert [t["token"] for t in stats["tokens"]] == ["...aaaa", "...bbbb"]
+    assert sum(t["requests"] for t in stats["tokens"]) == 1
+    assert stats["tokens"][0]["utilization"] == 0.5
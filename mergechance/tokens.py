@@ -0,0 +1,115 @@
+"""Pool of GitHub tokens, each with its own rate limit budget.
+
+Tokens come from GH_TOKENS (comma separated) or GH_TOKEN. Requests go out
+with the token which has the most budget left. Tokens GitHub rejects
+(401) are taken out of rotation for REVOKED_RETRY seconds, exhausted
+tokens come back once their budget resets.
+"""
+import logging
+import os
+import threading
+import time
+
+from mergechance.ratelimit import RateLimitScheduler, INTERACTIVE, WINDOW
+
+log = logging.getLogger(__name__)
+
+REVOKED_RETRY = WINDOW  # seconds before a token rejected with 401 is tried again
+
+
+class NoTokenError(Exception):
+    """Every token of the pool has been rejected by GitHub."""
+
+
+class Token:
+    def __init__(self, value: str, scheduler=None):
+        self.value = value
+        self.scheduler = scheduler or RateLimitScheduler()
+        self.revoked_until = None
+        self.requests = 0
+
+    @property
+    def name(self) -> str:
+        """Safe to log, only the last 4 characters."""
+        return f"...{self.value[-4:]}" if self.value else "anonymous"
+
+    def usable(self, now) -> bool:
+        return self.revoked_until is None or now >= self.revoked_until
+
+    def headroom(self) -> float:
+        """Points left in the current window, 0 while exhausted."""
+        if self.scheduler.reset_at is not None and time.time() >= self.scheduler.reset_at:
+            return self.scheduler.budget
+        return self.scheduler.remaining
+
+
+class TokenPool:
+    """Picks a token per request and tracks how each is doing."""
+
+    def __init__(self, tokens: list, round_robin=False):
+        self.tokens = [t if isinstance(t, Token) else Token(t) for t in tokens]
+        self.round_robin = round_robin
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **kwargs):
+        values = os.getenv("GH_TOKENS") or os.getenv("GH_TOKEN") or ""
+        return cls([v.strip() for v in values.split(",") if v.strip()], **kwargs)
+
+    def acquire(self, shape, priority=INTERACTIVE) -> Token:
+        """Pick a token and block until its scheduler lets the query through."""
+        token = self._pick()
+        token.scheduler.acquire(shape, priority)
+        with self._lock:
+            token.requests += 1
+        return token
+
+    def revoke(self, token: Token):
+        with self._lock:
+            token.revoked_until = time.time() + REVOKED_RETRY
+        log.critical(f"GitHub rejected token {token.name}, out of rotation for {REVOKED_RETRY}s")
+
+    def stats(self) -> dict:
+        now = time.time()
+        with self._lock:
+            tokens = []
+            for token in self.tokens:
+                headroom = token.headroom()
+                if not token.usable(now):
+                    state = "revoked"
+                elif headroom <= 0:
+                    state = "exhausted"
+                else:
+                    state = "active"
+                tokens.append({
+                    "token": token.name,
+                    "state": state,
+                    "requests": token.requests,
+                    "remaining": headroom,
+                    "utilization": round(1 - headroom / token.scheduler.budget, 3),
+                    "reset_at": token.scheduler.reset_at,
+                })
+        return {
+            "tokens": tokens,
+            "active": sum(1 for t in tokens if t["state"] == "active"),
+            "utilization": round(sum(t["utilization"] for t in tokens) / len(tokens), 3) if tokens else 0,
+        }
+
+    def _pick(self) -> Token:
+        now = time.time()
+        with self._lock:
+            usable = [t for t in self.tokens if t.usable(now)]
+            if not usable:
+                raise NoTokenError("No usable GitHub token")
+            available = [t for t in usable if t.headroom() > 0]
+            if not available:
+                # all exhausted, queue on the one which resets first
+                return min(usable, key=lambda t: t.scheduler.reset_at or now)
+            if self.round_robin:
+                self._next = (self._next + 1) % len(available)
+                return available[self._next]
+            return max(available, key=Token.headroom)
+
+
+pool = TokenPool.from_env()
@@ -1,18 +1,33 @@
-import requests as rq
+import calendar
+import json
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dateutil import parser
 
+# reuse the web app's GraphQL client when run from a checkout of this repo
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from mergechance.analysis import duration_percentiles, duration_sketches  # noqa: E402
+from mergechance.gh_gql import GQLClient, PR_EDGES  # noqa: E402
+from mergechance.ratelimit import BACKGROUND, RATE_LIMIT_FIELDS  # noqa: E402
+from mergechance.tokens import TokenPool  # noqa: E402
 
-TOKEN = os.getenv("GH_TOKEN")
+
+# GH_TOKENS (comma separated) spreads a long backfill over several tokens
+token_pool = TokenPool.from_env()
 STEP_SIZE = 100
-GH_GQL_URL = "https://api.github.com/graphql"
+client = GQLClient(token_pool=token_pool)
+SEARCH_CAP = 1000  # GitHub's search returns at most this many results per query
+WORKERS = 4  # shards fetched at a time with --backfill
+SHARD_SPAN = 365 * 24 * 60 * 60  # initial shard length, split further where needed
+HEADER = ["state", "created_at", "extracted_at", "author"]
 
 
 def main():
-    if not TOKEN:
-        print("You need to set GH_TOKEN env var")
+    if not token_pool.tokens:
+        print("You need to set GH_TOKEN (or GH_TOKENS) env var")
         sys.exit(1)
     if len(sys.argv) < 2:
         print(
@@ -20,25 +35,48 @@ def main():
         )
         sys.exit(1)
     owner, repo = sys.argv[1].split('/')
-    first_resp = first_query(owner, repo)
-    total = first_resp["data"]["repository"]["pullRequests"]["totalCount"]
-    has_next = first_resp["data"]["repository"]["pullRequests"]["pageInfo"][
-        "hasNextPage"
-    ]
-    cursor = first_resp["data"]["repository"]["pullRequests"]["edges"][-1]["cursor"]
-    print(f"Total PRs to process {total}.")
-    rows = [["state", "created_at", "extracted_at", "author"]]
-    to_csv(first_resp, rows)
-    while has_next:
-        progress = round(len(rows) / total * 100, 2)
-        print(f"Processed {progress}% of the total ...")
-        result = paginated_query(owner, repo, cursor)
-        has_next = result["data"]["repository"]["pullRequests"]["pageInfo"][
-            "hasNextPage"
-        ]
-        to_csv(result, rows)
-        cursor = result["data"]["repository"]["pullRequests"]["edges"][-1]["cursor"]
+    if "--backfill" in sys.argv[2:]:
+        backfill(owner, repo)
+        return
+    csv_name = f"{owner}_{repo}.csv"
+    print(f"Will save results to {csv_name}")
+    extracted_at = datetime.now().timestamp()
+    fetched = 0
+    cursor = None
+    has_next = True
+    sketches = duration_sketches([])
+    with open(csv_name, "w") as outfile:
+        outfile.write(",".join(HEADER) + "\n")
+        while has_next:
+            # PRs go to the file as the response is parsed, see mergechance/streaming.py
+            nodes = client.stream(page_query(owner, repo, cursor), PR_EDGES, priority=BACKGROUND)
+            page = []
+            for edge in nodes:
+                outfile.write(",".join(to_row(edge["node"], extracted_at)) + "\n")
+                page.append(edge["node"])
+                cursor = edge["cursor"]
+                fetched += 1
+            # a page at a time, memory stays bounded by the sketches
+            sketches = duration_sketches(page, sketches)
+            pull_requests = nodes.rest["data"]["repository"]["pullRequests"]
+            has_next = pull_requests["pageInfo"]["hasNextPage"]
+            progress = round(fetched / max(pull_requests["totalCount"], 1) * 100, 2)
+            print(f"Processed {progress}% of the total ...")
     print("Done fetching")
+    print(f"Token pool: {token_pool.stats()}")
+    print_percentiles(sketches)
+
+
+def print_percentiles(sketches):
+    """Time to merge and to close percentiles of duration sketches."""
+    for kind, label in [("merge", "Time to merge"), ("close", "Time to close")]:
+        percentiles = duration_percentiles(sketches[kind])
+        if percentiles:
+            print(f"{label} in days: " + ", ".join(f"{p} {days}" for p, days in percentiles.items()))
+
+
+def save_csv(owner, repo, rows):
+    """Write rows, the first of which is HEADER, to OWNER_REPO.csv."""
     csv_name = f"{owner}_{repo}.csv"
     print(f"Will save results to {csv_name}")
     with open(csv_name, "w") as outfile:
@@ -47,12 +85,104 @@ def main():
         outfile.write(text + "\n")
 
 
-def first_query(owner, repo):
-    data = {
-        "query": """
-  query {
-    repository(owner:"%s", name:"%s") {
-      pullRequests(first: %s) {
+def backfill(owner, repo):
+    """Fetch the full history split into created: date shards of the search API.
+
+    Shards are fetched concurrently and each is saved to OWNER_REPO_shards/
+    once complete, a rerun after a failure only fetches the missing ones.
+    """
+    checkpoint_dir = f"{owner}_{repo}_shards"
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    plan_path = os.path.join(checkpoint_dir, "plan.json")
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        if os.path.exists(plan_path):
+            with open(plan_path) as plan_file:
+                shards = [tuple(shard) for shard in json.load(plan_file)]
+        else:
+            created = repo_created_at(owner, repo)
+            shards = plan_shards(owner, repo, created, int(time.time()), executor)
+            with open(plan_path, "w") as plan_file:
+                json.dump(shards, plan_file)
+        paths = [os.path.join(checkpoint_dir, f"{start}_{end}.json") for start, end in shards]
+        missing = [(shard, path) for shard, path in zip(shards, paths) if not os.path.exists(path)]
+        print(f"{len(shards)} shards, {len(shards) - len(missing)} already fetched.")
+        done = 0
+        for _ in executor.map(lambda job: fetch_shard(owner, repo, *job), missing):
+            done += 1
+            print(f"Fetched {done}/{len(missing)} shards ...")
+    print("Done fetching")
+    print(f"Token pool: {token_pool.stats()}")
+    nodes, sketches = merge_shards(paths)
+    extracted_at = datetime.now().timestamp()
+    rows = [HEADER]
+    rows.extend(to_row(node, extracted_at) for node in nodes)
+    save_csv(owner, repo, rows)
+    print_percentiles(sketches)
+
+
+def plan_shards(owner, repo, start, end, executor):
+    """Split start..end (epoch seconds, inclusive) into shards which the
+    search API can return completely, halving those over SEARCH_CAP."""
+    pending = [(s, min(s + SHARD_SPAN - 1, end)) for s in range(start, end + 1, SHARD_SPAN)]
+    shards = []
+    while pending:
+        counts = executor.map(lambda shard: shard_count(owner, repo, shard), pending)
+        split = []
+        for (first, last), count in zip(pending, counts):
+            if count > SEARCH_CAP and last > first:
+                mid = (first + last) // 2
+                split.extend([(first, mid), (mid + 1, last)])
+            elif count:
+                if count > SEARCH_CAP:
+                    print(f"More than {SEARCH_CAP} PRs created at {iso(first)}, some will be missing.")
+                shards.append((first, last))
+        pending = split
+        print(f"Planned {len(shards)} shards, {len(pending)} to split further ...")
+    return sorted(shards)
+
+
+def shard_count(owner, repo, shard):
+    return search_query(owner, repo, shard, None, page_size=1)["data"]["search"]["issueCount"]
+
+
+def fetch_shard(owner, repo, shard, path):
+    nodes = []
+    cursor = None
+    while True:
+        search = search_query(owner, repo, shard, cursor)["data"]["search"]
+        nodes.extend(search["nodes"])
+        if not search["pageInfo"]["hasNextPage"]:
+            break
+        cursor = search["pageInfo"]["endCursor"]
+    # write then rename, so an interrupted run never leaves a partial checkpoint
+    with open(path + ".tmp", "w") as shard_file:
+        json.dump(nodes, shard_file)
+    os.replace(path + ".tmp", path)
+
+
+def merge_shards(paths):
+    """PR nodes of all shards, oldest first, each PR once even where shards
+    overlap, and duration sketches of them updated shard by shard."""
+    by_number = {}
+    sketches = duration_sketches([])
+    for path in paths:
+        with open(path) as shard_file:
+            shard = [node for node in json.load(shard_file) if node["number"] not in by_number]
+        by_number.update((node["number"], node) for node in shard)
+        # shards fetched before closedAt was queried have no durations
+        sketches = duration_sketches([node for node in shard if "closedAt" in node], sketches)
+    return sorted(by_number.values(), key=lambda node: node["createdAt"]), sketches
+
+
+def iso(ts):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
+
+
+PAGE_QUERY = """
+  query($owner: String!, $name: String!, $cursor: String, $pageSize: Int!) {
+    %s
+    repository(owner: $owner, name: $name) {
+      pullRequests(first: $pageSize, after: $cursor) {
         totalCount
         pageInfo {
           hasNextPage
@@ -62,61 +192,74 @@ def first_query(owner, repo):
           node {
             state
             createdAt
+            closedAt
             authorAssociation
           }
         }
       }
     }
   }
-  """
-        % (owner, repo, STEP_SIZE)
-    }
-    return gql_request(data)
+  """ % RATE_LIMIT_FIELDS
 
 
-def paginated_query(owner, repo, cursor):
-    data = {
-        "query": """
-  query {
-    repository(owner:"%s", name:"%s") {
-      pullRequests(first: %s, after: "%s") {
-        totalCount
-        pageInfo {
-          hasNextPage
-        }
-        edges {
-          cursor
-          node {
-            state
-            createdAt
-            authorAssociation
-          }
+def page_query(owner, repo, cursor):
+    variables = {"owner": owner, "name": repo, "cursor": cursor, "pageSize": STEP_SIZE}
+    return {"query": PAGE_QUERY, "variables": variables}
+
+
+SEARCH_QUERY = """
+  query($search: String!, $cursor: String, $pageSize: Int!) {
+    %s
+    search(query: $search, type: ISSUE, first: $pageSize, after: $cursor) {
+      issueCount
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        ... on PullRequest {
+          number
+          state
+          createdAt
+          closedAt
+          authorAssociation
         }
       }
     }
   }
-  """
-        % (owner, repo, STEP_SIZE, cursor)
+  """ % RATE_LIMIT_FIELDS
+
+REPO_QUERY = """
+  query($owner: String!, $name: String!) {
+    %s
+    repository(owner: $owner, name: $name) {
+      createdAt
     }
-    return gql_request(data)
+  }
+  """ % RATE_LIMIT_FIELDS
+
+
+def repo_created_at(owner, repo):
+    result = gql_request({"query": REPO_QUERY, "variables": {"owner": owner, "name": repo}})
+    return calendar.timegm(time.strptime(result["data"]["repository"]["createdAt"], "%Y-%m-%dT%H:%M:%SZ"))
+
+
+def search_query(owner, repo, shard, cursor, page_size=STEP_SIZE):
+    first, last = shard
+    search = f"repo:{owner}/{repo} is:pr created:{iso(first)}..{iso(last)}"
+    variables = {"search": search, "cursor": cursor, "pageSize": page_size}
+    return gql_request({"query": SEARCH_QUERY, "variables": variables})
 
 
 def gql_request(data):
-    headers = {"Authorization": f"bearer {TOKEN}"}
-    res = rq.post(GH_GQL_URL, headers=headers, json=data)
-    return res.json()
+    # a bulk download, sleep through rate limit resets instead of failing
+    return client.request(data, priority=BACKGROUND)
 
 
-def to_csv(gql_result, rows: list):
-    extracted_at = datetime.now().timestamp()
-    for edge in gql_result["data"]["repository"]["pullRequests"]["edges"]:
-        node = edge["node"]
-        created_at = node["createdAt"]
-        # parse to ts
-        created_at = parser.parse(created_at).timestamp()
-        author = node["authorAssociation"]
-        row = [node["state"], str(created_at), str(extracted_at), author]
-        rows.append(row)
+def to_row(node, extracted_at):
+    # parse to ts
+    created_at = parser.parse(node["createdAt"]).timestamp()
+    return [node["state"], str(created_at), str(extracted_at), node["authorAssociation"]]
 
 
 if __name__ == "__main__":